@@ -5,13 +5,20 @@ A modular Python tool that checks for username availability
 across multiple social media and web platforms.
 """
 from navarro.core import (
+    AsyncRateLimiter,
+    AsyncSessionManager,
+    ByteProfiles,
+    CheckContext,
     CheckResult,
     PlatformChecker,
     RateLimiter,
+    RequestHistory,
     SessionManager,
+    SharedRateLimiter,
     validate_username,
 )
 from navarro.platforms import (
+    build_checkers,
     get_platform_checker,
     get_all_checkers,
     list_platforms,
@@ -21,12 +28,19 @@ from navarro.platforms import (
 __version__ = "2.0.1"
 __all__ = [
     # Core
+    'AsyncRateLimiter',
+    'AsyncSessionManager',
+    'ByteProfiles',
+    'CheckContext',
     'CheckResult',
     'PlatformChecker',
     'RateLimiter',
+    'RequestHistory',
     'SessionManager',
+    'SharedRateLimiter',
     'validate_username',
     # Platforms
+    'build_checkers',
     'get_platform_checker',
     'get_all_checkers',
     'list_platforms',
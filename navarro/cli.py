@@ -10,21 +10,36 @@ Usage:
 import argparse
 import json
 import sys
-import time
-import random
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Union
 
 from navarro import (
     __version__,
+    AsyncRateLimiter,
+    AsyncSessionManager,
     CheckResult,
     RateLimiter,
+    RequestHistory,
     SessionManager,
+    SharedRateLimiter,
     validate_username,
-    get_all_checkers,
+    build_checkers,
     list_platforms,
     PLATFORM_REGISTRY,
 )
+from navarro.core.profiles import save_profiles
+from navarro.engine import (
+    AIMDController,
+    AsyncEngine,
+    Coordinator,
+    CostYieldOrdering,
+    ShardedRunner,
+    StopCondition,
+    TaskQueue,
+    ThreadPoolEngine,
+    Worker,
+    build_batch_scheduler,
+)
 
 try:
     from rich.console import Console
@@ -44,6 +59,8 @@ def display_results(username: str, results: dict, quiet: bool = False) -> dict:
         CheckResult.RATE_LIMITED: 0,
         CheckResult.TIMEOUT: 0,
         CheckResult.UNKNOWN_ERROR: 0,
+        CheckResult.DEADLINE_EXCEEDED: 0,
+        CheckResult.SKIPPED: 0,
     }
     
     found_profiles = {}
@@ -73,6 +90,8 @@ def display_results(username: str, results: dict, quiet: bool = False) -> dict:
                     CheckResult.RATE_LIMITED: ("🚫 Rate Limited", "red"),
                     CheckResult.TIMEOUT: ("⏱️ Timeout", "yellow"),
                     CheckResult.UNKNOWN_ERROR: ("❓ Unknown", "dim"),
+                    CheckResult.DEADLINE_EXCEEDED: ("⌛ Deadline Exceeded", "yellow"),
+                    CheckResult.SKIPPED: ("⏭️ Skipped", "dim"),
                 }
                 status, style = status_map.get(result, ("?", "dim"))
                 if not quiet:
@@ -103,53 +122,155 @@ def display_results(username: str, results: dict, quiet: bool = False) -> dict:
     }
 
 
+def build_rate_limiter(shared_limits: bool = False) -> RateLimiter:
+    """Rate limiter seeded from, and logging to, the request history."""
+    if shared_limits:
+        return SharedRateLimiter(history=RequestHistory())
+    return RateLimiter(history=RequestHistory())
+
+
+def build_engine(
+    platforms: Optional[list] = None,
+    timeout: int = 8,
+    workers: Optional[int] = None,
+    hedge: bool = False,
+    deadline: Optional[float] = None,
+    stop: Optional[StopCondition] = None,
+    shared_limits: bool = False,
+) -> Union[AsyncEngine, ThreadPoolEngine]:
+    """
+    Build the engine for per-username checks.
+    
+    The asyncio engine by default, or a thread pool of `workers` threads
+    when set. With shared_limits, rate limits are shared with other
+    navarro processes on this host.
+    """
+    rate_limiter = build_rate_limiter(shared_limits)
+    session_manager = SessionManager(pool_size=workers) if workers else SessionManager()
+    checkers = build_checkers(rate_limiter, session_manager, platforms, timeout, hedge)
+    
+    if workers:
+        return ThreadPoolEngine(
+            checkers,
+            rate_limiter,
+            session_manager,
+            workers=workers,
+            deadline=deadline,
+            ordering=CostYieldOrdering(),
+            stop=stop,
+        )
+    return AsyncEngine(
+        checkers,
+        AsyncRateLimiter(rate_limiter),
+        AsyncSessionManager(session_manager, max_workers=max(1, len(checkers))),
+        deadline=deadline,
+        ordering=CostYieldOrdering(),
+        stop=stop,
+    )
+
+
 def check_username(
     username: str,
     platforms: Optional[list] = None,
     timeout: int = 8,
     quiet: bool = False,
+    workers: Optional[int] = None,
+    hedge: bool = False,
+    deadline: Optional[float] = None,
+    stop: Optional[StopCondition] = None,
+    shared_limits: bool = False,
+    engine: Optional[Union[AsyncEngine, ThreadPoolEngine]] = None,
 ) -> dict:
-    """Check a username across platforms."""
-    rate_limiter = RateLimiter()
-    session_manager = SessionManager()
-    
-    checkers = get_all_checkers(rate_limiter, session_manager)
+    """
+    Check a username across platforms.
     
-    # Filter platforms if specified
-    if platforms:
-        platforms_lower = [p.lower() for p in platforms]
-        checkers = {k: v for k, v in checkers.items() if k.lower() in platforms_lower}
+    Builds an engine with build_engine() and closes it afterwards.
+    Given an `engine`, runs on it instead and leaves it open, so checks
+    of several usernames share its rate limiter and request spacing;
+    the other options are then ignored.
+    """
+    owned = engine is None
+    if owned:
+        engine = build_engine(platforms, timeout, workers, hedge, deadline, stop, shared_limits)
+    checkers = engine.checkers
     
-    results = {}
-    
-    if RICH_AVAILABLE and not quiet:
-        console = Console()
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(f"Checking {len(checkers)} platforms...", total=len(checkers))
+    try:
+        if RICH_AVAILABLE and not quiet:
+            console = Console()
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                task = progress.add_task(f"Checking {len(checkers)} platforms...", total=len(checkers))
+                
+                def on_result(platform, result):
+                    progress.update(task, description=f"Checked {platform}...")
+                    progress.advance(task)
+                
+                results = engine.run(username, on_result=on_result)
+        else:
+            def on_result(platform, result):
+                if not quiet:
+                    print(f"Checked {platform}...", end="\r")
             
-            for platform, checker in checkers.items():
-                progress.update(task, description=f"Checking {platform}...")
-                try:
-                    results[platform] = checker.check(username)
-                except Exception:
-                    results[platform] = CheckResult.UNKNOWN_ERROR
-                progress.advance(task)
-    else:
-        for platform, checker in checkers.items():
-            if not quiet:
-                print(f"Checking {platform}...", end="\r")
-            try:
-                results[platform] = checker.check(username)
-            except Exception:
-                results[platform] = CheckResult.UNKNOWN_ERROR
+            results = engine.run(username, on_result=on_result)
+    finally:
+        if owned:
+            engine.close()
     
     return results
 
 
+def check_usernames(
+    usernames: List[str],
+    platforms: Optional[list] = None,
+    timeout: int = 8,
+    on_complete: Optional[Callable[[str, dict], None]] = None,
+    hedge: bool = False,
+    deadline: Optional[float] = None,
+    stop: Optional[StopCondition] = None,
+    shared_limits: bool = False,
+    controller: Optional[AIMDController] = None,
+) -> Dict[str, dict]:
+    """
+    Check many usernames with the platform-major batch scheduler.
+    
+    Work is interleaved across usernames and platforms, so each platform
+    runs at its own rate-limit pace. on_complete is called for every
+    username, in input order, as soon as all its platforms are done.
+    With a controller, each platform's concurrency adapts to what it
+    tolerates.
+    """
+    scheduler = build_batch_scheduler(
+        build_rate_limiter(shared_limits),
+        platforms,
+        timeout,
+        hedge,
+        deadline=deadline,
+        ordering=CostYieldOrdering(),
+        stop=stop,
+        controller=controller,
+    )
+    try:
+        return scheduler.run_many(usernames, on_complete=on_complete)
+    finally:
+        scheduler.close()
+
+
+def byte_budget_report(platforms: Optional[list] = None) -> Dict[str, dict]:
+    """Learned byte budget of every checker, None meaning a full read."""
+    checkers = build_checkers(RateLimiter(), SessionManager(), platforms)
+    report = {}
+    for checker in checkers.values():
+        report[checker.platform_name] = {
+            "markers": len(checker.body_markers()),
+            "samples": checker.byte_profiles.samples(checker.platform_key),
+            "budget": checker.byte_budget(),
+        }
+    return report
+
+
 def export_json(data: dict, filepath: str) -> None:
     """Export results to JSON file."""
     with open(filepath, 'w') as f:
@@ -186,6 +307,15 @@ Examples:
   navarro -l users.txt                     Check list from file
   navarro johndoe --platforms github,reddit Filter platforms
   navarro johndoe -q -e results.json       Quiet mode + JSON export
+  navarro johndoe --workers 8              Thread-pool mode with 8 workers
+  navarro johndoe --stop-after 1           Stop at the first platform found
+  navarro -l users.txt --adaptive          Adapt concurrency per platform
+  navarro -l users.txt --processes 4       Shard a large list over 4 processes
+  navarro johndoe --shared-limits          Share rate limits with other runs
+  navarro -l users.txt --queue jobs.db     Queue checks for distributed workers
+  navarro --worker --queue jobs.db         Run a worker against that queue
+  navarro johndoe --rules my_sites.json    Add platforms from a rule file
+  navarro --byte-budgets                   Show learned per-platform read budgets
   navarro --list-platforms                 Show available platforms
         """
     )
@@ -223,6 +353,66 @@ Examples:
         default=8,
         help="Request timeout in seconds (default: 8)"
     )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        help="Use a thread pool with N workers instead of the asyncio engine"
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        help="Time budget per username in seconds (per platform check in list runs); "
+             "unfinished platforms are reported as deadline exceeded"
+    )
+    parser.add_argument(
+        "--stop-after",
+        type=int,
+        help="Stop checking a username after N platforms report found"
+    )
+    parser.add_argument(
+        "--until-found",
+        help="Stop once any of these comma-separated platforms reports found"
+    )
+    parser.add_argument(
+        "--shared-limits",
+        action="store_true",
+        help="Share rate limits with other navarro processes on this host"
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adapt per-platform concurrency to what each site tolerates (--list runs)"
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Probe all URLs of multi-URL platforms at once, first hit wins"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help="Shard a --list run across N worker processes"
+    )
+    parser.add_argument(
+        "--queue",
+        help="SQLite task queue: distribute checks to --worker processes "
+             "(other hosts need a shared filesystem with reliable locking, often not NFS)"
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Run as a worker for --queue until it is drained"
+    )
+    parser.add_argument(
+        "--rules",
+        action="append",
+        help="JSON rule file or directory of extra platforms (repeatable)"
+    )
+    parser.add_argument(
+        "--byte-budgets",
+        action="store_true",
+        help="Show how many body bytes each platform is read up to, and exit"
+    )
     parser.add_argument(
         "--list-platforms",
         action="store_true",
@@ -236,6 +426,13 @@ Examples:
     
     args = parser.parse_args()
     
+    for path in args.rules or ():
+        try:
+            PLATFORM_REGISTRY.add_rules(path)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: cannot load rules from {path}: {e}")
+            sys.exit(1)
+    
     # Handle --list-platforms
     if args.list_platforms:
         platforms = list_platforms()
@@ -245,7 +442,10 @@ Examples:
         sys.exit(0)
     
     # Validate input
-    if not args.username and not args.list_file:
+    if args.worker and not args.queue:
+        print("❌ Error: --worker requires --queue")
+        sys.exit(1)
+    if not args.username and not args.list_file and not args.worker and not args.byte_budgets:
         parser.print_help()
         sys.exit(1)
     
@@ -260,9 +460,52 @@ Examples:
             print(f"   Use --list-platforms to see available options")
             sys.exit(1)
     
+    # Handle --byte-budgets
+    if args.byte_budgets:
+        report = byte_budget_report(platforms_filter)
+        print(f"📏 Byte budgets ({len(report)} platforms):")
+        for name, entry in sorted(report.items()):
+            if entry["budget"] is not None:
+                budget = f"{entry['budget']} bytes"
+            elif not entry["markers"]:
+                budget = "full read (no markers)"
+            else:
+                budget = "full read"
+            print(f"  • {name}: {budget}, {entry['samples']} samples")
+        sys.exit(0)
+    
+    until_found = None
+    if args.until_found:
+        until_found = [p.strip() for p in args.until_found.split(',')]
+        available = [p.lower() for p in list_platforms()]
+        invalid = [p for p in until_found if p.lower() not in available]
+        if invalid:
+            print(f"⚠️ Unknown platforms: {', '.join(invalid)}")
+            print(f"   Use --list-platforms to see available options")
+            sys.exit(1)
+    stop = StopCondition(stop_after=args.stop_after, until_found=until_found)
+    
     if not args.quiet:
         print(f"\n🔍 Navarro v{__version__} - OSINT Username Checker")
     
+    if args.worker:
+        rate_limiter = build_rate_limiter(args.shared_limits)
+        session_manager = SessionManager(pool_size=args.workers or 4)
+        worker = Worker(
+            TaskQueue(args.queue),
+            checkers=build_checkers(
+                rate_limiter, session_manager, platforms_filter, args.timeout, args.hedge
+            ),
+            threads=args.workers or 4,
+        )
+        if not args.quiet:
+            print(f"👷 Worker {worker.worker_id} serving {args.queue}")
+        completed = worker.run()
+        save_profiles(worker.checkers.values())
+        if not args.quiet:
+            print(f"✅ Completed {completed} tasks")
+        sys.exit(0)
+    
     all_results = {}
     
     # Get list of usernames to check
@@ -286,23 +529,10 @@ Examples:
             print(f"❌ Invalid username '{username}': {error}")
             sys.exit(1)
     
-    # Check each username
-    for idx, username in enumerate(usernames):
+    def record(username: str, results: dict) -> None:
         if len(usernames) > 1 and not args.quiet:
             print(f"\n{'='*50}")
-            print(f"Checking username: {username}")
-            # Add delay between usernames
-            if idx > 0:
-                delay = random.uniform(2, 5)
-                print(f"⏳ Waiting {delay:.1f}s before next username...")
-                time.sleep(delay)
-        
-        results = check_username(
-            username,
-            platforms=platforms_filter,
-            timeout=args.timeout,
-            quiet=args.quiet,
-        )
+            print(f"Checked username: {username}")
         
         display_data = display_results(username, results, quiet=args.quiet)
         
@@ -312,6 +542,64 @@ Examples:
             "found_profiles": display_data["found_profiles"],
         }
     
+    if args.queue:
+        # Workers (on other hosts only over a filesystem that locks reliably) pick the tasks up
+        coordinator = Coordinator(TaskQueue(args.queue))
+        added = coordinator.submit(usernames, platforms_filter)
+        if not args.quiet:
+            print(f"📤 Queued {added} tasks in {args.queue}, waiting for workers...")
+        coordinator.wait(on_complete=record)
+    elif len(usernames) > 1 and args.processes:
+        # Very large lists: shard across processes, merged in input order
+        runner = ShardedRunner(
+            platforms=platforms_filter,
+            timeout=args.timeout,
+            processes=args.processes,
+            hedge=args.hedge,
+            deadline=args.deadline,
+            stop=stop,
+            shared_limits=args.shared_limits,
+            adaptive=args.adaptive,
+        )
+        runner.run(usernames, on_complete=record)
+    elif len(usernames) > 1 and not args.workers:
+        # Interleave usernames and platforms, no blanket delay needed
+        controller = AIMDController() if args.adaptive else None
+        check_usernames(
+            usernames,
+            platforms=platforms_filter,
+            timeout=args.timeout,
+            on_complete=record,
+            hedge=args.hedge,
+            deadline=args.deadline,
+            stop=stop,
+            shared_limits=args.shared_limits,
+            controller=controller,
+        )
+        if controller is not None and not args.quiet:
+            windows = ", ".join(
+                f"{platform}={window}" for platform, window in sorted(controller.windows().items())
+            )
+            print(f"📶 Concurrency windows: {windows}")
+    else:
+        # One engine for the whole list, so its rate limiter keeps spacing
+        # each platform's requests from one username to the next
+        engine = build_engine(
+            platforms=platforms_filter,
+            timeout=args.timeout,
+            workers=args.workers,
+            hedge=args.hedge,
+            deadline=args.deadline,
+            stop=stop,
+            shared_limits=args.shared_limits,
+        )
+        try:
+            for username in usernames:
+                results = check_username(username, quiet=args.quiet, engine=engine)
+                record(username, results)
+        finally:
+            engine.close()
+    
     # Export if requested
     if args.export:
         export_json(all_results, args.export)
@@ -1,13 +1,23 @@
 """Core components for Navarro."""
 from .enums import CheckResult
+from .context import CheckContext
 from .base import PlatformChecker, validate_username
-from .rate_limiter import RateLimiter
-from .session_manager import SessionManager
+from .history import RequestHistory
+from .profiles import ByteProfiles
+from .rate_limiter import AsyncRateLimiter, RateLimiter
+from .shared_limiter import SharedRateLimiter
+from .session_manager import AsyncSessionManager, SessionManager
 
 __all__ = [
+    'AsyncRateLimiter',
+    'AsyncSessionManager',
+    'ByteProfiles',
+    'CheckContext',
     'CheckResult',
     'PlatformChecker',
     'RateLimiter',
+    'RequestHistory',
     'SessionManager',
+    'SharedRateLimiter',
     'validate_username',
 ]
@@ -1,16 +1,47 @@
 """Base class for platform checkers."""
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
 import re
+import threading
 import time
 import requests
 
+from .context import CheckContext
 from .enums import CheckResult
+from .hedging import run_hedged
+from .rate_limiter import parse_rate_limit_headers
+from .markers import Hit, MarkerSet
+from .streaming import BodyReader
 
 
 # Username validation pattern (most platforms)
 USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_.\-]{1,64}$')
 
+# Budgets shared by platforms behind one backend: name -> (rate, burst)
+RATE_GROUPS = {
+    "meta": (1.0, 2),  # Instagram, Threads, Facebook
+}
+
+# Marker labels and the class attributes listing their markers
+MARKER_GROUPS = {
+    "found": ("FOUND_MARKERS", "FOUND_PATTERNS", "PROFILE_MARKERS", "JSON_FOUND_PATTERNS"),
+    "not_found": ("NOT_FOUND_MARKERS", "JSON_NOT_FOUND_PATTERNS"),
+    "early_exit": ("EARLY_EXIT_MARKERS",),
+    "rate_limit": ("RATE_LIMIT_PATTERNS",),
+}
+
+# Labels of markers matched in response bodies
+BODY_LABELS = ("found", "not_found", "early_exit")
+
+# Labels whose markers settle a check on their own. A capped read is
+# only trusted when one of them is inside it, since "no not-found
+# marker yet" says nothing about the rest of the body.
+DECISIVE_LABELS = ("not_found", "early_exit")
+
+# One compiled MarkerSet per checker class
+_marker_sets: Dict[type, MarkerSet] = {}
+
 
 def validate_username(username: str) -> Tuple[bool, str]:
     """
@@ -26,6 +57,14 @@ def validate_username(username: str) -> Tuple[bool, str]:
     return True, ""
 
 
+def _redirect_target(url: str, response: requests.Response) -> Optional[str]:
+    """Absolute URL a redirect response points to, or None."""
+    location = response.headers.get("Location")
+    if location and 300 <= response.status_code < 400:
+        return urljoin(url, location)
+    return None
+
+
 class PlatformChecker(ABC):
     """
     Abstract base class for platform username checkers.
@@ -34,14 +73,90 @@ class PlatformChecker(ABC):
     - platform_name: Display name of the platform
     - platform_key: Key for rate limiting (lowercase)
     - get_urls(username) -> List[str]
-    - detect_found(response) -> bool
-    - detect_not_found(response) -> bool
+    - detect_found(response, context) -> bool
+    - detect_not_found(response, context) -> bool
+    
+    Checkers must not keep per-check state on the instance: anything
+    about the current check (username, attempt, evidence) comes in the
+    CheckContext, so one instance can serve concurrent checks.
+    
+    Set `hedge` to probe all URLs of a multi-URL platform at once instead
+    of one after another.
+    
+    REQUEST_COST is the number of requests a check usually makes; it
+    defaults to the number of URLs tried.
+    
+    RATE (requests per second) and BURST override the rate limiter's
+    defaults for the platform budget, for platforms that tolerate more,
+    e.g. several parallel requests.
+    
+    RATE_SCOPE picks the budgets a request draws from: "platform" (one
+    per platform), "host" (one per destination host, for platforms
+    spread over independent servers) or "both" (per host, plus the
+    platform budget across its hosts).
+    
+    RATE_GROUP names an entry of RATE_GROUPS whose budget the platform
+    also draws from. Platforms sharing a backend join one group, so a
+    burst or a 429 on one slows them all down.
+    
+    Marker lists (FOUND_MARKERS, NOT_FOUND_MARKERS, RATE_LIMIT_PATTERNS
+    and the other attributes in MARKER_GROUPS) are compiled once per
+    class into a MarkerSet. Bodies are scanned for all of them in one
+    pass as they stream in, and detect methods ask has_marker(response,
+    "found") instead of searching the text for each list.
+    
+    With EARLY_EXIT_MARKERS set, bodies are streamed and the connection
+    closed at the first of these markers, so the detect methods only see
+    the body up to it. List markers that settle the check on their own,
+    typically all NOT_FOUND markers plus the strongest FOUND ones.
+    
+    With `byte_profiles` set, the checker records how far into the body
+    its markers (see body_markers()) end, and once the platform has a
+    learned budget it reads only that many bytes before classifying. If
+    the capped body settles nothing, the rest is read and classified
+    again, so detect methods must not infer anything from a marker's
+    absence when the class declares markers.
+    
+    STATUS_PROBE and REDIRECT_RULES add a tier that classifies from the
+    status line and headers before any body is read. STATUS_PROBE picks
+    the request: "HEAD", or "GET" for a streamed GET that is closed
+    right after the headers when they settle the URL. With
+    REDIRECT_RULES, (Location prefix, result) pairs, redirects are not
+    followed and the first rule matching the target decides, so
+    redirect chains and landing pages are never fetched. Otherwise a
+    status in NOT_FOUND_STATUSES or FOUND_STATUSES settles the URL.
+    Anything else falls back to reading the body: that of the same GET,
+    or a full GET after a HEAD or an unmatched redirect.
     """
     
+    REQUEST_COST: Optional[int] = None
+    RATE: Optional[float] = None
+    BURST: Optional[int] = None
+    RATE_SCOPE = "platform"
+    RATE_GROUP: Optional[str] = None
+    EARLY_EXIT_MARKERS: List[str] = []
+    STATUS_PROBE: Optional[str] = None
+    REDIRECT_RULES: List[Tuple[str, CheckResult]] = []
+    FOUND_STATUSES: Tuple[int, ...] = ()
+    NOT_FOUND_STATUSES: Tuple[int, ...] = (404,)
+    
+    RATE_LIMIT_PATTERNS: List[str] = [
+        "rate limit exceeded",
+        "too many requests",
+        "429 too many requests",
+    ]
+    
     def __init__(self, rate_limiter, session_manager):
         self.rate_limiter = rate_limiter
         self.session_manager = session_manager
         self.timeout = 8
+        self.hedge = False
+        self.byte_profiles = None
+        if self.RATE or self.BURST:
+            rate_limiter.configure(self.platform_key, rate=self.RATE, burst=self.BURST)
+        if self.RATE_GROUP:
+            rate, burst = RATE_GROUPS[self.RATE_GROUP]
+            rate_limiter.configure(f"group:{self.RATE_GROUP}", rate=rate, burst=burst)
     
     @property
     @abstractmethod
@@ -64,7 +179,9 @@ class PlatformChecker(ABC):
         pass
     
     @abstractmethod
-    def detect_found(self, response: requests.Response) -> bool:
+    def detect_found(
+        self, response: requests.Response, context: Optional[CheckContext] = None
+    ) -> bool:
         """
         Analyze response to determine if profile exists.
         Return True if positive indicators found.
@@ -72,13 +189,80 @@ class PlatformChecker(ABC):
         pass
     
     @abstractmethod
-    def detect_not_found(self, response: requests.Response) -> bool:
+    def detect_not_found(
+        self, response: requests.Response, context: Optional[CheckContext] = None
+    ) -> bool:
         """
         Analyze response to determine if profile definitely doesn't exist.
         Return True if negative indicators found.
         """
         pass
     
+    @property
+    def request_cost(self) -> int:
+        """Expected requests per check, used for dispatch ordering."""
+        if self.REQUEST_COST is not None:
+            return self.REQUEST_COST
+        return max(1, len(self.get_urls("username")))
+    
+    def rate_keys(self, url: str) -> List[str]:
+        """Rate limiter keys a request to `url` draws from."""
+        host_key = f"{self.platform_key}:{urlparse(url).hostname}"
+        if self.RATE_SCOPE == "platform":
+            keys = [self.platform_key]
+        elif self.RATE_SCOPE == "host":
+            keys = [host_key]
+        else:
+            keys = [host_key, self.platform_key]
+        if self.RATE_GROUP:
+            keys.append(f"group:{self.RATE_GROUP}")
+        return keys
+    
+    @classmethod
+    def marker_set(cls) -> MarkerSet:
+        """The class's markers, by MARKER_GROUPS label, compiled once."""
+        markers = _marker_sets.get(cls)
+        if markers is None:
+            groups = {
+                label: [
+                    marker
+                    for attribute in attributes
+                    for marker in getattr(cls, attribute, None) or ()
+                ]
+                for label, attributes in MARKER_GROUPS.items()
+            }
+            markers = _marker_sets[cls] = MarkerSet(groups, ignore_case=("rate_limit",))
+        return markers
+    
+    def marker_hits(self, response: requests.Response) -> List[Hit]:
+        """
+        All marker hits in the body, from one pass.
+        
+        Bodies read by probe_url were scanned chunk by chunk as they
+        arrived; others are scanned here once and the hits kept on the
+        response.
+        """
+        content = response.content
+        cached = getattr(response, "_marker_hits", None)
+        if cached is None or cached[0] != len(content):
+            cached = (len(content), self.marker_set().scan(content))
+            response._marker_hits = cached
+        return cached[1]
+    
+    def has_marker(self, response: requests.Response, label: str) -> bool:
+        """Whether the body contains any marker listed under `label`."""
+        return any(hit.label == label for hit in self.marker_hits(response))
+    
+    def body_markers(self) -> List[str]:
+        """Every text marker the checker's detect methods look for."""
+        return self.marker_set().markers(*BODY_LABELS)
+    
+    def byte_budget(self) -> Optional[int]:
+        """Bytes to read before classifying, or None for a full read."""
+        if self.byte_profiles is None or not self.body_markers():
+            return None
+        return self.byte_profiles.budget(self.platform_key)
+    
     def get_profile_url(self, username: str) -> str:
         """Return the canonical profile URL."""
         urls = self.get_urls(username)
@@ -89,6 +273,13 @@ class PlatformChecker(ABC):
         Check if response indicates rate limiting.
         Can be overridden for platform-specific logic.
         """
+        if self.check_rate_limit_headers(response):
+            return True
+        
+        return self.has_marker(response, "rate_limit")
+    
+    def check_rate_limit_headers(self, response: requests.Response) -> bool:
+        """Check the status and headers alone for rate limiting."""
         if response.status_code == 429:
             return True
         
@@ -105,62 +296,302 @@ class PlatformChecker(ABC):
                 except ValueError:
                     pass
         
-        rate_limit_patterns = [
-            "rate limit exceeded",
-            "too many requests",
-            "429 too many requests",
-        ]
-        
-        response_text = response.text.lower()
-        return any(pattern in response_text for pattern in rate_limit_patterns)
+        return False
+    
+    def record_response(
+        self, url: str, response: requests.Response, was_rate_limited: bool = False
+    ):
+        """Feed a response to `url` and its rate-limit headers to the rate limiter."""
+        reset_in, remaining = parse_rate_limit_headers(response.headers)
+        for key in self.rate_keys(url):
+            self.rate_limiter.record_request(
+                key,
+                was_rate_limited=was_rate_limited,
+                reset_in=reset_in,
+                remaining=remaining,
+            )
     
-    def check(self, username: str) -> CheckResult:
+    def check(self, username: str, context: Optional[CheckContext] = None) -> CheckResult:
         """
         Main check method - handles the full flow.
         Subclasses rarely need to override this.
         """
+        if context is None:
+            context = CheckContext(username)
+        
         # Validate username
         is_valid, _ = validate_username(username)
         if not is_valid:
             return CheckResult.UNKNOWN_ERROR
         
-        # Wait if rate limited
-        wait_time = self.rate_limiter.should_wait(self.platform_key)
-        if wait_time > 0:
-            time.sleep(wait_time)
-        
         # Get session
         session = self.session_manager.get_session(self.platform_key)
         
+        urls = self.get_urls(username)
+        
+        # Hedge only while the platform is not backing off, so the burst
+        # of parallel probes never lands on a platform that pushed back
+        if (
+            self.hedge
+            and len(urls) > 1
+            and not any(
+                self.rate_limiter.is_backing_off(key)
+                for url in urls
+                for key in self.rate_keys(url)
+            )
+        ):
+            return self._check_hedged(session, urls, context)
+        
         # Try each URL
-        for url in self.get_urls(username):
-            try:
-                response = session.get(url, timeout=self.timeout, allow_redirects=True)
-                
-                # Check rate limiting
-                if self.check_rate_limit(response):
-                    self.rate_limiter.record_request(self.platform_key, was_rate_limited=True)
-                    return CheckResult.RATE_LIMITED
-                
-                # Record successful request
-                self.rate_limiter.record_request(self.platform_key)
-                
-                # Check for not found first (more definitive)
-                if self.detect_not_found(response):
-                    continue  # Try next URL if multiple
-                
-                # Check for found indicators
-                if self.detect_found(response):
-                    return CheckResult.FOUND
-                
-            except requests.exceptions.Timeout:
-                return CheckResult.TIMEOUT
-            except requests.exceptions.ConnectionError:
-                return CheckResult.NETWORK_ERROR
-            except requests.exceptions.RequestException:
-                return CheckResult.NETWORK_ERROR
-            except Exception:
-                return CheckResult.UNKNOWN_ERROR
+        for url in urls:
+            if context.expired() or not self.wait_turn(context, url):
+                return CheckResult.DEADLINE_EXCEEDED
+            context.url = url
+            result = self.probe_url(session, url, context)
+            if result is not None:
+                return result
         
         # If we tried all URLs and found nothing
         return CheckResult.NOT_FOUND
+    
+    def wait_turn(self, context: CheckContext, url: str) -> bool:
+        """
+        Take rate-limit tokens for one request to `url`, sleeping until
+        they are due.
+        
+        Returns False, without taking a token, if the wait would outlast
+        the check's deadline.
+        """
+        wait_time = self.rate_limiter.acquire_all(
+            self.rate_keys(url), max_wait=context.remaining()
+        )
+        if wait_time is None:
+            return False
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return True
+    
+    def request_timeout(self, context: Optional[CheckContext] = None) -> float:
+        """Per-request timeout, shortened to fit the check's deadline."""
+        remaining = context.remaining() if context else None
+        if remaining is None:
+            return self.timeout
+        return max(0.1, min(self.timeout, remaining))
+    
+    def probe_url(
+        self,
+        session: requests.Session,
+        url: str,
+        context: CheckContext,
+        cancel: Optional[threading.Event] = None,
+    ) -> Optional[CheckResult]:
+        """
+        Fetch and classify a single URL.
+        
+        Returns a definitive result, or None when this URL shows no
+        profile and the next one should be tried. When `cancel` is set
+        by a hedged sibling that already won, the body is not downloaded.
+        """
+        reader = None
+        try:
+            response = None
+            if self.STATUS_PROBE is not None or self.REDIRECT_RULES:
+                result, response = self.probe_headers(session, url, context)
+                if result is not None:
+                    # Not found: try next URL if multiple
+                    return None if result == CheckResult.NOT_FOUND else result
+                if response is None:
+                    if cancel is not None and cancel.is_set():
+                        return None
+                    # The body is needed, and the GET is a request of its own
+                    if not self.wait_turn(context, url):
+                        return CheckResult.DEADLINE_EXCEEDED
+            
+            if response is None:
+                response = session.get(
+                    url,
+                    timeout=self.request_timeout(context),
+                    allow_redirects=True,
+                    stream=True,
+                )
+            reader = BodyReader(response, cancel, self.marker_set().scanner())
+            if cancel is not None and cancel.is_set():
+                return None
+            
+            until = "early_exit" if self.EARLY_EXIT_MARKERS else None
+            budget = self.byte_budget()
+            match = reader.read(max_bytes=budget, until=until)
+            response._marker_hits = (reader.size, reader.hits)
+            if cancel is not None and cancel.is_set():
+                return None
+            
+            rate_limited = self.check_rate_limit(response)
+            found = None if rate_limited else self._classify(response, context)
+            if not rate_limited and not reader.done and (
+                found is None or not self._decisive_hits(reader.hits)
+            ):
+                # The capped read settled nothing for sure, read the rest
+                match = reader.read(until=until) or match
+                response._marker_hits = (reader.size, reader.hits)
+                if cancel is not None and cancel.is_set():
+                    return None
+                rate_limited = self.check_rate_limit(response)
+                found = None if rate_limited else self._classify(response, context)
+            
+            evidence = f"GET {url} -> {response.status_code}"
+            if until is not None or budget is not None:
+                evidence += f" ({reader.size} bytes"
+                if match is not None:
+                    evidence += f", stopped at {match.marker!r}"
+                elif not reader.done:
+                    evidence += f", capped at {budget}"
+                evidence += ")"
+            context.add_evidence(evidence)
+            
+            # Record the request, and whether it was rate limited
+            self.record_response(url, response, was_rate_limited=rate_limited)
+            if rate_limited:
+                return CheckResult.RATE_LIMITED
+            
+            self._learn_offset(response)
+            
+            if found:
+                return CheckResult.FOUND
+            # Not found or unclear: try next URL if multiple
+        
+        except requests.exceptions.Timeout:
+            if context.expired():
+                return CheckResult.DEADLINE_EXCEEDED
+            return CheckResult.TIMEOUT
+        except requests.exceptions.ConnectionError:
+            return CheckResult.NETWORK_ERROR
+        except requests.exceptions.RequestException:
+            return CheckResult.NETWORK_ERROR
+        except Exception:
+            return CheckResult.UNKNOWN_ERROR
+        finally:
+            if reader is not None:
+                reader.close()
+        
+        return None
+    
+    def probe_headers(
+        self, session: requests.Session, url: str, context: CheckContext
+    ) -> Tuple[Optional[CheckResult], Optional[requests.Response]]:
+        """
+        Classify `url` from its status line and Location header alone.
+        
+        Sends the STATUS_PROBE request, or a streamed GET when only
+        REDIRECT_RULES are set, without following redirects if there are
+        redirect rules. Returns (result, None) when the headers settle
+        it. Otherwise returns (None, response) for a GET whose body can
+        still be read, or (None, None) when a full GET is needed.
+        Request errors propagate to probe_url.
+        """
+        allow_redirects = not self.REDIRECT_RULES
+        if self.STATUS_PROBE == "HEAD":
+            method = "HEAD"
+            response = session.head(
+                url, timeout=self.request_timeout(context), allow_redirects=allow_redirects
+            )
+        else:
+            method = "GET"
+            response = session.get(
+                url,
+                timeout=self.request_timeout(context),
+                allow_redirects=allow_redirects,
+                stream=True,
+            )
+        result = self.classify_headers(url, response)
+        target = _redirect_target(url, response)
+        if result is None and method == "GET" and target is None:
+            # probe_url reads and records it
+            return None, response
+        
+        response.close()
+        evidence = f"{method} {url} -> {response.status_code}"
+        if target is not None:
+            evidence += f" (redirect to {target})"
+        elif method == "GET":
+            evidence += " (headers only)"
+        context.add_evidence(evidence)
+        self.record_response(
+            url, response, was_rate_limited=result == CheckResult.RATE_LIMITED
+        )
+        return result, None
+    
+    def classify_headers(
+        self, url: str, response: requests.Response
+    ) -> Optional[CheckResult]:
+        """
+        Result settled by the status and headers alone, if any.
+        
+        Redirects are matched against REDIRECT_RULES, other statuses
+        against NOT_FOUND_STATUSES and FOUND_STATUSES.
+        """
+        if self.check_rate_limit_headers(response):
+            return CheckResult.RATE_LIMITED
+        target = _redirect_target(url, response)
+        if target is not None:
+            for prefix, result in self.REDIRECT_RULES:
+                if target.startswith(prefix):
+                    return result
+            return None
+        if response.status_code in self.NOT_FOUND_STATUSES:
+            return CheckResult.NOT_FOUND
+        if response.status_code in self.FOUND_STATUSES:
+            return CheckResult.FOUND
+        return None
+    
+    def _classify(
+        self, response: requests.Response, context: CheckContext
+    ) -> Optional[bool]:
+        """False if the body shows no profile, True if it shows one, else None."""
+        # Check for not found first (more definitive)
+        if self.detect_not_found(response, context):
+            return False
+        if self.detect_found(response, context):
+            return True
+        return None
+    
+    @staticmethod
+    def _decisive_hits(hits: List[Hit]) -> List[Hit]:
+        """The hits whose markers settle a check on their own."""
+        return [hit for hit in hits if hit.label in DECISIVE_LABELS]
+    
+    def _learn_offset(self, response: requests.Response):
+        """Record where the first decisive marker in the body ends, if any is there."""
+        if self.byte_profiles is None:
+            return
+        ends = [
+            hit.offset + len(hit.marker.encode("utf-8"))
+            for hit in self._decisive_hits(self.marker_hits(response))
+        ]
+        if ends:
+            self.byte_profiles.record(self.platform_key, min(ends))
+    
+    def _check_hedged(
+        self, session: requests.Session, urls: List[str], context: CheckContext
+    ) -> CheckResult:
+        """Probe all URLs concurrently, stopping at the first FOUND."""
+        def probe(url: str, cancel: threading.Event) -> Optional[CheckResult]:
+            # Probes share the platform's bucket: a burst of 1 spaces them out
+            if not self.wait_turn(context, url):
+                return CheckResult.DEADLINE_EXCEEDED
+            if cancel.is_set():
+                return None
+            return self.probe_url(session, url, context, cancel)
+        
+        calls = [lambda cancel, url=url: probe(url, cancel) for url in urls]
+        results = run_hedged(calls, lambda result: result == CheckResult.FOUND)
+        
+        if CheckResult.FOUND in results:
+            context.url = urls[results.index(CheckResult.FOUND)]
+            return CheckResult.FOUND
+        if CheckResult.RATE_LIMITED in results:
+            return CheckResult.RATE_LIMITED
+        # Otherwise the first error in URL order, as a sequential run would report
+        for result in results:
+            if result is not None:
+                return result
+        return CheckResult.NOT_FOUND
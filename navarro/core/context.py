@@ -0,0 +1,45 @@
+"""Per-check context passed through a checker's check/detect methods."""
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class CheckContext:
+    """
+    State for one username check on one platform.
+    
+    Checkers keep no per-username state on the instance, so a single
+    checker can serve many concurrent checks; anything a detect_*
+    method needs about the current check lives here instead.
+    """
+    username: str
+    attempt: int = 1
+    url: Optional[str] = None
+    # time.monotonic() value after which the check should give up
+    deadline: Optional[float] = None
+    started: float = field(default_factory=time.monotonic)
+    evidence: List[str] = field(default_factory=list)
+    
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the check started."""
+        return time.monotonic() - self.started
+    
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None without one."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+    
+    def expired(self) -> bool:
+        """True once the deadline has passed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+    
+    def cancel(self) -> None:
+        """Make the check stop before its next request."""
+        self.deadline = time.monotonic()
+    
+    def add_evidence(self, note: str) -> None:
+        """Record why the check reached its result."""
+        self.evidence.append(note)
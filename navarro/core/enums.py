@@ -10,6 +10,8 @@ class CheckResult(Enum):
     TIMEOUT = auto()
     NETWORK_ERROR = auto()
     UNKNOWN_ERROR = auto()
+    DEADLINE_EXCEEDED = auto()
+    SKIPPED = auto()  # Not checked: a stop condition was met first
     
     def is_success(self) -> bool:
         """Check if this is a definitive result."""
@@ -22,4 +24,5 @@ class CheckResult(Enum):
             CheckResult.TIMEOUT,
             CheckResult.NETWORK_ERROR,
             CheckResult.UNKNOWN_ERROR,
+            CheckResult.DEADLINE_EXCEEDED,
         )
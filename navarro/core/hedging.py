@@ -0,0 +1,63 @@
+"""Hedged execution: run alternatives at once, keep the first decisive one."""
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+
+
+T = TypeVar("T")
+
+# Each call receives the shared cancel event and should stop early
+# (e.g. skip downloading a body) once it is set
+HedgedCall = Callable[[threading.Event], T]
+
+HEDGE_WORKERS = 16
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    # Separate from the engines' pools, so a check running on an engine
+    # thread can wait on its probes without starving them
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=HEDGE_WORKERS,
+                thread_name_prefix="navarro-hedge",
+            )
+        return _executor
+
+
+def run_hedged(
+    calls: Sequence[HedgedCall], is_decisive: Callable[[T], bool]
+) -> List[Optional[T]]:
+    """
+    Run calls concurrently and return as soon as one is decisive.
+    
+    On a decisive result the cancel event is set and calls that have not
+    started are cancelled. Returns results in call order, with None for
+    calls that were cancelled or had not finished.
+    """
+    cancel = threading.Event()
+    executor = _get_executor()
+    futures: Dict[Future, int] = {
+        executor.submit(call, cancel): index for index, call in enumerate(calls)
+    }
+    results: List[Optional[T]] = [None] * len(calls)
+    pending = set(futures)
+    
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.cancelled():
+                continue
+            result = future.result()
+            results[futures[future]] = result
+            if is_decisive(result):
+                cancel.set()
+                for other in pending:
+                    other.cancel()
+                return results
+    
+    return results
@@ -0,0 +1,136 @@
+"""Per-platform request history and quota estimation."""
+import sqlite3
+import statistics
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+HISTORY_FILE = Path.home() / ".navarro_request_history.db"
+
+# Requests kept in the history, in seconds
+RETENTION = 7 * 24 * 3600.0
+
+# Buffered requests that trigger a write
+FLUSH_SIZE = 500
+
+# Window over which the request rate before a 429 is measured, in seconds
+QUOTA_WINDOW = 60.0
+
+# Fraction of the rate that drew 429s that is considered sustainable
+QUOTA_SAFETY = 0.8
+
+# Slowest estimate, matching the rate limiter's 30s cap on delays
+MIN_QUOTA = 1 / 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    platform TEXT NOT NULL,
+    ts REAL NOT NULL,
+    limited INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS requests_platform ON requests (platform, ts);
+"""
+
+
+class RequestHistory:
+    """
+    Request timestamps and outcomes per rate-limit key, kept across runs
+    in a small SQLite file.
+    
+    record() only appends to an in-memory buffer. The buffer is written
+    in one transaction every FLUSH_SIZE requests and on flush(), and
+    rows older than RETENTION are pruned then.
+    
+    estimate_quotas() turns the history into a sustainable rate per
+    platform. For every 429 it measures the request rate over the
+    QUOTA_WINDOW before it, takes the median of those rates and keeps
+    QUOTA_SAFETY of it. Platforms that were never limited get no
+    estimate.
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else HISTORY_FILE
+        self._buffer: List[Tuple[str, float, int]] = []
+        self._lock = threading.Lock()
+        try:
+            conn = self._connect()
+            try:
+                conn.executescript(_SCHEMA)
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+    
+    def record(self, platform: str, was_rate_limited: bool = False) -> None:
+        """Note one request to the platform, made now."""
+        with self._lock:
+            self._buffer.append((platform, time.time(), int(was_rate_limited)))
+            full = len(self._buffer) >= FLUSH_SIZE
+        if full:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write buffered requests and prune old ones."""
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+        if not rows:
+            return
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany("INSERT INTO requests VALUES (?, ?, ?)", rows)
+                    conn.execute("DELETE FROM requests WHERE ts < ?", (time.time() - RETENTION,))
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+    
+    def estimate_quotas(self) -> Dict[str, float]:
+        """Sustainable requests per second, for platforms that hit 429s."""
+        quotas: Dict[str, float] = {}
+        try:
+            conn = self._connect()
+            try:
+                since = time.time() - RETENTION
+                platforms = [
+                    row[0] for row in conn.execute(
+                        "SELECT DISTINCT platform FROM requests WHERE limited = 1 AND ts >= ?",
+                        (since,),
+                    )
+                ]
+                for platform in platforms:
+                    rows = conn.execute(
+                        "SELECT ts, limited FROM requests WHERE platform = ? AND ts >= ? ORDER BY ts",
+                        (platform, since),
+                    ).fetchall()
+                    quota = self._estimate(rows)
+                    if quota is not None:
+                        quotas[platform] = quota
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+        return quotas
+    
+    @staticmethod
+    def _estimate(rows: List[Tuple[float, int]]) -> Optional[float]:
+        """Rate estimate from one platform's (ts, limited) rows, oldest first."""
+        rates = []
+        start = 0
+        for end, (ts, limited) in enumerate(rows):
+            while rows[start][0] <= ts - QUOTA_WINDOW:
+                start += 1
+            if limited:
+                # Requests in the window up to and including the 429
+                rates.append((end - start + 1) / QUOTA_WINDOW)
+        if not rates:
+            return None
+        return max(statistics.median(rates) * QUOTA_SAFETY, MIN_QUOTA)
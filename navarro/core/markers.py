@@ -0,0 +1,110 @@
+"""Labelled detection markers matched in a single pass."""
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+
+class Hit(NamedTuple):
+    """A marker seen in a body, the label it was listed under, and its offset."""
+    label: str
+    marker: str
+    offset: int
+
+
+class MarkerSet:
+    """
+    Labelled markers compiled once into one byte pattern.
+    
+    scan() reports every occurrence of every marker, overlapping ones
+    included, in offset order and each with the labels its marker was
+    listed under (e.g. "found", "not_found", "rate_limit"): what one
+    pass of an Aho-Corasick automaton would give. Markers are matched
+    as UTF-8 bytes, so nothing is decoded, and a marker listed under
+    several labels is searched for once. Markers under `ignore_case`
+    labels fold ASCII case, against one lowered copy of the body.
+    
+    Each distinct marker is found with bytes.find, whose C search beats
+    both an automaton stepped byte by byte in Python and a regex
+    alternation of the markers by several times on real pages.
+    """
+    
+    def __init__(self, groups: Dict[str, Iterable[str]], ignore_case: Iterable[str] = ()):
+        folded = set(ignore_case)
+        labels: Dict[Tuple[bytes, bool], Tuple[str, List[str]]] = {}
+        for label, markers in groups.items():
+            for marker in markers:
+                if not marker:
+                    continue
+                key = (marker.encode("utf-8"), label in folded)
+                entry = labels.setdefault(key, (marker, []))
+                if label not in entry[1]:
+                    entry[1].append(label)
+        
+        # (needle, folded, marker, labels), longest first
+        self._entries = sorted(
+            (
+                (needle.lower() if fold else needle, fold, marker, tuple(entry_labels))
+                for (needle, fold), (marker, entry_labels) in labels.items()
+            ),
+            key=lambda entry: -len(entry[0]),
+        )
+        self.longest = len(self._entries[0][0]) if self._entries else 0
+    
+    def markers(self, *labels: str) -> List[str]:
+        """Markers listed under any of the labels, or all of them."""
+        return [
+            marker for _, _, marker, entry_labels in self._entries
+            if not labels or any(label in entry_labels for label in labels)
+        ]
+    
+    def scan(self, data: bytes, base: int = 0, min_end: int = 0) -> List[Hit]:
+        """
+        Every marker occurrence in `data`, in offset order.
+        
+        Offsets are shifted by `base`. Occurrences ending at or before
+        `min_end` (a position in `data`) are skipped.
+        """
+        hits: List[Hit] = []
+        lowered = None
+        for needle, fold, marker, entry_labels in self._entries:
+            if fold:
+                if lowered is None:
+                    lowered = data.lower()
+                haystack = lowered
+            else:
+                haystack = data
+            index = haystack.find(needle, max(0, min_end - len(needle) + 1))
+            while index != -1:
+                hits.extend(Hit(label, marker, base + index) for label in entry_labels)
+                index = haystack.find(needle, index + 1)
+        # Stable, so longer markers stay first at equal offsets
+        hits.sort(key=lambda hit: hit.offset)
+        return hits
+    
+    def scanner(self) -> "MarkerScanner":
+        """A scanner for a body fed chunk by chunk."""
+        return MarkerScanner(self)
+
+
+class MarkerScanner:
+    """
+    Run a MarkerSet over a body fed chunk by chunk.
+    
+    The last few bytes of each chunk are kept so a marker split across
+    two chunks is still found, and reported once.
+    """
+    
+    def __init__(self, markers: MarkerSet):
+        self.markers = markers
+        self._keep = max(markers.longest - 1, 0)
+        self._tail = b""
+        self._offset = 0  # Body offset of self._tail[0]
+    
+    def feed(self, chunk: bytes) -> List[Hit]:
+        """Scan the next chunk, returning the hits that end in it."""
+        window = self._tail + chunk
+        # Markers wholly inside the tail were reported with the last chunk
+        hits = self.markers.scan(window, base=self._offset, min_end=len(self._tail))
+        
+        keep = min(self._keep, len(window))
+        self._offset += len(window) - keep
+        self._tail = window[len(window) - keep:] if keep else b""
+        return hits
@@ -0,0 +1,94 @@
+"""Learned per-platform byte budgets for body reads."""
+import json
+import math
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from navarro.utils import atomic_write_json
+
+
+PROFILES_FILE = Path.home() / ".navarro_byte_profiles.json"
+
+# Offsets kept per platform, newest last
+PROFILE_SAMPLES = 200
+
+# Samples needed before reads are capped
+MIN_SAMPLES = 10
+
+# Quantile of the offsets the budget has to cover, and the margin on top
+BUDGET_QUANTILE = 0.95
+BUDGET_MARGIN = 1.5
+
+# Smallest budget handed out, in bytes
+MIN_BUDGET = 32 * 1024
+
+
+class ByteProfiles:
+    """
+    Where in the body each platform's decisive markers show up.
+    
+    Checkers record the byte offset just past the first not-found or
+    early-exit marker they see; found markers alone do not count, since
+    a not-found marker may still follow them. Once a platform has
+    MIN_SAMPLES offsets, budget() caps its reads at the BUDGET_QUANTILE
+    offset times BUDGET_MARGIN (at least MIN_BUDGET). Checkers read the
+    full body unless such a marker is inside the capped read, and those
+    reads are recorded too, so the budget grows again if pages change.
+    
+    Loaded at startup and saved explicitly, like PlatformStats.
+    """
+    
+    def __init__(self):
+        self.offsets: Dict[str, List[int]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        """Load saved profiles from disk."""
+        if PROFILES_FILE.exists():
+            try:
+                with self._lock, open(PROFILES_FILE, 'r') as f:
+                    for platform, offsets in json.load(f).items():
+                        self.offsets[platform] = [int(o) for o in offsets][-PROFILE_SAMPLES:]
+            except Exception:
+                pass
+    
+    def save(self):
+        """Save profiles to disk."""
+        try:
+            with self._lock:
+                atomic_write_json(PROFILES_FILE, dict(self.offsets))
+        except Exception:
+            pass
+    
+    def record(self, platform: str, offset: int):
+        """Note where a decisive marker ended in a body."""
+        with self._lock:
+            offsets = self.offsets[platform]
+            offsets.append(offset)
+            del offsets[:-PROFILE_SAMPLES]
+    
+    def samples(self, platform: str) -> int:
+        with self._lock:
+            return len(self.offsets.get(platform, ()))
+    
+    def budget(self, platform: str) -> Optional[int]:
+        """Bytes to read before classifying, or None for a full read."""
+        with self._lock:
+            offsets = sorted(self.offsets.get(platform, ()))
+        if len(offsets) < MIN_SAMPLES:
+            return None
+        covered = offsets[math.ceil(BUDGET_QUANTILE * len(offsets)) - 1]
+        return max(MIN_BUDGET, int(covered * BUDGET_MARGIN))
+
+
+def save_profiles(checkers: Iterable) -> None:
+    """Save the byte profiles attached to any of the checkers, once each."""
+    profiles = {}
+    for checker in checkers:
+        if getattr(checker, "byte_profiles", None) is not None:
+            profiles[id(checker.byte_profiles)] = checker.byte_profiles
+    for profile in profiles.values():
+        profile.save()
@@ -1,42 +1,214 @@
 """Rate limiter with persistence."""
+import asyncio
+import atexit
 import json
+import random
+import threading
+import time
+import weakref
 from collections import defaultdict
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Mapping, Optional, Sequence, Tuple
+
+from navarro.utils import atomic_write_json
+
+from .history import RequestHistory
 
 
 RATE_LIMIT_FILE = Path.home() / ".navarro_rate_limits.json"
 
+# Base delay between requests to one platform, in seconds
+DEFAULT_DELAY = 0.5
+
+# Seconds between writes of buffered rate-limit state
+SAVE_INTERVAL = 5.0
+
+# Lockout after a 429 that does not say when to retry: decorrelated
+# jitter between LOCKOUT_BASE and 3x the previous lockout, capped
+LOCKOUT_BASE = 30.0
+LOCKOUT_CAP = 300.0
+
+# Extra random wait on top of a server-given reset, as a fraction of it
+# (at most MAX_JITTER seconds), so workers do not all retry at once
+RESET_JITTER = 0.1
+MAX_JITTER = 2.0
+
+RETRY_AFTER_HEADERS = ("retry-after",)
+RESET_HEADERS = ("x-ratelimit-reset", "x-rate-limit-reset", "ratelimit-reset")
+REMAINING_HEADERS = ("x-ratelimit-remaining", "x-rate-limit-remaining", "ratelimit-remaining")
+
+
+def _header(headers: Mapping[str, str], names: Tuple[str, ...]) -> Optional[str]:
+    lowered = {key.lower(): value for key, value in headers.items()}
+    for name in names:
+        if name in lowered:
+            return str(lowered[name]).strip()
+    return None
+
+
+def parse_rate_limit_headers(
+    headers: Mapping[str, str]
+) -> Tuple[Optional[float], Optional[int]]:
+    """
+    Read a response's rate-limit headers.
+    
+    Returns (reset_in, remaining): seconds until the server allows the
+    next request, from Retry-After (seconds or an HTTP date) or an
+    X-RateLimit-Reset style header (epoch or delta seconds), and the
+    number of requests left in the current window. Either may be None.
+    """
+    reset_in = None
+    value = _header(headers, RETRY_AFTER_HEADERS)
+    if value:
+        try:
+            reset_in = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+                reset_in = retry_at.timestamp() - time.time()
+            except (TypeError, ValueError):
+                pass
+    
+    if reset_in is None:
+        value = _header(headers, RESET_HEADERS)
+        try:
+            reset = float(value) if value else None
+        except ValueError:
+            reset = None
+        if reset is not None:
+            # Large values are epoch timestamps, small ones a delta
+            reset_in = reset - time.time() if reset > 1e9 else reset
+    
+    remaining = None
+    value = _header(headers, REMAINING_HEADERS)
+    if value:
+        try:
+            remaining = int(float(value))
+        except ValueError:
+            pass
+    
+    if reset_in is not None:
+        reset_in = max(reset_in, 0.0)
+    return reset_in, remaining
+
+
+def _flush_at_exit(ref: "weakref.ref[RateLimiter]") -> None:
+    limiter = ref()
+    if limiter is not None:
+        limiter.flush()
+
 
 class RateLimiter:
-    """Rate limiter with persistence."""
+    """
+    Token-bucket rate limiter with persistence.
     
-    def __init__(self):
+    Each platform has a bucket that refills at 1 / delay tokens per
+    second and holds up to `burst` tokens, so a platform that tolerates
+    bursts can take several requests at once while its long-run rate
+    stays bounded. Delays adapt: a 429 doubles the platform's delay and
+    drains its bucket, each successful request eases it back by 10%
+    towards the base delay.
+    
+    acquire() reserves a token atomically and returns how long the
+    caller must sleep before using it, so concurrent callers are spaced
+    out instead of all seeing the same free token. All state is guarded
+    by a lock and timed with time.monotonic(), so one instance can be
+    shared by threads and, through AsyncRateLimiter, asyncio tasks.
+    
+    min_delay is the floor for the delay between two requests to one
+    platform. Processes that split every budget between them set
+    `share` to their number (see ShardedRunner): each base delay, be it
+    the default, a configured rate or a quota from the history, is then
+    multiplied by `share` and each burst divided by it, so the processes
+    together stay within one budget.
+    
+    A 429 locks the platform out until the server's Retry-After or
+    rate-limit reset, plus a little jitter, or for a decorrelated-jitter
+    backoff when the server gives no time. A window that is about to
+    run out is paced so its remaining requests spread over it.
+    
+    With a `history`, every request is logged to it and platforms start
+    at the quota estimated from earlier runs rather than at the default
+    delay. A static rate configured later (a checker's RATE or its rate
+    group's) never speeds a platform up past its learned quota.
+    
+    State changes are buffered: the file is rewritten at most every
+    SAVE_INTERVAL seconds, right away after a 429 so other runs see the
+    lockout, and on flush() or interpreter exit.
+    """
+    
+    def __init__(
+        self,
+        min_delay: float = DEFAULT_DELAY,
+        burst: int = 1,
+        history: Optional[RequestHistory] = None,
+        share: int = 1,
+    ):
+        self.min_delay = min_delay
+        self.burst = burst
+        self.share = max(1, share)
+        self.history = history
+        # reset_time is a time.monotonic() value, saved as wall-clock time
         self.limits: Dict[str, Dict[str, Any]] = defaultdict(
-            lambda: {"count": 0, "reset_time": datetime.now()}
+            lambda: {"count": 0, "reset_time": 0.0}
         )
-        self.delays: Dict[str, float] = defaultdict(lambda: 0.5)  # Base delay per platform
-        self.last_request: Dict[str, datetime] = defaultdict(lambda: datetime.now())
+        self.base_delays: Dict[str, float] = defaultdict(lambda: self.min_delay * self.share)
+        self.bursts: Dict[str, int] = defaultdict(lambda: max(1, self.burst // self.share))
+        self.delays: Dict[str, float] = {}  # Adaptive delay per platform
+        self.tokens: Dict[str, float] = {}
+        self.updated: Dict[str, float] = {}
+        self.backoffs: Dict[str, float] = {}  # Last unexplained lockout per platform
+        self.quotas: Dict[str, float] = {}  # Rates learned from the history
+        self._lock = threading.RLock()
+        # Serializes writers so an older snapshot never lands last
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.monotonic()
         self.load_limits()
+        if history is not None:
+            self.quotas = history.estimate_quotas()
+            for platform, rate in self.quotas.items():
+                self.configure(platform, rate=rate)
+        atexit.register(_flush_at_exit, weakref.ref(self))
+    
+    def configure(
+        self, platform: str, rate: Optional[float] = None, burst: Optional[int] = None
+    ):
+        """
+        Set a platform's base rate (requests per second) and burst size.
+        
+        Both are for all sharing processes together; this process gets
+        its share of them. A slower quota learned from the history wins
+        over `rate`.
+        """
+        with self._lock:
+            if rate:
+                if platform in self.quotas:
+                    rate = min(rate, self.quotas[platform])
+                self.base_delays[platform] = max(1 / rate, self.min_delay) * self.share
+            if burst:
+                self.bursts[platform] = max(1, burst // self.share)
+                if platform in self.tokens:
+                    self.tokens[platform] = min(self.tokens[platform], self.bursts[platform])
     
     def load_limits(self):
         """Load saved rate limits from disk."""
         if RATE_LIMIT_FILE.exists():
             try:
-                with open(RATE_LIMIT_FILE, 'r') as f:
+                with self._lock, open(RATE_LIMIT_FILE, 'r') as f:
                     saved_data = json.load(f)
                     for platform, limit_data in saved_data.get('limits', {}).items():
                         try:
-                            reset_time = datetime.fromisoformat(
-                                limit_data.get("reset_time", datetime.now().isoformat())
-                            )
-                        except (ValueError, TypeError):
-                            reset_time = datetime.now()
+                            reset_time = datetime.fromisoformat(limit_data["reset_time"])
+                            lockout = (reset_time - datetime.now()).total_seconds()
+                        except (KeyError, ValueError, TypeError):
+                            lockout = 0
                         
                         self.limits[platform] = {
                             "count": limit_data.get("count", 0),
-                            "reset_time": reset_time
+                            "reset_time": time.monotonic() + max(lockout, 0)
                         }
                     self.delays.update(saved_data.get('delays', {}))
             except Exception:
@@ -45,55 +217,203 @@ class RateLimiter:
     def save_limits(self):
         """Save rate limits to disk."""
         try:
-            limits_to_save = {}
-            for platform, limit_data in self.limits.items():
-                limits_to_save[platform] = {
-                    "count": limit_data["count"],
-                    "reset_time": (
-                        limit_data["reset_time"].isoformat() 
-                        if isinstance(limit_data["reset_time"], datetime) 
-                        else limit_data["reset_time"]
-                    )
-                }
-            
-            with open(RATE_LIMIT_FILE, 'w') as f:
-                json.dump({
-                    'limits': limits_to_save,
-                    'delays': dict(self.delays)
-                }, f, indent=2)
+            with self._save_lock:
+                with self._lock:
+                    now, wall = time.monotonic(), datetime.now()
+                    limits_to_save = {}
+                    for platform, limit_data in self.limits.items():
+                        lockout = max(limit_data["reset_time"] - now, 0)
+                        limits_to_save[platform] = {
+                            "count": limit_data["count"],
+                            "reset_time": (wall + timedelta(seconds=lockout)).isoformat()
+                        }
+                    data = {
+                        'limits': limits_to_save,
+                        'delays': dict(self.delays)
+                    }
+                    self._dirty = False
+                    self._last_save = now
+                # Write outside the state lock so checks are not held up
+                atomic_write_json(RATE_LIMIT_FILE, data, separators=(',', ':'))
         except Exception:
             pass
     
+    def flush(self):
+        """Write buffered state to disk if anything changed."""
+        if self._dirty:
+            self.save_limits()
+        if self.history is not None:
+            self.history.flush()
+    
+    def _delay(self, platform: str) -> float:
+        return max(self.delays.get(platform, 0), self.base_delays[platform])
+    
+    def _refill(self, platform: str, now: float) -> float:
+        """Top up the platform's bucket to `now` and return its tokens."""
+        burst = self.bursts[platform]
+        if platform not in self.tokens:
+            self.tokens[platform] = float(burst)
+        else:
+            # Nothing accrues during a lockout, so it does not end in a burst
+            since = max(self.updated[platform], self.limits[platform]["reset_time"])
+            elapsed = max(now - since, 0)
+            self.tokens[platform] = min(
+                burst, self.tokens[platform] + elapsed / self._delay(platform)
+            )
+        self.updated[platform] = now
+        return self.tokens[platform]
+    
+    def _wait_time(self, platform: str, now: float) -> float:
+        lockout = max(self.limits[platform]["reset_time"] - now, 0)
+        tokens = self._refill(platform, now)
+        if tokens >= 1:
+            return lockout
+        return lockout + (1 - tokens) * self._delay(platform)
+    
     def should_wait(self, platform: str) -> float:
-        """Calculate wait time for platform."""
-        now = datetime.now()
+        """Time until the platform has a token free, without taking it."""
+        with self._lock:
+            return self._wait_time(platform, time.monotonic())
+    
+    def acquire(self, platform: str, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve a token for one request to the platform.
         
-        reset_time = self.limits[platform]["reset_time"]
-        if isinstance(reset_time, str):
-            try:
-                reset_time = datetime.fromisoformat(reset_time)
-            except (ValueError, TypeError):
-                reset_time = now
+        Returns how long to sleep before sending it, or None (reserving
+        nothing) when that would be max_wait or longer.
+        """
+        return self.acquire_all([platform], max_wait=max_wait)
+    
+    def acquire_all(
+        self, platforms: Sequence[str], max_wait: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Reserve one token from each of several buckets for one request,
+        e.g. its host's and its platform's.
         
-        if reset_time > now:
-            return (reset_time - now).total_seconds()
+        All or nothing: returns the longest of the waits, or None when
+        that would be max_wait or longer.
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait_time = max(self._wait_time(platform, now) for platform in platforms)
+            if max_wait is not None and wait_time >= max_wait:
+                return None
+            # Tokens may go negative: later callers queue behind the debt
+            for platform in platforms:
+                self.tokens[platform] -= 1
+            return wait_time
+    
+    def is_backing_off(self, platform: str) -> bool:
+        """True while the platform is locked out or slowed past its base delay."""
+        with self._lock:
+            if self.limits[platform]["reset_time"] > time.monotonic():
+                return True
+            return self.delays.get(platform, 0) > self.base_delays[platform]
+    
+    def _lockout(self, platform: str, reset_in: Optional[float]) -> float:
+        """Seconds to lock a platform out after a 429."""
+        if reset_in is not None:
+            return reset_in + random.uniform(0, min(reset_in * RESET_JITTER, MAX_JITTER))
+        previous = self.backoffs.get(platform, LOCKOUT_BASE)
+        lockout = min(LOCKOUT_CAP, random.uniform(LOCKOUT_BASE, previous * 3))
+        self.backoffs[platform] = lockout
+        return lockout
+    
+    def record_request(
+        self,
+        platform: str,
+        was_rate_limited: bool = False,
+        reset_in: Optional[float] = None,
+        remaining: Optional[int] = None,
+    ):
+        """
+        Record a request's outcome and adapt the platform's delay.
         
-        # Calculate adaptive delay
-        time_since_last = (now - self.last_request[platform]).total_seconds()
-        if time_since_last < self.delays[platform]:
-            return self.delays[platform] - time_since_last
+        reset_in and remaining come from the response's rate-limit
+        headers (see parse_rate_limit_headers).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(platform, now)
+            delay = self._delay(platform)
+            
+            limited = was_rate_limited or remaining == 0
+            if limited:
+                self.delays[platform] = min(delay * 2, max(30, self.min_delay))  # Max 30s delay
+                self.limits[platform]["reset_time"] = now + self._lockout(platform, reset_in)
+                # One request may go right at the reset, the rest are paced
+                self.tokens[platform] = min(self.tokens[platform], 1)
+            else:
+                self.backoffs.pop(platform, None)
+                self.delays[platform] = max(delay * 0.9, self.base_delays[platform])
+                if remaining and reset_in:
+                    # Spread what is left of the window over its remaining time
+                    self.delays[platform] = max(self.delays[platform], reset_in / remaining)
+            
+            self._dirty = True
+            due = limited or now - self._last_save >= SAVE_INTERVAL
         
-        return 0
+        if self.history is not None:
+            self.history.record(platform, was_rate_limited=limited)
+        if due:
+            self.save_limits()
+
+
+class AsyncRateLimiter:
+    """
+    Asyncio front-end for RateLimiter.
+    
+    Waits use asyncio.sleep so a throttled platform never blocks the
+    event loop. State lives in the wrapped RateLimiter, which checkers
+    keep using directly.
+    """
+    
+    def __init__(self, rate_limiter: Optional[RateLimiter] = None):
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_lock(self, platform: str) -> asyncio.Lock:
+        """Per-platform lock, recreated when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._locks.clear()
+            self._loop = loop
+        if platform not in self._locks:
+            self._locks[platform] = asyncio.Lock()
+        return self._locks[platform]
+    
+    async def wait(self, platform: str) -> None:
+        """Sleep until the platform has a token free, without taking it."""
+        async with self._get_lock(platform):
+            wait_time = self.rate_limiter.should_wait(platform)
+            while wait_time > 0:
+                await asyncio.sleep(wait_time)
+                wait_time = self.rate_limiter.should_wait(platform)
+    
+    async def acquire(self, platform: str) -> None:
+        """Reserve a token for one request and sleep until it is due."""
+        wait_time = self.rate_limiter.acquire(platform)
+        if wait_time:
+            await asyncio.sleep(wait_time)
     
-    def record_request(self, platform: str, was_rate_limited: bool = False):
+    def should_wait(self, platform: str) -> float:
+        """Time until the platform has a token free, without taking it."""
+        return self.rate_limiter.should_wait(platform)
+    
+    def record_request(
+        self,
+        platform: str,
+        was_rate_limited: bool = False,
+        reset_in: Optional[float] = None,
+        remaining: Optional[int] = None,
+    ):
         """Record a request and update delays."""
-        now = datetime.now()
-        self.last_request[platform] = now
-        
-        if was_rate_limited:
-            self.delays[platform] = min(self.delays[platform] * 2, 30)  # Max 30s delay
-            self.limits[platform]["reset_time"] = now + timedelta(seconds=60)
-        else:
-            self.delays[platform] = max(self.delays[platform] * 0.9, 0.5)  # Min 0.5s delay
-        
-        self.save_limits()
+        self.rate_limiter.record_request(
+            platform, was_rate_limited=was_rate_limited, reset_in=reset_in, remaining=remaining
+        )
+    
+    def flush(self):
+        """Write buffered state to disk if anything changed."""
+        self.rate_limiter.flush()
@@ -1,6 +1,11 @@
 """Session manager with connection pooling and user-agent rotation."""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
 import requests
-from typing import Dict, List
 
 
 USER_AGENTS: List[str] = [
@@ -18,40 +23,89 @@ USER_AGENTS: List[str] = [
 
 
 class SessionManager:
-    """Manage persistent sessions with connection pooling."""
+    """
+    Manage persistent sessions with connection pooling.
+    
+    Safe to share between threads. pool_size should be at least the
+    number of workers that may use one platform's session at once.
+    """
     
-    def __init__(self):
+    def __init__(self, pool_size: int = 10):
         self.sessions: Dict[str, requests.Session] = {}
+        self.pool_size = pool_size
         self._user_agent_index = 0
+        self._lock = threading.Lock()
     
     def get_session(self, platform: str) -> requests.Session:
         """Get or create a session for a platform."""
-        if platform not in self.sessions:
-            session = requests.Session()
-            
-            # Connection pooling
-            adapter = requests.adapters.HTTPAdapter(
-                pool_connections=10,
-                pool_maxsize=10,
-                max_retries=3
-            )
-            session.mount('http://', adapter)
-            session.mount('https://', adapter)
+        with self._lock:
+            if platform not in self.sessions:
+                session = requests.Session()
+                
+                # Connection pooling
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=self.pool_size,
+                    pool_maxsize=self.pool_size,
+                    max_retries=3
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                
+                # Set rotating user agent
+                session.headers.update(self._get_next_user_agent())
+                self.sessions[platform] = session
             
-            # Set rotating user agent
-            session.headers.update(self._get_next_user_agent())
-            self.sessions[platform] = session
-        
-        return self.sessions[platform]
+            return self.sessions[platform]
     
     def _get_next_user_agent(self) -> Dict[str, str]:
-        """Rotate through user agents."""
+        """Rotate through user agents. Caller must hold the lock."""
         ua = USER_AGENTS[self._user_agent_index % len(USER_AGENTS)]
         self._user_agent_index += 1
         return {"User-Agent": ua}
     
     def close_all(self):
         """Close all sessions."""
-        for session in self.sessions.values():
-            session.close()
-        self.sessions.clear()
+        with self._lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
+
+class AsyncSessionManager:
+    """
+    Asyncio front-end for SessionManager.
+    
+    requests is blocking, so requests (or whole blocking checks) run on a
+    private thread pool and are awaited from the event loop.
+    """
+    
+    def __init__(self, session_manager: Optional[SessionManager] = None, max_workers: int = 10):
+        self.session_manager = session_manager or SessionManager()
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="navarro",
+            )
+        return self._executor
+    
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking callable on the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        return await loop.run_in_executor(self._get_executor(), call)
+    
+    async def get(self, platform: str, url: str, **kwargs) -> requests.Response:
+        """GET a URL with the platform's pooled session."""
+        session = self.session_manager.get_session(platform)
+        return await self.run(session.get, url, **kwargs)
+    
+    def close_all(self):
+        """Shut down the thread pool and close all sessions."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.session_manager.close_all()
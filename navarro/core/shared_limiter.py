@@ -0,0 +1,161 @@
+"""Rate limiter whose state is shared by processes through SQLite."""
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+from .history import RequestHistory
+from .rate_limiter import DEFAULT_DELAY, RateLimiter
+
+
+SHARED_LIMITS_FILE = Path.home() / ".navarro_rate_limits.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    platform TEXT PRIMARY KEY,
+    tokens REAL,
+    updated REAL,
+    delay REAL,
+    reset_time REAL NOT NULL DEFAULT 0,
+    backoff REAL
+);
+"""
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    RateLimiter whose buckets live in a local SQLite file.
+    
+    Every navarro process on the host that points at the same file draws
+    from the same per-platform budget. Each acquire/record is one short
+    IMMEDIATE transaction that loads the platform's rows, applies the
+    usual token-bucket logic and writes them back. In WAL mode with
+    synchronous=NORMAL that costs tens of microseconds and no fsync.
+    
+    Times are stored as wall-clock seconds, since time.monotonic() does
+    not survive a reboot. They are converted back to monotonic time when
+    the row is loaded. The file is the persistence, so the JSON file is
+    neither read nor written.
+    
+    If the database is unavailable or stays locked past `busy_timeout`,
+    the platform falls back to this process's in-memory state for that
+    call.
+    """
+    
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        min_delay: float = DEFAULT_DELAY,
+        burst: int = 1,
+        busy_timeout: float = 5.0,
+        history: Optional[RequestHistory] = None,
+    ):
+        self.path = Path(path) if path else SHARED_LIMITS_FILE
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        super().__init__(min_delay=min_delay, burst=burst, history=history)
+        self._connect().executescript(_SCHEMA)
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.path), timeout=self.busy_timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def load_limits(self):
+        """State is read per platform from the database."""
+    
+    def save_limits(self):
+        """State is written per platform by every transaction."""
+    
+    @contextmanager
+    def _shared(self, *platforms: str) -> Iterator[None]:
+        """Run a block against the platforms' rows, in one transaction."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+            except sqlite3.Error:
+                yield
+                return
+            try:
+                for platform in platforms:
+                    self._load_row(conn, platform)
+                yield
+                for platform in platforms:
+                    self._store_row(conn, platform)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+    
+    def _load_row(self, conn: sqlite3.Connection, platform: str) -> None:
+        row = conn.execute(
+            "SELECT tokens, updated, delay, reset_time, backoff FROM buckets WHERE platform = ?",
+            (platform,),
+        ).fetchone()
+        for state in (self.tokens, self.updated, self.delays, self.backoffs):
+            state.pop(platform, None)
+        self.limits[platform]["reset_time"] = 0.0
+        if row is None:
+            return
+        
+        tokens, updated, delay, reset_time, backoff = row
+        offset = time.monotonic() - time.time()
+        if tokens is not None and updated is not None:
+            self.tokens[platform] = tokens
+            self.updated[platform] = updated + offset
+        if delay is not None:
+            self.delays[platform] = delay
+        if backoff is not None:
+            self.backoffs[platform] = backoff
+        self.limits[platform]["reset_time"] = reset_time + offset
+    
+    def _store_row(self, conn: sqlite3.Connection, platform: str) -> None:
+        offset = time.time() - time.monotonic()
+        updated = self.updated.get(platform)
+        conn.execute(
+            "INSERT OR REPLACE INTO buckets "
+            "(platform, tokens, updated, delay, reset_time, backoff) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                platform,
+                self.tokens.get(platform),
+                None if updated is None else updated + offset,
+                self.delays.get(platform),
+                self.limits[platform]["reset_time"] + offset,
+                self.backoffs.get(platform),
+            ),
+        )
+    
+    def should_wait(self, platform: str) -> float:
+        with self._shared(platform):
+            return super().should_wait(platform)
+    
+    def acquire_all(
+        self, platforms: Sequence[str], max_wait: Optional[float] = None
+    ) -> Optional[float]:
+        with self._shared(*platforms):
+            return super().acquire_all(platforms, max_wait=max_wait)
+    
+    def is_backing_off(self, platform: str) -> bool:
+        with self._shared(platform):
+            return super().is_backing_off(platform)
+    
+    def record_request(
+        self,
+        platform: str,
+        was_rate_limited: bool = False,
+        reset_in: Optional[float] = None,
+        remaining: Optional[int] = None,
+    ):
+        with self._shared(platform):
+            super().record_request(
+                platform, was_rate_limited=was_rate_limited, reset_in=reset_in, remaining=remaining
+            )
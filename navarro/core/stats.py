@@ -0,0 +1,78 @@
+"""Persistent per-platform check statistics."""
+import json
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict
+
+from navarro.utils import atomic_write_json
+
+from .enums import CheckResult
+
+
+STATS_FILE = Path.home() / ".navarro_platform_stats.json"
+
+
+class PlatformStats:
+    """
+    Historical outcomes per platform key: checks, hits and latency.
+    
+    Loaded at startup and saved explicitly (engines save on close), so
+    recording a result stays in memory.
+    """
+    
+    def __init__(self):
+        self.stats: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"checks": 0, "found": 0, "latency": 0.0}
+        )
+        self._lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        """Load saved statistics from disk."""
+        if STATS_FILE.exists():
+            try:
+                with self._lock, open(STATS_FILE, 'r') as f:
+                    for platform, data in json.load(f).items():
+                        self.stats[platform] = {
+                            "checks": int(data.get("checks", 0)),
+                            "found": int(data.get("found", 0)),
+                            "latency": float(data.get("latency", 0.0)),
+                        }
+            except Exception:
+                pass
+    
+    def save(self):
+        """Save statistics to disk."""
+        try:
+            with self._lock:
+                atomic_write_json(STATS_FILE, dict(self.stats))
+        except Exception:
+            pass
+    
+    def record(self, platform: str, result: CheckResult, latency: float):
+        """Record one check. Only definitive results count."""
+        if not result.is_success():
+            return
+        with self._lock:
+            entry = self.stats[platform]
+            entry["checks"] += 1
+            entry["latency"] += latency
+            if result == CheckResult.FOUND:
+                entry["found"] += 1
+    
+    def hit_rate(self, platform: str) -> float:
+        """Smoothed share of checks that found a profile."""
+        with self._lock:
+            entry = self.stats.get(platform)
+            checks, found = (entry["checks"], entry["found"]) if entry else (0, 0)
+        # Laplace smoothing: unseen platforms start at 0.5
+        return (found + 1) / (checks + 2)
+    
+    def mean_latency(self, platform: str, default: float = 1.0) -> float:
+        """Average seconds per check, or `default` without history."""
+        with self._lock:
+            entry = self.stats.get(platform)
+            if not entry or not entry["checks"]:
+                return default
+            return entry["latency"] / entry["checks"]
@@ -0,0 +1,73 @@
+"""Streaming body reads that stop at the first decisive marker."""
+import threading
+from typing import List, Optional
+
+import requests
+
+from .markers import Hit, MarkerScanner
+
+
+# Bytes requested from the socket per read
+CHUNK_SIZE = 16 * 1024
+
+
+class BodyReader:
+    """
+    Read a streamed response body in steps.
+    
+    Each read() continues where the last one stopped and ends at the end
+    of the body, at `max_bytes` in total, at a hit labelled `until` or
+    once `cancel` is set. With a scanner, every chunk is scanned as it
+    arrives and `hits` holds the markers seen so far. What was read so
+    far is always the response's content, so `response.text` and the
+    checkers' detect methods see the (possibly partial) body.
+    """
+    
+    def __init__(
+        self,
+        response: requests.Response,
+        cancel: Optional[threading.Event] = None,
+        scanner: Optional[MarkerScanner] = None,
+    ):
+        self.response = response
+        self.cancel = cancel
+        self.scanner = scanner
+        self.hits: List[Hit] = []
+        self.done = False
+        self._chunks = response.iter_content(CHUNK_SIZE)
+        self._body = bytearray()
+    
+    @property
+    def size(self) -> int:
+        """Bytes read so far."""
+        return len(self._body)
+    
+    def read(self, max_bytes: Optional[int] = None, until: Optional[str] = None) -> Optional[Hit]:
+        """Read on, returning the hit labelled `until` if that is what stopped it."""
+        stop = None
+        try:
+            while not self.done:
+                if self.cancel is not None and self.cancel.is_set():
+                    break
+                if max_bytes is not None and len(self._body) >= max_bytes:
+                    break
+                try:
+                    chunk = next(self._chunks)
+                except StopIteration:
+                    self.done = True
+                    break
+                self._body += chunk
+                if self.scanner is not None:
+                    hits = self.scanner.feed(chunk)
+                    self.hits.extend(hits)
+                    stop = next((hit for hit in hits if hit.label == until), None)
+                    if stop is not None:
+                        break
+        finally:
+            self.response._content = bytes(self._body)
+            self.response._content_consumed = True
+        return stop
+    
+    def close(self) -> None:
+        """Drop the connection, unread bytes included."""
+        self.response.close()
@@ -0,0 +1,23 @@
+"""Execution engines for running platform checks concurrently."""
+from .async_engine import AsyncEngine
+from .concurrency import AIMDController
+from .distributed import Coordinator, TaskQueue, Worker
+from .ordering import CostYieldOrdering
+from .scheduler import BatchScheduler, build_batch_scheduler
+from .sharded import ShardedRunner
+from .stopping import StopCondition
+from .threaded import ThreadPoolEngine
+
+__all__ = [
+    'AIMDController',
+    'AsyncEngine',
+    'BatchScheduler',
+    'Coordinator',
+    'CostYieldOrdering',
+    'ShardedRunner',
+    'StopCondition',
+    'TaskQueue',
+    'ThreadPoolEngine',
+    'Worker',
+    'build_batch_scheduler',
+]
@@ -0,0 +1,221 @@
+"""Asyncio engine that checks all platforms at once."""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+from navarro.core import (
+    AsyncRateLimiter,
+    AsyncSessionManager,
+    CheckContext,
+    CheckResult,
+    PlatformChecker,
+)
+from navarro.core.profiles import save_profiles
+
+from .concurrency import AIMDController
+from .ordering import CostYieldOrdering
+from .stopping import StopCondition
+
+
+# Called with (platform_name, result) as each check finishes
+ResultCallback = Callable[[str, CheckResult], None]
+
+DEFAULT_CONCURRENCY = 1
+
+
+class AsyncEngine:
+    """
+    Run PlatformChecker.check for every platform concurrently.
+    
+    Checkers are blocking, so each check runs on the session manager's
+    thread pool while rate-limit waits happen on the event loop. A
+    per-platform semaphore caps how many checks hit one platform at the
+    same time, which matters once several usernames share an engine.
+    
+    Wall time for one username is roughly that of the slowest platform
+    instead of the sum of all of them. With a `deadline` (seconds per
+    username) it is bounded: platforms still running when it hits are
+    cancelled and reported as DEADLINE_EXCEEDED.
+    
+    With an `ordering` policy, checks are dispatched best-first and their
+    outcomes feed the policy's statistics. With a `stop` condition, a
+    username's remaining checks are cancelled (SKIPPED) once it is met.
+    With a `controller`, the per-platform cap adapts (AIMD) instead of
+    being fixed at `concurrency`.
+    """
+    
+    def __init__(
+        self,
+        checkers: Dict[str, PlatformChecker],
+        rate_limiter: AsyncRateLimiter,
+        session_manager: AsyncSessionManager,
+        concurrency: Union[int, Dict[str, int]] = DEFAULT_CONCURRENCY,
+        deadline: Optional[float] = None,
+        ordering: Optional[CostYieldOrdering] = None,
+        stop: Optional[StopCondition] = None,
+        controller: Optional[AIMDController] = None,
+    ):
+        self.checkers = checkers
+        self.rate_limiter = rate_limiter
+        self.session_manager = session_manager
+        self.concurrency = concurrency
+        self.deadline = deadline
+        self.ordering = ordering
+        self.stop = stop
+        self.controller = controller
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._conditions: Dict[str, asyncio.Condition] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def get_concurrency(self, platform_key: str) -> int:
+        """Return the most checks a platform may ever have in flight."""
+        if self.controller is not None:
+            return self.controller.maximum
+        if isinstance(self.concurrency, dict):
+            return self.concurrency.get(platform_key, DEFAULT_CONCURRENCY)
+        return self.concurrency
+    
+    def _check_loop(self) -> None:
+        """Drop loop-bound primitives when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._semaphores.clear()
+            self._conditions.clear()
+            self._loop = loop
+    
+    def _get_semaphore(self, platform_key: str) -> asyncio.Semaphore:
+        """Per-platform semaphore, recreated when used from a new event loop."""
+        self._check_loop()
+        if platform_key not in self._semaphores:
+            self._semaphores[platform_key] = asyncio.Semaphore(
+                max(1, self.get_concurrency(platform_key))
+            )
+        return self._semaphores[platform_key]
+    
+    def _get_condition(self, platform_key: str) -> asyncio.Condition:
+        """Per-platform condition, recreated when used from a new event loop."""
+        self._check_loop()
+        if platform_key not in self._conditions:
+            self._conditions[platform_key] = asyncio.Condition()
+        return self._conditions[platform_key]
+    
+    @asynccontextmanager
+    async def _slot(self, platform_key: str) -> AsyncIterator[None]:
+        """Hold one of the platform's in-flight slots."""
+        if self.controller is None:
+            async with self._get_semaphore(platform_key):
+                yield
+            return
+        
+        condition = self._get_condition(platform_key)
+        async with condition:
+            await condition.wait_for(lambda: self.controller.try_acquire(platform_key))
+        try:
+            yield
+        finally:
+            self.controller.release(platform_key)
+            async with condition:
+                condition.notify_all()
+    
+    def dispatch_order(self) -> List[str]:
+        """Platform names in the order checks should start."""
+        if self.ordering is None:
+            order = list(self.checkers)
+        else:
+            order = self.ordering.order(self.checkers)
+        if self.stop:
+            order = self.stop.prioritize(order)
+        return order
+    
+    def stop_met(self, results: Dict[str, CheckResult]) -> bool:
+        """True once the stop condition holds for these results."""
+        return bool(self.stop) and self.stop.is_met(results, self.checkers)
+    
+    def deadline_from(self, start: float) -> Optional[float]:
+        """Monotonic deadline for a check, or username, dispatched at `start`."""
+        return None if self.deadline is None else start + self.deadline
+    
+    async def _run_check(
+        self, checker: PlatformChecker, username: str, context: CheckContext
+    ) -> CheckResult:
+        async with self._slot(checker.platform_key):
+            await self.rate_limiter.wait(checker.platform_key)
+            started = time.monotonic()
+            try:
+                result = await self.session_manager.run(checker.check, username, context)
+            except Exception:
+                result = CheckResult.UNKNOWN_ERROR
+            if self.ordering is not None:
+                self.ordering.record(checker, result, started)
+            if self.controller is not None:
+                self.controller.record(checker.platform_key, result)
+            return result
+    
+    async def _check_one(
+        self, name: str, checker: PlatformChecker, context: CheckContext
+    ) -> Tuple[str, CheckResult]:
+        # The context carries the deadline into the worker thread, so a
+        # cancelled check stops before its next request
+        if context.deadline is None:
+            return name, await self._run_check(checker, context.username, context)
+        
+        remaining = context.deadline - time.monotonic()
+        if remaining <= 0:
+            return name, CheckResult.DEADLINE_EXCEEDED
+        try:
+            result = await asyncio.wait_for(
+                self._run_check(checker, context.username, context), remaining
+            )
+        except asyncio.TimeoutError:
+            result = CheckResult.DEADLINE_EXCEEDED
+        return name, result
+    
+    async def check(
+        self, username: str, on_result: Optional[ResultCallback] = None
+    ) -> Dict[str, CheckResult]:
+        """Check a username on all platforms, in registry order."""
+        deadline_at = self.deadline_from(time.monotonic())
+        contexts: Dict[str, CheckContext] = {}
+        tasks: Dict[asyncio.Future, str] = {}
+        for name in self.dispatch_order():
+            contexts[name] = CheckContext(username, deadline=deadline_at)
+            task = asyncio.ensure_future(
+                self._check_one(name, self.checkers[name], contexts[name])
+            )
+            tasks[task] = name
+        
+        finished: Dict[str, CheckResult] = {}
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name, result = task.result()
+                finished[name] = result
+                if on_result:
+                    on_result(name, result)
+            
+            if pending and self.stop_met(finished):
+                for task in pending:
+                    task.cancel()
+                    contexts[tasks[task]].cancel()
+                    finished[tasks[task]] = CheckResult.SKIPPED
+                    if on_result:
+                        on_result(tasks[task], CheckResult.SKIPPED)
+                break
+        
+        return {name: finished[name] for name in self.checkers if name in finished}
+    
+    def run(
+        self, username: str, on_result: Optional[ResultCallback] = None
+    ) -> Dict[str, CheckResult]:
+        """Blocking wrapper around check() for synchronous callers."""
+        return asyncio.run(self.check(username, on_result=on_result))
+    
+    def close(self):
+        """Shut down the thread pool, close sessions, save limits, statistics and byte profiles."""
+        self.session_manager.close_all()
+        self.rate_limiter.flush()
+        if self.ordering is not None:
+            self.ordering.save()
+        save_profiles(self.checkers.values())
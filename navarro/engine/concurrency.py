@@ -0,0 +1,78 @@
+"""AIMD per-platform concurrency control."""
+import threading
+from collections import defaultdict
+from typing import Dict
+
+from navarro.core import CheckResult
+
+
+# Results that mean the platform is pushing back
+CONGESTION_RESULTS = frozenset({CheckResult.RATE_LIMITED, CheckResult.TIMEOUT})
+
+
+class AIMDController:
+    """
+    Adaptive in-flight cap per platform key.
+    
+    Each platform's window grows additively while checks come back clean
+    (by `increase` per window's worth of definitive results) and is
+    multiplied by `decrease` on a 429, a block page (both reported as
+    RATE_LIMITED) or a timeout, within [minimum, maximum]. It is the
+    same scheme as the rate limiter's ×0.9 / ×2 delays, applied to
+    concurrency. Tolerant sites end up with several checks in flight and
+    strict ones stay at one.
+    
+    Engines call try_acquire() before a check and release() after it,
+    with record() in between. windows() shows what each platform
+    currently tolerates. All methods are thread-safe.
+    """
+    
+    def __init__(
+        self,
+        initial: float = 1.0,
+        minimum: int = 1,
+        maximum: int = 8,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.increase = increase
+        self.decrease = decrease
+        self._windows: Dict[str, float] = defaultdict(
+            lambda: min(max(initial, self.minimum), self.maximum)
+        )
+        self._in_flight: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+    
+    def window(self, platform: str) -> int:
+        """Checks the platform may have in flight right now."""
+        with self._lock:
+            return int(self._windows[platform])
+    
+    def windows(self) -> Dict[str, int]:
+        """Current window of every platform seen so far."""
+        with self._lock:
+            return {platform: int(window) for platform, window in self._windows.items()}
+    
+    def try_acquire(self, platform: str) -> bool:
+        """Take an in-flight slot if the window has room."""
+        with self._lock:
+            if self._in_flight[platform] >= int(self._windows[platform]):
+                return False
+            self._in_flight[platform] += 1
+            return True
+    
+    def release(self, platform: str) -> None:
+        """Give back a slot taken with try_acquire()."""
+        with self._lock:
+            self._in_flight[platform] = max(0, self._in_flight[platform] - 1)
+    
+    def record(self, platform: str, result: CheckResult) -> None:
+        """Grow or shrink the platform's window from a check's result."""
+        with self._lock:
+            window = self._windows[platform]
+            if result in CONGESTION_RESULTS:
+                self._windows[platform] = max(self.minimum, window * self.decrease)
+            elif result.is_success():
+                self._windows[platform] = min(self.maximum, window + self.increase / window)
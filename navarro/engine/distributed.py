@@ -0,0 +1,367 @@
+"""Coordinator/worker mode over a persistent SQLite task queue."""
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from navarro.core import (
+    CheckContext,
+    CheckResult,
+    PlatformChecker,
+    RateLimiter,
+    SessionManager,
+)
+from navarro.platforms import get_all_checkers, list_platforms
+
+from .scheduler import UsernameCallback
+
+
+DEFAULT_LEASE_SECONDS = 60.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    result TEXT,
+    UNIQUE (username, platform)
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, id);
+"""
+
+
+class Task(NamedTuple):
+    """A leased (username, platform) pair."""
+    id: int
+    username: str
+    platform: str
+    attempts: int
+
+
+class Progress(NamedTuple):
+    """What TaskQueue.progress found past a position."""
+    position: int  # Pass to the next call
+    finished: List[Tuple[str, Dict[str, CheckResult]]]  # Newly complete usernames, in order
+    pending: bool  # Some task is still without a result
+
+
+class TaskQueue:
+    """
+    Persistent (username, platform) task queue in a SQLite file.
+    
+    Workers lease tasks for a limited time and renew the lease while
+    the check runs, however long its rate-limit waits. A task whose
+    lease expires (the worker died or hung) goes back to the pool, and
+    after max_attempts leases it is closed as UNKNOWN_ERROR.
+    
+    The file uses SQLite's default rollback journal rather than WAL,
+    which needs shared memory that only works on one host. Workers on
+    other hosts still depend on the network filesystem's file locking;
+    NFS locking is often unreliable, so keep those workers on a local
+    disk, or a filesystem known to lock correctly.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation: safe across threads
+        # and processes, writers serialize on SQLite's own lock
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    def enqueue(self, usernames: Iterable[str], platforms: Iterable[str]) -> int:
+        """Add one task per (username, platform). Returns tasks added."""
+        platforms = list(platforms)
+        rows = [(u, p) for u in dict.fromkeys(usernames) for p in platforms]
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO tasks (username, platform) VALUES (?, ?)", rows
+            )
+            added = conn.total_changes - before
+            conn.execute("COMMIT")
+        return added
+    
+    def lease(self, worker: str, exclude: Iterable[str] = ()) -> Optional[Task]:
+        """Lease the oldest available task whose platform is not excluded."""
+        exclude = list(exclude)
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Give up on tasks that keep losing their worker
+                conn.execute(
+                    "UPDATE tasks SET status = 'done', result = ? "
+                    "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                    (CheckResult.UNKNOWN_ERROR.name, now, self.max_attempts),
+                )
+                placeholders = ",".join("?" * len(exclude))
+                row = conn.execute(
+                    "SELECT id, username, platform, attempts FROM tasks "
+                    "WHERE (status = 'pending' OR (status = 'leased' AND lease_expires < ?)) "
+                    f"AND platform NOT IN ({placeholders}) "
+                    "ORDER BY id LIMIT 1",
+                    [now] + exclude,
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    "UPDATE tasks SET status = 'leased', worker = ?, lease_expires = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    (worker, now + self.lease_seconds, row[0]),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return Task(row[0], row[1], row[2], row[3] + 1)
+    
+    def renew(self, task: Task, worker: str) -> bool:
+        """
+        Extend a task's lease by lease_seconds from now. Returns False
+        if the lease was lost to another worker in the meantime.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ? "
+                "WHERE id = ? AND worker = ? AND status = 'leased'",
+                (time.time() + self.lease_seconds, task.id, worker),
+            )
+            return cursor.rowcount == 1
+    
+    def complete(self, task: Task, worker: str, result: CheckResult) -> bool:
+        """
+        Store a task's result. Returns False if the lease was lost to
+        another worker in the meantime.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'done', result = ?, lease_expires = NULL "
+                "WHERE id = ? AND worker = ? AND status = 'leased'",
+                (result.name, task.id, worker),
+            )
+            return cursor.rowcount == 1
+    
+    def unfinished(self) -> int:
+        """Number of tasks without a result yet."""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE status != 'done'"
+            ).fetchone()[0]
+    
+    def progress(self, position: int = 0) -> Progress:
+        """
+        Usernames completed since `position`, in enqueue order, up to the
+        first one still pending.
+        
+        Only reads tasks past the position: every task up to it is done,
+        so a poll costs the newly finished tasks, not the whole queue.
+        """
+        finished: List[Tuple[str, Dict[str, CheckResult]]] = []
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id FROM tasks WHERE id > ? AND status != 'done' ORDER BY id LIMIT 1",
+                (position,),
+            ).fetchone()
+            frontier = row[0] if row else None
+            if frontier is None:
+                rows = conn.execute(
+                    "SELECT id, username FROM tasks WHERE id > ? ORDER BY id", (position,)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT id, username FROM tasks WHERE id > ? AND id < ? ORDER BY id",
+                    (position, frontier),
+                ).fetchall()
+            checked: Set[str] = set()
+            for task_id, username in rows:
+                if username in checked:
+                    position = task_id
+                    continue
+                tasks = conn.execute(
+                    "SELECT id, platform, status, result FROM tasks WHERE username = ? ORDER BY id",
+                    (username,),
+                ).fetchall()
+                if tasks[0][0] < task_id:
+                    # First enqueued earlier, reported before; this is a late task
+                    checked.add(username)
+                    position = task_id
+                    continue
+                if any(status != "done" for _, _, status, _ in tasks):
+                    break
+                finished.append(
+                    (username, {platform: CheckResult[result] for _, platform, _, result in tasks})
+                )
+                checked.add(username)
+                position = task_id
+        return Progress(position, finished, frontier is not None)
+    
+    def results(self) -> Dict[str, Dict[str, Optional[CheckResult]]]:
+        """All results, by username in enqueue order (None if pending)."""
+        results: Dict[str, Dict[str, Optional[CheckResult]]] = {}
+        with self._connect() as conn:
+            for username, platform, result in conn.execute(
+                "SELECT username, platform, result FROM tasks ORDER BY id"
+            ):
+                results.setdefault(username, {})[platform] = (
+                    CheckResult[result] if result else None
+                )
+        return results
+
+
+class Coordinator:
+    """Split a username list into queue tasks and collect the results."""
+    
+    def __init__(self, queue: TaskQueue):
+        self.queue = queue
+    
+    def submit(self, usernames: Iterable[str], platforms: Optional[Iterable[str]] = None) -> int:
+        """
+        Enqueue every (username, platform) pair.
+        Platform names are matched case-insensitively against the registry.
+        """
+        names = list_platforms()
+        if platforms:
+            wanted = {p.lower() for p in platforms}
+            names = [name for name in names if name.lower() in wanted]
+        return self.queue.enqueue(usernames, names)
+    
+    def wait(
+        self,
+        poll_interval: float = 1.0,
+        on_complete: Optional[UsernameCallback] = None,
+    ) -> Dict[str, Dict[str, CheckResult]]:
+        """
+        Block until workers have finished every task.
+        on_complete is called per username, in input order.
+        """
+        position = 0
+        while True:
+            progress = self.queue.progress(position)
+            position = progress.position
+            if on_complete:
+                for username, results in progress.finished:
+                    on_complete(username, results)
+            if not progress.pending:
+                return self.queue.results()
+            time.sleep(poll_interval)
+
+
+class Worker:
+    """
+    Lease tasks from a queue and run the existing PlatformChecker classes.
+    
+    Runs `threads` checks at once, never two on the same platform, and
+    exits when the queue has no unfinished tasks left. A background
+    thread renews the leases of running checks every third of the lease
+    time; a check whose lease was lost anyway is cancelled.
+    """
+    
+    def __init__(
+        self,
+        queue: TaskQueue,
+        checkers: Optional[Dict[str, PlatformChecker]] = None,
+        timeout: int = 8,
+        threads: int = 4,
+        worker_id: Optional[str] = None,
+        poll_interval: float = 1.0,
+    ):
+        self.queue = queue
+        if checkers is None:
+            checkers = get_all_checkers(RateLimiter(), SessionManager(pool_size=threads))
+            for checker in checkers.values():
+                checker.timeout = timeout
+        self.checkers = checkers
+        self.threads = max(1, threads)
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.poll_interval = poll_interval
+        self.completed = 0
+        self._busy: Set[str] = set()
+        # Running checks by task id, for lease renewal
+        self._running: Dict[int, Tuple[Task, CheckContext]] = {}
+        self._lock = threading.Lock()
+    
+    def _lease(self) -> Optional[Task]:
+        with self._lock:
+            # Platforms we have no checker for are left to other workers
+            skip = self._busy | (set(list_platforms()) - set(self.checkers))
+            task = self.queue.lease(self.worker_id, exclude=skip)
+            if task:
+                self._busy.add(task.platform)
+            return task
+    
+    def _loop(self) -> None:
+        while True:
+            task = self._lease()
+            if task is None:
+                if self.queue.unfinished() == 0:
+                    return
+                time.sleep(self.poll_interval)
+                continue
+            context = CheckContext(task.username, attempt=task.attempts)
+            with self._lock:
+                self._running[task.id] = (task, context)
+            try:
+                result = self.checkers[task.platform].check(task.username, context)
+            except Exception:
+                result = CheckResult.UNKNOWN_ERROR
+            finally:
+                with self._lock:
+                    self._busy.discard(task.platform)
+                    del self._running[task.id]
+            if self.queue.complete(task, self.worker_id, result):
+                with self._lock:
+                    self.completed += 1
+    
+    def _renew_loop(self, stop: threading.Event) -> None:
+        while not stop.wait(max(self.queue.lease_seconds / 3, 0.01)):
+            with self._lock:
+                running = list(self._running.values())
+            for task, context in running:
+                if not self.queue.renew(task, self.worker_id):
+                    # Someone else has it now: stop at the next request
+                    context.cancel()
+    
+    def run(self) -> int:
+        """Process tasks until the queue is drained. Returns tasks completed."""
+        threads: List[threading.Thread] = [
+            threading.Thread(target=self._loop, name=f"navarro-worker-{i}", daemon=True)
+            for i in range(self.threads)
+        ]
+        stop = threading.Event()
+        renewer = threading.Thread(
+            target=self._renew_loop, args=(stop,), name="navarro-renewer", daemon=True
+        )
+        renewer.start()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stop.set()
+        renewer.join()
+        return self.completed
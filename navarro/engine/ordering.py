@@ -0,0 +1,38 @@
+"""Cost- and yield-aware dispatch ordering for platform checks."""
+import time
+from typing import Dict, List, Optional
+
+from navarro.core import CheckResult, PlatformChecker
+from navarro.core.stats import PlatformStats
+
+
+class CostYieldOrdering:
+    """
+    Order checkers cheapest and highest-yield first.
+    
+    A platform's score is its historical hit rate divided by its
+    expected cost: requests per check (PlatformChecker.request_cost)
+    times mean latency per check. Dispatch order decides which checks
+    start first when there are fewer workers than platforms, and which
+    results stream in before a deadline.
+    """
+    
+    def __init__(self, stats: Optional[PlatformStats] = None):
+        self.stats = stats or PlatformStats()
+    
+    def score(self, checker: PlatformChecker) -> float:
+        """Expected hits per second of work for this checker."""
+        key = checker.platform_key
+        cost = checker.request_cost * self.stats.mean_latency(key)
+        return self.stats.hit_rate(key) / max(cost, 1e-3)
+    
+    def order(self, checkers: Dict[str, PlatformChecker]) -> List[str]:
+        """Platform names, best score first (stable for ties)."""
+        return sorted(checkers, key=lambda name: -self.score(checkers[name]))
+    
+    def record(self, checker: PlatformChecker, result: CheckResult, started: float):
+        """Feed one finished check back into the statistics."""
+        self.stats.record(checker.platform_key, result, time.monotonic() - started)
+    
+    def save(self):
+        self.stats.save()
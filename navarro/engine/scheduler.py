@@ -0,0 +1,141 @@
+"""Platform-major batch scheduler for checking many usernames."""
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional
+
+from navarro.core import (
+    AsyncRateLimiter,
+    AsyncSessionManager,
+    CheckContext,
+    CheckResult,
+    PlatformChecker,
+    RateLimiter,
+    SessionManager,
+)
+from navarro.platforms import build_checkers
+
+from .async_engine import DEFAULT_CONCURRENCY, AsyncEngine
+from .concurrency import AIMDController
+from .ordering import CostYieldOrdering
+from .stopping import StopCondition
+
+
+# Called with (username, results) once every platform has reported
+UsernameCallback = Callable[[str, Dict[str, CheckResult]], None]
+
+
+class BatchScheduler(AsyncEngine):
+    """
+    Interleave checks across usernames and platforms.
+    
+    Each platform gets its own lanes (as many as its concurrency cap)
+    that pull the next username from the platform's queue. A lane sleeps
+    only for its own platform's rate-limit delay, so whichever platform
+    is ready next is always the one that gets a request, and every
+    platform's budget is used in parallel. No blanket delay between
+    usernames is needed.
+    
+    Completed usernames are reported in input order. A `deadline` is
+    counted, on each platform, from when that platform's lane dispatches
+    the username: lanes move through the list at their own pace, so a
+    clock started by the fastest platform would run out before slower
+    ones ever got to the username. Once a
+    username meets the `stop` condition, its checks still queued on other
+    lanes are reported as SKIPPED without a request.
+    """
+    
+    async def _lane(
+        self,
+        name: str,
+        checker: PlatformChecker,
+        queue: Deque[str],
+        results: Dict[str, Dict[str, CheckResult]],
+        on_done: Callable[[str, str, CheckResult], None],
+    ) -> None:
+        while queue:
+            username = queue.popleft()
+            if self.stop_met(results[username]):
+                on_done(username, name, CheckResult.SKIPPED)
+                continue
+            context = CheckContext(username, deadline=self.deadline_from(time.monotonic()))
+            _, result = await self._check_one(name, checker, context)
+            on_done(username, name, result)
+    
+    async def check_many(
+        self,
+        usernames: Iterable[str],
+        on_complete: Optional[UsernameCallback] = None,
+    ) -> Dict[str, Dict[str, CheckResult]]:
+        """Check all usernames on all platforms."""
+        ordered: List[str] = list(dict.fromkeys(usernames))
+        results: Dict[str, Dict[str, CheckResult]] = {u: {} for u in ordered}
+        next_index = 0
+        
+        def on_done(username: str, name: str, result: CheckResult) -> None:
+            nonlocal next_index
+            results[username][name] = result
+            # Flush finished usernames in input order
+            while next_index < len(ordered):
+                current = ordered[next_index]
+                if len(results[current]) < len(self.checkers):
+                    break
+                results[current] = {
+                    n: results[current][n] for n in self.checkers
+                }
+                if on_complete:
+                    on_complete(current, results[current])
+                next_index += 1
+        
+        lanes = []
+        for name in self.dispatch_order():
+            checker = self.checkers[name]
+            queue: Deque[str] = deque(ordered)
+            for _ in range(max(1, self.get_concurrency(checker.platform_key))):
+                lanes.append(self._lane(name, checker, queue, results, on_done))
+        
+        await asyncio.gather(*lanes)
+        return results
+    
+    def run_many(
+        self,
+        usernames: Iterable[str],
+        on_complete: Optional[UsernameCallback] = None,
+    ) -> Dict[str, Dict[str, CheckResult]]:
+        """Blocking wrapper around check_many() for synchronous callers."""
+        return asyncio.run(self.check_many(usernames, on_complete=on_complete))
+
+
+def build_batch_scheduler(
+    rate_limiter: RateLimiter,
+    platforms: Optional[Iterable[str]] = None,
+    timeout: int = 8,
+    hedge: bool = False,
+    deadline: Optional[float] = None,
+    ordering: Optional[CostYieldOrdering] = None,
+    stop: Optional[StopCondition] = None,
+    controller: Optional[AIMDController] = None,
+) -> BatchScheduler:
+    """
+    Build checkers and a BatchScheduler with threads for all its lanes.
+    
+    Each platform gets one lane, or controller.maximum lanes with a
+    controller. The thread pool and the connection pools are sized to
+    the lane count, so windows the controller opens up are actually used
+    rather than queueing on a pool sized for one check per platform.
+    """
+    session_manager = SessionManager()
+    checkers = build_checkers(rate_limiter, session_manager, platforms, timeout, hedge)
+    per_platform = controller.maximum if controller is not None else DEFAULT_CONCURRENCY
+    lanes = max(1, len(checkers) * per_platform)
+    # Sessions are created on first use, after the platform count is known
+    session_manager.pool_size = max(session_manager.pool_size, lanes)
+    return BatchScheduler(
+        checkers,
+        AsyncRateLimiter(rate_limiter),
+        AsyncSessionManager(session_manager, max_workers=lanes),
+        deadline=deadline,
+        ordering=ordering,
+        stop=stop,
+        controller=controller,
+    )
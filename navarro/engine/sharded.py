@@ -0,0 +1,146 @@
+"""Multi-process sharded runner for very large username lists."""
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from navarro.core import CheckResult, RateLimiter, RequestHistory, SharedRateLimiter
+from navarro.core.profiles import save_profiles
+
+from .concurrency import AIMDController
+from .scheduler import BatchScheduler, UsernameCallback, build_batch_scheduler
+from .stopping import StopCondition
+
+
+DEFAULT_SHARD_SIZE = 100
+
+# One scheduler per worker process, built by _init_worker
+_worker_scheduler: Optional[BatchScheduler] = None
+
+
+def _init_worker(
+    platforms: Optional[List[str]],
+    timeout: int,
+    processes: int,
+    hedge: bool,
+    deadline: Optional[float],
+    stop: Optional[StopCondition],
+    shared_limits: bool,
+    adaptive: bool,
+) -> None:
+    """
+    Build the worker's own engine.
+    
+    Processes either draw from one shared budget (shared_limits), or each
+    gets 1/processes of every budget: platform, host and group rates,
+    bursts and quotas from the history (see RateLimiter's `share`).
+    Either way running N processes does not multiply the request rate
+    seen by any platform. With `adaptive`, each process adapts its own
+    per-platform concurrency.
+    """
+    global _worker_scheduler
+    if shared_limits:
+        rate_limiter = SharedRateLimiter(history=RequestHistory())
+    else:
+        rate_limiter = RateLimiter(history=RequestHistory(), share=processes)
+    _worker_scheduler = build_batch_scheduler(
+        rate_limiter,
+        platforms,
+        timeout,
+        hedge,
+        deadline=deadline,
+        stop=stop,
+        controller=AIMDController() if adaptive else None,
+    )
+
+
+def _run_shard(usernames: List[str]) -> Dict[str, Dict[str, CheckResult]]:
+    """Check one shard in the worker process."""
+    results = _worker_scheduler.run_many(usernames)
+    # Pool processes skip atexit handlers, so save after every shard
+    _worker_scheduler.rate_limiter.flush()
+    save_profiles(_worker_scheduler.checkers.values())
+    return results
+
+
+class ShardedRunner:
+    """
+    Shard a username list across a process pool.
+    
+    The list is cut into contiguous shards that worker processes check
+    with their own BatchScheduler, so response decoding and marker
+    scanning use every core. Shard results are merged back in input
+    order.
+    """
+    
+    def __init__(
+        self,
+        platforms: Optional[Sequence[str]] = None,
+        timeout: int = 8,
+        processes: Optional[int] = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        hedge: bool = False,
+        deadline: Optional[float] = None,
+        stop: Optional[StopCondition] = None,
+        shared_limits: bool = False,
+        adaptive: bool = False,
+    ):
+        self.platforms = list(platforms) if platforms else None
+        self.timeout = timeout
+        self.processes = max(1, processes or os.cpu_count() or 1)
+        self.shard_size = max(1, shard_size)
+        self.hedge = hedge
+        self.deadline = deadline
+        self.stop = stop
+        self.shared_limits = shared_limits
+        self.adaptive = adaptive
+    
+    def shard(self, usernames: Sequence[str]) -> List[List[str]]:
+        """Split usernames into contiguous shards."""
+        return [
+            list(usernames[i:i + self.shard_size])
+            for i in range(0, len(usernames), self.shard_size)
+        ]
+    
+    def run(
+        self,
+        usernames: Iterable[str],
+        on_complete: Optional[UsernameCallback] = None,
+    ) -> Dict[str, Dict[str, CheckResult]]:
+        """Check all usernames and return results in input order."""
+        shards = self.shard(list(dict.fromkeys(usernames)))
+        done: Dict[int, Dict[str, Dict[str, CheckResult]]] = {}
+        merged: Dict[str, Dict[str, CheckResult]] = {}
+        next_shard = 0
+        
+        with ProcessPoolExecutor(
+            max_workers=self.processes,
+            initializer=_init_worker,
+            initargs=(
+                self.platforms,
+                self.timeout,
+                self.processes,
+                self.hedge,
+                self.deadline,
+                self.stop,
+                self.shared_limits,
+                self.adaptive,
+            ),
+        ) as executor:
+            pending: Dict[Future, int] = {
+                executor.submit(_run_shard, shard): index
+                for index, shard in enumerate(shards)
+            }
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done[pending.pop(future)] = future.result()
+                
+                # Merge finished shards in input order
+                while next_shard in done:
+                    for username, results in done.pop(next_shard).items():
+                        merged[username] = results
+                        if on_complete:
+                            on_complete(username, results)
+                    next_shard += 1
+        
+        return merged
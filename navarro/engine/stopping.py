@@ -0,0 +1,50 @@
+"""Early-exit stop conditions for triage runs."""
+from typing import Dict, Iterable, List, Optional
+
+from navarro.core import CheckResult
+
+
+class StopCondition:
+    """
+    Decide when a username has been checked enough.
+    
+    - stop_after: stop once this many platforms report FOUND.
+    - until_found: stop once any of these platforms reports FOUND, or
+      all of them have reported without a hit. These platforms are
+      also dispatched first.
+    
+    Once met, the engines skip the username's pending checks and report
+    them as SKIPPED.
+    """
+    
+    def __init__(
+        self,
+        stop_after: Optional[int] = None,
+        until_found: Optional[Iterable[str]] = None,
+    ):
+        self.stop_after = stop_after
+        self.until_found = {p.lower() for p in until_found} if until_found else set()
+    
+    def __bool__(self) -> bool:
+        return bool(self.stop_after) or bool(self.until_found)
+    
+    def is_target(self, platform: str) -> bool:
+        return platform.lower() in self.until_found
+    
+    def prioritize(self, order: List[str]) -> List[str]:
+        """Move target platforms to the front, keeping relative order."""
+        return sorted(order, key=lambda name: not self.is_target(name))
+    
+    def is_met(self, results: Dict[str, CheckResult], platforms: Iterable[str]) -> bool:
+        """Evaluate the condition on one username's results so far."""
+        found = [name for name, result in results.items() if result == CheckResult.FOUND]
+        if self.stop_after and len(found) >= self.stop_after:
+            return True
+        
+        targets = [name for name in platforms if self.is_target(name)]
+        if targets:
+            if any(self.is_target(name) for name in found):
+                return True
+            if all(name in results for name in targets):
+                return True
+        return False
@@ -0,0 +1,181 @@
+"""Thread-pool engine for embedding Navarro in synchronous code."""
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, as_completed
+from typing import Dict, Iterator, Optional, Union
+
+from navarro.core import (
+    CheckContext,
+    CheckResult,
+    PlatformChecker,
+    RateLimiter,
+    SessionManager,
+)
+from navarro.core.profiles import save_profiles
+
+from .async_engine import DEFAULT_CONCURRENCY, ResultCallback
+from .concurrency import AIMDController
+from .ordering import CostYieldOrdering
+from .stopping import StopCondition
+
+
+class ThreadPoolEngine:
+    """
+    Run PlatformChecker.check for every platform on a thread pool.
+    
+    Same results and callback contract as AsyncEngine, without an event
+    loop. Checkers sleep out their own rate-limit delays on the worker
+    thread. The session manager's connection pools should be sized to
+    the worker count (see SessionManager(pool_size=...)).
+    
+    With a `deadline`, platforms not done in time are reported as
+    DEADLINE_EXCEEDED. Threads cannot be interrupted, but the deadline
+    travels in the CheckContext so running checks stop at their next
+    request. A met `stop` condition skips the remaining checks the same
+    way. A `controller` adapts the per-platform cap as in AsyncEngine.
+    """
+    
+    def __init__(
+        self,
+        checkers: Dict[str, PlatformChecker],
+        rate_limiter: RateLimiter,
+        session_manager: SessionManager,
+        workers: int = 8,
+        concurrency: Union[int, Dict[str, int]] = DEFAULT_CONCURRENCY,
+        deadline: Optional[float] = None,
+        ordering: Optional[CostYieldOrdering] = None,
+        stop: Optional[StopCondition] = None,
+        controller: Optional[AIMDController] = None,
+    ):
+        self.checkers = checkers
+        self.rate_limiter = rate_limiter
+        self.session_manager = session_manager
+        self.workers = max(1, workers)
+        self.concurrency = concurrency
+        self.deadline = deadline
+        self.ordering = ordering
+        self.stop = stop
+        self.controller = controller
+        self._semaphores: Dict[str, threading.Semaphore] = {}
+        self._conditions: Dict[str, threading.Condition] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    def get_concurrency(self, platform_key: str) -> int:
+        """Return the most checks a platform may ever have in flight."""
+        if self.controller is not None:
+            return self.controller.maximum
+        if isinstance(self.concurrency, dict):
+            return self.concurrency.get(platform_key, DEFAULT_CONCURRENCY)
+        return self.concurrency
+    
+    def _get_semaphore(self, platform_key: str) -> threading.Semaphore:
+        with self._lock:
+            if platform_key not in self._semaphores:
+                self._semaphores[platform_key] = threading.Semaphore(
+                    max(1, self.get_concurrency(platform_key))
+                )
+            return self._semaphores[platform_key]
+    
+    @contextmanager
+    def _slot(self, platform_key: str) -> Iterator[None]:
+        """Hold one of the platform's in-flight slots."""
+        if self.controller is None:
+            with self._get_semaphore(platform_key):
+                yield
+            return
+        
+        with self._lock:
+            condition = self._conditions.setdefault(platform_key, threading.Condition())
+        with condition:
+            condition.wait_for(lambda: self.controller.try_acquire(platform_key))
+        try:
+            yield
+        finally:
+            self.controller.release(platform_key)
+            with condition:
+                condition.notify_all()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="navarro",
+                )
+            return self._executor
+    
+    def _check_one(self, checker: PlatformChecker, context: CheckContext) -> CheckResult:
+        with self._slot(checker.platform_key):
+            if context.expired():
+                return CheckResult.DEADLINE_EXCEEDED
+            started = time.monotonic()
+            try:
+                result = checker.check(context.username, context)
+            except Exception:
+                result = CheckResult.UNKNOWN_ERROR
+            if self.ordering is not None:
+                self.ordering.record(checker, result, started)
+            if self.controller is not None:
+                self.controller.record(checker.platform_key, result)
+            return result
+    
+    def check(
+        self, username: str, on_result: Optional[ResultCallback] = None
+    ) -> Dict[str, CheckResult]:
+        """Check a username on all platforms, in registry order."""
+        executor = self._get_executor()
+        deadline_at = None if self.deadline is None else time.monotonic() + self.deadline
+        names = self.ordering.order(self.checkers) if self.ordering else list(self.checkers)
+        if self.stop:
+            names = self.stop.prioritize(names)
+        
+        contexts: Dict[str, CheckContext] = {}
+        futures: Dict[Future, str] = {}
+        for name in names:
+            contexts[name] = CheckContext(username, deadline=deadline_at)
+            futures[executor.submit(self._check_one, self.checkers[name], contexts[name])] = name
+        
+        finished: Dict[str, CheckResult] = {}
+        
+        def give_up(result: CheckResult) -> None:
+            # Unstarted checks are dropped, running ones stop at their next request
+            for future, name in futures.items():
+                if name not in finished:
+                    future.cancel()
+                    contexts[name].cancel()
+                    finished[name] = result
+                    if on_result:
+                        on_result(name, result)
+        
+        try:
+            for future in as_completed(futures, timeout=self.deadline):
+                name = futures[future]
+                if name in finished:
+                    continue
+                finished[name] = future.result()
+                if on_result:
+                    on_result(name, finished[name])
+                if self.stop and self.stop.is_met(finished, self.checkers):
+                    give_up(CheckResult.SKIPPED)
+                    break
+        except TimeoutError:
+            give_up(CheckResult.DEADLINE_EXCEEDED)
+        
+        return {name: finished[name] for name in self.checkers if name in finished}
+    
+    # Same entry point name as AsyncEngine.run
+    run = check
+    
+    def close(self):
+        """Shut down the pool, close sessions, save limits, statistics and byte profiles."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self.session_manager.close_all()
+        self.rate_limiter.flush()
+        if self.ordering is not None:
+            self.ordering.save()
+        save_profiles(self.checkers.values())
@@ -1,26 +1,24 @@
 """Platform checkers registry."""
-from typing import Dict, Type
+from typing import Dict, Iterable, Optional, Type
 
-from navarro.core import PlatformChecker, RateLimiter, SessionManager
+from navarro.core import ByteProfiles, PlatformChecker, RateLimiter, SessionManager
 
-# Import all platform checkers
-from .github import GitHubChecker
+from .rules import SITES_DIR, PlatformRegistry, checker_class_name
+
+# Hand-written checkers, for platforms a rule cannot describe
 from .gitlab import GitLabChecker
 from .reddit import RedditChecker
 from .instagram import InstagramChecker
 from .tiktok import TikTokChecker
-from .linkedin import LinkedInChecker
 from .pastebin import PastebinChecker
 from .telegram import TelegramChecker
 from .snapchat import SnapchatChecker
 from .strava import StravaChecker
-from .threads import ThreadsChecker
 from .mastodon import MastodonChecker
 from .bluesky import BlueskyChecker
 from .spotify import SpotifyChecker
 from .soundcloud import SoundCloudChecker
 from .youtube import YouTubeChecker
-from .medium import MediumChecker
 from .chessdotcom import ChessDotComChecker
 from .vk import VKChecker
 from .steam import SteamChecker
@@ -28,31 +26,26 @@ from .deviantart import DeviantArtChecker
 from .vimeo import VimeoChecker
 from .keybase import KeybaseChecker
 from .linktree import LinktreeChecker
-from .pinterest import PinterestChecker
 from .facebook import FacebookChecker
 
-# Platform registry - maps display names to checker classes
-# All 26 platforms migrated (excluding deprecated/removed ones)
-PLATFORM_REGISTRY: Dict[str, Type[PlatformChecker]] = {
-    "GitHub": GitHubChecker,
+# Platform registry - maps display names to checker classes. Platforms
+# that are just URLs, status rules and markers are rules in sites/*.json,
+# built into classes on first use.
+PLATFORM_REGISTRY = PlatformRegistry({
     "GitLab": GitLabChecker,
     "Reddit": RedditChecker,
     "Instagram": InstagramChecker,
     "Facebook": FacebookChecker,
     "TikTok": TikTokChecker,
-    "LinkedIn": LinkedInChecker,
-    "Pinterest": PinterestChecker,
     "Pastebin": PastebinChecker,
     "Telegram": TelegramChecker,
     "Snapchat": SnapchatChecker,
     "Strava": StravaChecker,
-    "Threads": ThreadsChecker,
     "Mastodon": MastodonChecker,
     "Bluesky": BlueskyChecker,
     "Spotify": SpotifyChecker,
     "SoundCloud": SoundCloudChecker,
     "YouTube": YouTubeChecker,
-    "Medium": MediumChecker,
     "Chess.com": ChessDotComChecker,
     "Keybase": KeybaseChecker,
     "Linktree": LinktreeChecker,
@@ -60,7 +53,15 @@ PLATFORM_REGISTRY: Dict[str, Type[PlatformChecker]] = {
     "Steam": SteamChecker,
     "DeviantArt": DeviantArtChecker,
     "Vimeo": VimeoChecker,
-}
+}, [SITES_DIR])
+
+
+def __getattr__(name: str) -> Type[PlatformChecker]:
+    """Rule-built checker classes by class name, e.g. GitHubChecker."""
+    for platform in PLATFORM_REGISTRY.rules():
+        if checker_class_name(platform) == name:
+            return PLATFORM_REGISTRY[platform]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_platform_checker(
@@ -77,15 +78,46 @@ def get_platform_checker(
 
 def get_all_checkers(
     rate_limiter: RateLimiter, 
-    session_manager: SessionManager
+    session_manager: SessionManager,
+    platforms: Optional[Iterable[str]] = None,
 ) -> Dict[str, PlatformChecker]:
-    """Get instances of all registered platform checkers."""
+    """
+    Get instances of all registered platform checkers.
+    If platforms is given, only those (case-insensitive) are returned.
+    """
+    wanted = {p.lower() for p in platforms} if platforms else None
+    # Only the wanted rules are built into classes
     return {
-        name: checker_class(rate_limiter, session_manager)
-        for name, checker_class in PLATFORM_REGISTRY.items()
+        name: PLATFORM_REGISTRY[name](rate_limiter, session_manager)
+        for name in PLATFORM_REGISTRY
+        if wanted is None or name.lower() in wanted
     }
 
 
+def build_checkers(
+    rate_limiter: RateLimiter,
+    session_manager: SessionManager,
+    platforms: Optional[Iterable[str]] = None,
+    timeout: int = 8,
+    hedge: bool = False,
+) -> Dict[str, PlatformChecker]:
+    """
+    Instantiate checkers, filtered to the requested platforms, and set
+    them up for a run.
+    
+    All of them share one ByteProfiles, which the engines save on close.
+    """
+    checkers = get_all_checkers(rate_limiter, session_manager, platforms)
+    byte_profiles = ByteProfiles()
+    
+    for checker in checkers.values():
+        checker.timeout = timeout
+        checker.hedge = hedge
+        checker.byte_profiles = byte_profiles
+    
+    return checkers
+
+
 def list_platforms() -> list:
     """List all available platforms."""
-    return list(PLATFORM_REGISTRY.keys())
+    return list(PLATFORM_REGISTRY)
@@ -1,6 +1,5 @@
 """Chess.com username checker."""
 from navarro.core.base import PlatformChecker
-from navarro.core.enums import CheckResult
 from .mixins import SingleURLMixin
 
 
@@ -9,17 +8,14 @@ class ChessDotComChecker(SingleURLMixin, PlatformChecker):
     
     platform_name = "Chess.com"
     platform_key = "chessdotcom"
+    STATUS_PROBE = "GET"
     URL_PATTERN = "https://www.chess.com/member/{username}"
     
-    def detect_found(self, response) -> bool:
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
         text = response.text.lower()
-        return self._current_username.lower() in text and "chess.com" in text
+        return context is not None and context.username.lower() in text and "chess.com" in text
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         return response.status_code == 404
-    
-    def check(self, username: str) -> CheckResult:
-        self._current_username = username
-        return super().check(username)
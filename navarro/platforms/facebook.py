@@ -1,8 +1,18 @@
 """Facebook username checker - complex with Graph API fallback."""
 import re
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
 import requests
 from navarro.core.base import PlatformChecker
+from navarro.core.context import CheckContext
 from navarro.core.enums import CheckResult
+from navarro.core.hedging import run_hedged
+
+
+class _RateLimited(Exception):
+    """A Facebook host answered with a rate limit."""
 
 
 class FacebookChecker(PlatformChecker):
@@ -10,17 +20,31 @@ class FacebookChecker(PlatformChecker):
     Facebook username checker.
     
     Strategy:
-    1. Try Graph API first (fastest when it works)
-    2. For usernames with periods/hyphens, use direct URL check
+    1. Probe Graph API and direct URL concurrently, first positive wins
+    2. For usernames with periods/hyphens, also try the cleaned name
     3. Use negative detection (look for "not found" indicators)
     """
     
     platform_name = "Facebook"
     platform_key = "facebook"
     
+    # Graph + direct, for the raw and the cleaned name
+    REQUEST_COST = 4
+    
+    # graph.facebook.com and www.facebook.com have their own limits,
+    # under a budget for Facebook as a whole
+    RATE_SCOPE = "both"
+    RATE_GROUP = "meta"
+    
     # User agent that works with Facebook
     FB_UA = {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) Chrome/125.0.0.0"}
     
+    # Concurrent requests per Facebook host (graph / www)
+    HOST_CONCURRENCY = 1
+    
+    # Memoized probe outcomes kept per checker instance
+    MEMO_SIZE = 4096
+    
     NOT_FOUND_INDICATORS = [
         "This content isn't available right now",
         "This page isn't available",
@@ -49,36 +73,66 @@ class FacebookChecker(PlatformChecker):
     def get_profile_url(self, username: str) -> str:
         return f"https://www.facebook.com/{username}"
     
-    def detect_found(self, response) -> bool:
+    def detect_found(self, response, context=None) -> bool:
         # Not used directly - custom check() method handles this
         return False
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         # Not used directly - custom check() method handles this
         return False
     
-    def _graph_api_check(self, session, username: str) -> bool:
-        """Try Graph API picture endpoint."""
+    def __init__(self, rate_limiter, session_manager):
+        super().__init__(rate_limiter, session_manager)
+        # Probe outcomes by (kind, slug), shared by all checks on this
+        # instance so john.doe and johndoe only pay for "johndoe" once
+        self._outcomes: "OrderedDict[Tuple[str, str], bool]" = OrderedDict()
+        self._outcomes_lock = threading.Lock()
+        # In-flight cap per Facebook host, across concurrent checks
+        self._host_slots = {
+            kind: threading.Semaphore(self.HOST_CONCURRENCY) for kind in ("graph", "direct")
+        }
+    
+    def _get(self, session, url: str, context: CheckContext) -> requests.Response:
+        """
+        Rate-limited GET with Facebook's UA, without touching shared session headers.
+        
+        Raises _RateLimited on a rate limit, and HTTPError on a server
+        error, so neither is taken for a missing profile.
+        """
+        if not self.wait_turn(context, url):
+            raise requests.exceptions.Timeout("check deadline reached")
+        response = session.get(url, timeout=self.request_timeout(context), headers=self.FB_UA)
+        rate_limited = self.check_rate_limit_headers(response)
+        self.record_response(url, response, was_rate_limited=rate_limited)
+        if rate_limited:
+            context.add_evidence(f"GET {url} -> {response.status_code} (rate limited)")
+            raise _RateLimited(url)
+        if response.status_code >= 500:
+            raise requests.exceptions.HTTPError(f"{response.status_code} from {url}")
+        return response
+    
+    def _graph_api_check(self, session, username: str, context: CheckContext) -> Optional[bool]:
+        """Try Graph API picture endpoint. None if the probe failed."""
         url = f"https://graph.facebook.com/{username}/picture?type=normal&redirect=false"
         try:
-            r = session.get(url, timeout=self.timeout)
+            r = self._get(session, url, context)
             if r.status_code == 200:
                 data = r.json().get("data", {})
-                return (
+                return bool(
                     isinstance(data, dict) and
                     data.get("url") and
                     data.get("width") and
                     "facebook.com" in data.get("url", "")
                 )
+            return False
         except (ValueError, requests.RequestException):
-            pass
-        return False
+            return None
     
-    def _direct_check(self, session, username: str) -> bool:
-        """Check direct profile URL."""
+    def _direct_check(self, session, username: str, context: CheckContext) -> Optional[bool]:
+        """Check direct profile URL. None if the probe failed."""
         url = f"https://www.facebook.com/{username}"
         try:
-            r = session.get(url, timeout=self.timeout)
+            r = self._get(session, url, context)
             if r.status_code != 200:
                 return False
             
@@ -107,32 +161,88 @@ class FacebookChecker(PlatformChecker):
                 return has_basic_structure
             else:
                 return has_url_match or '"userID":"' in text or '"pageID":"' in text
-            
+        
         except requests.RequestException:
-            return False
+            return None
     
-    def check(self, username: str) -> CheckResult:
-        """Custom check with Graph API + direct fallback."""
-        session = self.session_manager.get_session(self.platform_key)
-        session.headers.update(self.FB_UA)
+    def _probe(self, session, kind: str, slug: str, context: CheckContext) -> Optional[bool]:
+        """Run one probe, memoizing definitive outcomes. Raises _RateLimited."""
+        key = (kind, slug)
+        with self._outcomes_lock:
+            if key in self._outcomes:
+                self._outcomes.move_to_end(key)
+                return self._outcomes[key]
         
-        self.rate_limiter.record_request(self.platform_key)
+        probe = self._graph_api_check if kind == "graph" else self._direct_check
+        outcome = probe(session, slug, context)
         
-        # 1. Try Graph API
-        if self._graph_api_check(session, username):
-            return CheckResult.FOUND
+        if outcome is not None:
+            with self._outcomes_lock:
+                self._outcomes[key] = outcome
+                while len(self._outcomes) > self.MEMO_SIZE:
+                    self._outcomes.popitem(last=False)
+        return outcome
+    
+    def _lane(
+        self,
+        session,
+        kind: str,
+        slugs: List[str],
+        context: CheckContext,
+        cancel: threading.Event,
+        limited: threading.Event,
+    ) -> bool:
+        """
+        Probe one host for each slug in turn, until a hit or cancellation.
+        
+        A rate-limited host ends the lane and sets `limited`.
+        """
+        with self._host_slots[kind]:
+            for slug in slugs:
+                if cancel.is_set() or context.expired():
+                    return False
+                try:
+                    if self._probe(session, kind, slug, context):
+                        return True
+                except _RateLimited:
+                    limited.set()
+                    return False
+        return False
+    
+    def check(self, username: str, context: Optional[CheckContext] = None) -> CheckResult:
+        """
+        Custom check with Graph API + direct probes.
         
-        # 2. Try Graph API with cleaned username
+        The graph and direct hosts are probed concurrently, each for the
+        raw then the cleaned username, and the first positive wins.
+        Without one, a rate-limited host makes the result RATE_LIMITED.
+        """
+        if context is None:
+            context = CheckContext(username)
+        
+        session = self.session_manager.get_session(self.platform_key)
+        
+        slugs = [username]
         cleaned = re.sub(r"[.\-]", "", username)
-        if cleaned != username and self._graph_api_check(session, cleaned):
-            return CheckResult.FOUND
+        if cleaned != username:
+            slugs.append(cleaned)
         
-        # 3. Direct check
-        if self._direct_check(session, username):
-            return CheckResult.FOUND
+        kinds = ["graph", "direct"]
+        limited = threading.Event()
+        results = run_hedged(
+            [
+                lambda cancel, kind=kind: self._lane(session, kind, slugs, context, cancel, limited)
+                for kind in kinds
+            ],
+            bool,
+        )
         
-        # 4. Direct check with cleaned username
-        if cleaned != username and self._direct_check(session, cleaned):
+        if any(results):
+            context.add_evidence(f"{kinds[results.index(True)]} probe matched")
             return CheckResult.FOUND
+        if limited.is_set():
+            return CheckResult.RATE_LIMITED
+        if context.expired():
+            return CheckResult.DEADLINE_EXCEEDED
         
         return CheckResult.NOT_FOUND
@@ -9,13 +9,14 @@ class GitLabChecker(SingleURLMixin, PlatformChecker):
     
     platform_name = "GitLab"
     platform_key = "gitlab"
+    STATUS_PROBE = "GET"
     URL_PATTERN = "https://gitlab.com/{username}"
     
-    def detect_found(self, response) -> bool:
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
         # GitLab has username in h1 tag
         return bool(re.search(r'<h1>[\w\-]+', response.text))
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         return response.status_code == 404
@@ -8,6 +8,7 @@ class InstagramChecker(SingleURLMixin, PlatformChecker):
     
     platform_name = "Instagram"
     platform_key = "instagram"
+    RATE_GROUP = "meta"
     URL_PATTERN = "https://www.instagram.com/{username}/"
     
     # JSON-like patterns in Instagram's HTML
@@ -26,17 +27,21 @@ class InstagramChecker(SingleURLMixin, PlatformChecker):
         "this page is not available",
     ]
     
-    def detect_found(self, response) -> bool:
+    # Pages run to MBs; stop at a not-found marker or profile data
+    EARLY_EXIT_MARKERS = NOT_FOUND_MARKERS + [
+        '"profile_pic_url"',
+        '"edge_owner_to_timeline_media"',
+    ]
+    
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
-        text = response.text
         # Must have found markers AND not have not-found markers
-        has_found = any(marker in text for marker in self.FOUND_MARKERS)
-        has_not_found = any(marker in text for marker in self.NOT_FOUND_MARKERS)
+        has_found = self.has_marker(response, "found")
+        has_not_found = self.has_marker(response, "not_found")
         return has_found and not has_not_found
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         if response.status_code == 404:
             return True
-        text = response.text
-        return any(marker in text for marker in self.NOT_FOUND_MARKERS)
+        return self.has_marker(response, "not_found")
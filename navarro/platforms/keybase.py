@@ -22,15 +22,14 @@ class KeybaseChecker(SingleURLMixin, PlatformChecker):
         "404",
     ]
     
-    def detect_found(self, response) -> bool:
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
-        text = response.text
-        if any(marker in text for marker in self.NOT_FOUND_MARKERS):
+        if self.has_marker(response, "not_found"):
             return False
-        return any(marker in text for marker in self.FOUND_MARKERS)
+        return self.has_marker(response, "found")
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return True
-        return any(marker in response.text for marker in self.NOT_FOUND_MARKERS)
+        return self.has_marker(response, "not_found")
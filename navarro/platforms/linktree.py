@@ -1,6 +1,5 @@
 """Linktree username checker."""
 from navarro.core.base import PlatformChecker
-from navarro.core.enums import CheckResult
 from .mixins import SingleURLMixin
 
 
@@ -16,19 +15,17 @@ class LinktreeChecker(SingleURLMixin, PlatformChecker):
         "404",
     ]
     
-    def detect_found(self, response) -> bool:
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
         text = response.text
-        if any(marker in text for marker in self.NOT_FOUND_MARKERS):
+        if self.has_marker(response, "not_found"):
             return False
-        return self._current_username.lower() in text.lower() or "linktr.ee" in text.lower()
+        return (
+            context is not None and context.username.lower() in text.lower()
+        ) or "linktr.ee" in text.lower()
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return True
-        return any(marker in response.text for marker in self.NOT_FOUND_MARKERS)
-    
-    def check(self, username: str) -> CheckResult:
-        self._current_username = username
-        return super().check(username)
+        return self.has_marker(response, "not_found")
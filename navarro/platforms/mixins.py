@@ -1,7 +1,9 @@
 """Mixins for common platform check patterns."""
-from typing import List
+from typing import List, Optional
 import requests
 
+from navarro.core.context import CheckContext
+
 
 class SingleURLMixin:
     """
@@ -42,15 +44,17 @@ class SimpleTextMarkerMixin:
     FOUND_MARKERS: List[str] = []
     NOT_FOUND_MARKERS: List[str] = []
     
-    def detect_found(self, response: requests.Response) -> bool:
+    def detect_found(
+        self, response: requests.Response, context: Optional[CheckContext] = None
+    ) -> bool:
         if response.status_code != 200:
             return False
-        text = response.text
-        return any(marker in text for marker in self.FOUND_MARKERS)
+        return self.has_marker(response, "found")
     
-    def detect_not_found(self, response: requests.Response) -> bool:
-        text = response.text
-        return any(marker in text for marker in self.NOT_FOUND_MARKERS)
+    def detect_not_found(
+        self, response: requests.Response, context: Optional[CheckContext] = None
+    ) -> bool:
+        return self.has_marker(response, "not_found")
 
 
 class JSONMarkerMixin:
@@ -61,25 +65,37 @@ class JSONMarkerMixin:
     JSON_FOUND_PATTERNS: List[str] = []
     JSON_NOT_FOUND_PATTERNS: List[str] = []
     
-    def detect_found(self, response: requests.Response) -> bool:
+    def detect_found(
+        self, response: requests.Response, context: Optional[CheckContext] = None
+    ) -> bool:
         if response.status_code != 200:
             return False
-        text = response.text
-        return any(pattern in text for pattern in self.JSON_FOUND_PATTERNS)
+        return self.has_marker(response, "found")
     
-    def detect_not_found(self, response: requests.Response) -> bool:
-        text = response.text
-        return any(pattern in text for pattern in self.JSON_NOT_FOUND_PATTERNS)
+    def detect_not_found(
+        self, response: requests.Response, context: Optional[CheckContext] = None
+    ) -> bool:
+        return self.has_marker(response, "not_found")
 
 
 class StatusCodeMixin:
     """
     For platforms where status code alone determines result.
-    200 = found, 404 = not found.
+    200 = found, 404 = not found, both from a HEAD request. Platforms
+    that need the body on a 200 should probe with "GET" instead, so the
+    same response is read rather than fetched twice.
     """
     
-    def detect_found(self, response: requests.Response) -> bool:
+    STATUS_PROBE = "HEAD"
+    FOUND_STATUSES = (200,)
+    NOT_FOUND_STATUSES = (404,)
+    
+    def detect_found(
+        self, response: requests.Response, context: Optional[CheckContext] = None
+    ) -> bool:
         return response.status_code == 200
     
-    def detect_not_found(self, response: requests.Response) -> bool:
+    def detect_not_found(
+        self, response: requests.Response, context: Optional[CheckContext] = None
+    ) -> bool:
         return response.status_code == 404
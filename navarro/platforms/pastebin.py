@@ -8,12 +8,13 @@ class PastebinChecker(SingleURLMixin, PlatformChecker):
     
     platform_name = "Pastebin"
     platform_key = "pastebin"
+    STATUS_PROBE = "GET"
     URL_PATTERN = "https://pastebin.com/u/{username}"
     
-    def detect_found(self, response) -> bool:
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
         return "pastebin.com" in response.text.lower()
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         return response.status_code == 404
@@ -24,16 +24,15 @@ class RedditChecker(SingleURLMixin, PlatformChecker):
         "This account has been suspended",
     ]
     
-    def detect_found(self, response) -> bool:
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
-        text = response.text
         # Check for found markers but not not-found markers
-        has_found = any(marker in text for marker in self.FOUND_MARKERS)
-        has_not_found = any(marker in text for marker in self.NOT_FOUND_MARKERS)
+        has_found = self.has_marker(response, "found")
+        has_not_found = self.has_marker(response, "not_found")
         return has_found and not has_not_found
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         if response.status_code == 404:
             return True
         text = response.text.lower()
@@ -0,0 +1,259 @@
+"""Platform checkers built from declarative JSON rules."""
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Type, Union
+
+from navarro.core import CheckResult, PlatformChecker
+from navarro.core.base import RATE_GROUPS
+
+
+# Rule files shipped with navarro, one or more sites per file
+SITES_DIR = Path(__file__).with_name("sites")
+
+RULE_KEYS = frozenset({
+    "key",
+    "url",
+    "urls",
+    "status",
+    "probe",
+    "redirects",
+    "found",
+    "not_found",
+    "early_exit",
+    "rate",
+    "burst",
+    "rate_scope",
+    "rate_group",
+    "cost",
+})
+
+# What a status code means: settle the check, or look at the markers
+STATUS_ACTIONS = ("found", "not_found", "markers")
+
+DEFAULT_STATUS = {"404": "not_found", "other": "markers"}
+
+RATE_SCOPES = ("platform", "host", "both")
+
+REDIRECT_RESULTS = {
+    "found": CheckResult.FOUND,
+    "not_found": CheckResult.NOT_FOUND,
+    "rate_limited": CheckResult.RATE_LIMITED,
+}
+
+
+class RuleChecker(PlatformChecker):
+    """
+    Base for checkers generated from rules.
+    
+    A rule maps onto the usual class attributes: `url`/`urls` become
+    URL_PATTERNS, `found`/`not_found` the marker lists, `redirects`
+    REDIRECT_RULES and `probe` STATUS_PROBE. `status` maps status codes
+    (or "other") to "found", "not_found" or "markers". With "markers"
+    a not-found marker means not found, and a found marker on a 200
+    means found. `early_exit` lists found markers strong enough to stop
+    reading at; the not-found markers then stop reads too.
+    """
+    
+    URL_PATTERNS: List[str] = []
+    STATUS_RULES: Dict[str, str] = DEFAULT_STATUS
+    FOUND_MARKERS: List[str] = []
+    NOT_FOUND_MARKERS: List[str] = []
+    
+    def get_urls(self, username: str) -> List[str]:
+        return [pattern.format(username=username) for pattern in self.URL_PATTERNS]
+    
+    def status_action(self, status_code: int) -> str:
+        """What the rule does with a status code."""
+        return self.STATUS_RULES.get(str(status_code), self.STATUS_RULES.get("other", "markers"))
+    
+    def detect_found(self, response, context=None) -> bool:
+        action = self.status_action(response.status_code)
+        if action == "markers":
+            return response.status_code == 200 and self.has_marker(response, "found")
+        return action == "found"
+    
+    def detect_not_found(self, response, context=None) -> bool:
+        action = self.status_action(response.status_code)
+        if action == "markers":
+            return self.has_marker(response, "not_found")
+        return action == "not_found"
+
+
+def checker_class_name(platform: str) -> str:
+    """Class name of a rule's checker, e.g. GitHubChecker."""
+    return re.sub(r"[^0-9A-Za-z]", "", platform) + "Checker"
+
+
+def _is_strings(value) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) and item for item in value)
+
+
+def validate_rule(name: str, rule: dict) -> None:
+    """Raise ValueError if the rule is malformed."""
+    if not isinstance(rule, dict):
+        raise ValueError(f"Rule {name!r} must be an object")
+    unknown = set(rule) - RULE_KEYS
+    if unknown:
+        raise ValueError(f"Rule {name!r} has unknown keys: {', '.join(sorted(unknown))}")
+    if "url" in rule and not (isinstance(rule["url"], str) and rule["url"]):
+        raise ValueError(f"Rule {name!r}: url must be a string")
+    if "urls" in rule and not _is_strings(rule["urls"]):
+        raise ValueError(f"Rule {name!r}: urls must be a list of strings")
+    if not rule.get("url") and not rule.get("urls"):
+        raise ValueError(f"Rule {name!r} needs a url or urls")
+    for pattern in rule.get("urls") or [rule["url"]]:
+        try:
+            pattern.format(username="x")
+        except (KeyError, IndexError, ValueError):
+            raise ValueError(f"Rule {name!r}: url {pattern!r} may only use {{username}}")
+        if "{username}" not in pattern:
+            raise ValueError(f"Rule {name!r}: url {pattern!r} must contain {{username}}")
+    for key in ("found", "not_found", "early_exit"):
+        if key in rule and not _is_strings(rule[key]):
+            raise ValueError(f"Rule {name!r}: {key} must be a list of strings")
+    if not isinstance(rule.get("status", {}), dict):
+        raise ValueError(f"Rule {name!r}: status must be an object")
+    for code, action in rule.get("status", {}).items():
+        if code != "other" and not code.isdigit():
+            raise ValueError(f"Rule {name!r}: status {code!r} must be a status code or 'other'")
+        if action not in STATUS_ACTIONS:
+            raise ValueError(f"Rule {name!r}: unknown action {action!r} for status {code}")
+    if not isinstance(rule.get("redirects", {}), dict):
+        raise ValueError(f"Rule {name!r}: redirects must be an object")
+    for prefix, result in rule.get("redirects", {}).items():
+        if result not in REDIRECT_RESULTS:
+            raise ValueError(f"Rule {name!r}: unknown result {result!r} for redirect {prefix}")
+    if rule.get("probe") not in (None, "HEAD", "GET"):
+        raise ValueError(f"Rule {name!r}: probe must be HEAD or GET")
+    if rule.get("rate_scope", "platform") not in RATE_SCOPES:
+        raise ValueError(f"Rule {name!r}: rate_scope must be one of {', '.join(RATE_SCOPES)}")
+    if rule.get("rate_group") is not None and rule["rate_group"] not in RATE_GROUPS:
+        raise ValueError(f"Rule {name!r}: unknown rate_group {rule['rate_group']!r}")
+    for key in ("rate", "burst", "cost"):
+        value = rule.get(key)
+        if value is not None and (
+            isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0
+        ):
+            raise ValueError(f"Rule {name!r}: {key} must be a positive number")
+    if "key" in rule and not (isinstance(rule["key"], str) and rule["key"]):
+        raise ValueError(f"Rule {name!r}: key must be a string")
+
+
+def load_rules(path: Union[str, Path]) -> Dict[str, dict]:
+    """Read and validate rules from a JSON file, or every file in a directory."""
+    path = Path(path)
+    files = sorted(path.glob("*.json")) if path.is_dir() else [path]
+    rules: Dict[str, dict] = {}
+    for file in files:
+        with open(file, 'r') as f:
+            for name, rule in json.load(f).items():
+                validate_rule(name, rule)
+                rules[name] = rule
+    return rules
+
+
+def rule_checker_class(name: str, rule: dict) -> Type[RuleChecker]:
+    """Build the checker class for a rule."""
+    status = {**DEFAULT_STATUS, **rule.get("status", {})}
+    not_found = list(rule.get("not_found", []))
+    early_exit = rule.get("early_exit", [])
+    attributes = {
+        "__doc__": f"{name} username checker.",
+        "__module__": __name__,
+        "platform_name": name,
+        "platform_key": rule.get("key", name.lower()),
+        "URL_PATTERNS": list(rule.get("urls") or [rule["url"]]),
+        "STATUS_RULES": status,
+        "FOUND_MARKERS": list(rule.get("found", [])),
+        "NOT_FOUND_MARKERS": not_found,
+        "EARLY_EXIT_MARKERS": not_found + list(early_exit) if early_exit else [],
+        "STATUS_PROBE": rule.get("probe"),
+        "FOUND_STATUSES": tuple(
+            int(code) for code, action in status.items() if code != "other" and action == "found"
+        ),
+        "NOT_FOUND_STATUSES": tuple(
+            int(code) for code, action in status.items() if code != "other" and action == "not_found"
+        ),
+        "REDIRECT_RULES": [
+            (prefix, REDIRECT_RESULTS[result]) for prefix, result in rule.get("redirects", {}).items()
+        ],
+        "REQUEST_COST": rule.get("cost"),
+        "RATE": rule.get("rate"),
+        "BURST": rule.get("burst"),
+        "RATE_SCOPE": rule.get("rate_scope", "platform"),
+        "RATE_GROUP": rule.get("rate_group"),
+    }
+    return type(RuleChecker)(checker_class_name(name), (RuleChecker,), attributes)
+
+
+class PlatformRegistry(Mapping[str, Type[PlatformChecker]]):
+    """
+    Checker classes by display name.
+    
+    Hand-written classes come first. Rule files are only read when a
+    name is first needed, and each rule is built into its class (and
+    compiled into its MarkerSet) the first time it is looked up, so
+    hundreds of rules cost nothing until used. A class registered under
+    the same name as a rule wins over it.
+    """
+    
+    def __init__(
+        self,
+        classes: Mapping[str, Type[PlatformChecker]],
+        rule_paths: Iterable[Union[str, Path]] = (),
+    ):
+        self._classes: Dict[str, Type[PlatformChecker]] = dict(classes)
+        self._builtin = list(classes)
+        self._paths = [Path(path) for path in rule_paths]
+        self._added: Dict[str, dict] = {}
+        self._rules: Optional[Dict[str, dict]] = None
+        self._lock = threading.RLock()
+    
+    def add_rules(self, path: Union[str, Path]) -> None:
+        """
+        Add a rule file or directory; its rules override earlier ones.
+        
+        Unlike the constructor's paths, the file is read straight away,
+        so a missing or malformed file fails here.
+        """
+        rules = load_rules(path)
+        with self._lock:
+            self._added.update(rules)
+            if self._rules is not None:
+                self._rules.update(rules)
+                for name in rules:
+                    if name not in self._builtin:
+                        self._classes.pop(name, None)
+    
+    def rules(self) -> Dict[str, dict]:
+        """Every rule, read on first use."""
+        with self._lock:
+            if self._rules is None:
+                rules: Dict[str, dict] = {}
+                for path in self._paths:
+                    rules.update(load_rules(path))
+                rules.update(self._added)
+                self._rules = rules
+            return self._rules
+    
+    def __getitem__(self, name: str) -> Type[PlatformChecker]:
+        with self._lock:
+            checker_class = self._classes.get(name)
+            if checker_class is None:
+                checker_class = rule_checker_class(name, self.rules()[name])
+                self._classes[name] = checker_class
+            return checker_class
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from self._builtin
+        for name in self.rules():
+            if name not in self._builtin:
+                yield name
+    
+    def __len__(self) -> int:
+        return len(self._builtin) + sum(1 for name in self.rules() if name not in self._builtin)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._builtin or name in self.rules()
@@ -8,12 +8,13 @@ class SnapchatChecker(SingleURLMixin, PlatformChecker):
     
     platform_name = "Snapchat"
     platform_key = "snapchat"
+    STATUS_PROBE = "GET"
     URL_PATTERN = "https://www.snapchat.com/add/{username}"
     
-    def detect_found(self, response) -> bool:
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
         return 'Snapcode' in response.text
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         return response.status_code == 404 or 'Snapcode' not in response.text
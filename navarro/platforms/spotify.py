@@ -1,6 +1,5 @@
 """Spotify username checker."""
 from navarro.core.base import PlatformChecker
-from navarro.core.enums import CheckResult
 from .mixins import SingleURLMixin
 
 
@@ -9,16 +8,13 @@ class SpotifyChecker(SingleURLMixin, PlatformChecker):
     
     platform_name = "Spotify"
     platform_key = "spotify"
+    STATUS_PROBE = "GET"
     URL_PATTERN = "https://open.spotify.com/user/{username}"
     
-    def detect_found(self, response) -> bool:
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
-        return self._current_username.lower() in response.text.lower()
+        return context is not None and context.username.lower() in response.text.lower()
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         return response.status_code == 404
-    
-    def check(self, username: str) -> CheckResult:
-        self._current_username = username
-        return super().check(username)
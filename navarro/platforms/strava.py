@@ -1,6 +1,5 @@
 """Strava username checker."""
 from navarro.core.base import PlatformChecker
-from navarro.core.enums import CheckResult
 from .mixins import SingleURLMixin
 
 
@@ -9,17 +8,14 @@ class StravaChecker(SingleURLMixin, PlatformChecker):
     
     platform_name = "Strava"
     platform_key = "strava"
+    STATUS_PROBE = "GET"
     URL_PATTERN = "https://www.strava.com/athletes/{username}"
     
-    def detect_found(self, response) -> bool:
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
         text = response.text
-        return "Athlete" in text or self._current_username in text
+        return "Athlete" in text or (context is not None and context.username in text)
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         return response.status_code == 404
-    
-    def check(self, username: str) -> CheckResult:
-        self._current_username = username
-        return super().check(username)
@@ -11,7 +11,10 @@ class TelegramChecker(SingleURLMixin, PlatformChecker):
     platform_key = "telegram"
     URL_PATTERN = "https://t.me/{username}"
     
-    def detect_found(self, response) -> bool:
+    # Invalid usernames redirect to telegram.org
+    REDIRECT_RULES = [("https://telegram.org", CheckResult.NOT_FOUND)]
+    
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
         
@@ -20,7 +23,8 @@ class TelegramChecker(SingleURLMixin, PlatformChecker):
             return False
         
         text = response.text
-        username = self._current_username
+        # Without a context the username is unknown and never matches
+        username = context.username if context is not None else None
         
         # Structured data
         if '"@type":"Person"' in text or '"@type":"Organization"' in text:
@@ -34,19 +38,14 @@ class TelegramChecker(SingleURLMixin, PlatformChecker):
         # Meta tags with username
         has_title = 'property="og:title"' in text
         has_desc = 'property="og:description"' in text
-        if has_title and has_desc and username.lower() in text.lower():
+        if has_title and has_desc and username and username.lower() in text.lower():
             return True
         
         return False
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         if response.status_code == 404:
             return True
         if response.url.startswith('https://telegram.org'):
             return True
         return False
-    
-    def check(self, username: str) -> CheckResult:
-        """Override to store username for detection."""
-        self._current_username = username
-        return super().check(username)
@@ -24,16 +24,20 @@ class TikTokChecker(SingleURLMixin, PlatformChecker):
         '"statusCode":10202',
     ]
     
-    def detect_found(self, response) -> bool:
+    # Pages run to MBs; stop at a not-found marker or the user stats
+    EARLY_EXIT_MARKERS = NOT_FOUND_MARKERS + [
+        '"followerCount":',
+    ]
+    
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
-        text = response.text
         # Check not-found first
-        if any(marker in text for marker in self.NOT_FOUND_MARKERS):
+        if self.has_marker(response, "not_found"):
             return False
-        return any(pattern in text for pattern in self.FOUND_PATTERNS)
+        return self.has_marker(response, "found")
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         if response.status_code == 404:
             return True
-        return any(marker in response.text for marker in self.NOT_FOUND_MARKERS)
+        return self.has_marker(response, "not_found")
@@ -1,6 +1,5 @@
 """VK username checker."""
 from navarro.core.base import PlatformChecker
-from navarro.core.enums import CheckResult
 from .mixins import SingleURLMixin
 
 
@@ -19,7 +18,7 @@ class VKChecker(SingleURLMixin, PlatformChecker):
         "has been deleted",
     ]
     
-    def detect_found(self, response) -> bool:
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
         text = response.text.lower()
@@ -29,13 +28,9 @@ class VKChecker(SingleURLMixin, PlatformChecker):
         # Profile markers
         if '<div class="page_name"' in response.text or "wall_tab_all" in response.text:
             return True
-        return self._current_username.lower() in text
+        return context is not None and context.username.lower() in text
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return True
         return any(marker.lower() in response.text.lower() for marker in self.NOT_FOUND_MARKERS)
-    
-    def check(self, username: str) -> CheckResult:
-        self._current_username = username
-        return super().check(username)
@@ -8,6 +8,7 @@ class YouTubeChecker(MultiURLMixin, PlatformChecker):
     
     platform_name = "YouTube"
     platform_key = "youtube"
+    BURST = 3
     URL_PATTERNS = [
         "https://www.youtube.com/@{username}",
         "https://www.youtube.com/c/{username}",
@@ -28,15 +29,19 @@ class YouTubeChecker(MultiURLMixin, PlatformChecker):
         "404 Not Found",
     ]
     
-    def detect_found(self, response) -> bool:
+    # Pages run to MBs; stop at a not-found marker or the channel id
+    EARLY_EXIT_MARKERS = NOT_FOUND_MARKERS + [
+        '"externalId":"UC',
+    ]
+    
+    def detect_found(self, response, context=None) -> bool:
         if response.status_code != 200:
             return False
-        text = response.text
-        if any(marker in text for marker in self.NOT_FOUND_MARKERS):
+        if self.has_marker(response, "not_found"):
             return False
-        return any(marker in text for marker in self.FOUND_MARKERS)
+        return self.has_marker(response, "found")
     
-    def detect_not_found(self, response) -> bool:
+    def detect_not_found(self, response, context=None) -> bool:
         if response.status_code == 404:
             return True
-        return any(marker in response.text for marker in self.NOT_FOUND_MARKERS)
+        return self.has_marker(response, "not_found")
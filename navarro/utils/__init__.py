@@ -0,0 +1,21 @@
+"""Shared helpers."""
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def atomic_write_json(path: Path, data: Any, **kwargs) -> None:
+    """
+    Write JSON to a temp file next to `path` and swap it in, so readers
+    and concurrent writers never see a truncated file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=".navarro_", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, **kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
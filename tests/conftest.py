@@ -0,0 +1,48 @@
+"""Shared test fixtures."""
+import pytest
+
+from navarro.core import history as history_module
+from navarro.core import profiles as profiles_module
+from navarro.core import rate_limiter as rate_limiter_module
+from navarro.core import shared_limiter as shared_limiter_module
+from navarro.core import stats as stats_module
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_file(tmp_path, monkeypatch):
+    """Keep rate limit persistence out of the home directory."""
+    path = tmp_path / "rate_limits.json"
+    monkeypatch.setattr(rate_limiter_module, "RATE_LIMIT_FILE", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def shared_limits_file(tmp_path, monkeypatch):
+    """Keep the shared rate limit database out of the home directory."""
+    path = tmp_path / "rate_limits.db"
+    monkeypatch.setattr(shared_limiter_module, "SHARED_LIMITS_FILE", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def stats_file(tmp_path, monkeypatch):
+    """Keep platform statistics out of the home directory."""
+    path = tmp_path / "platform_stats.json"
+    monkeypatch.setattr(stats_module, "STATS_FILE", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def history_file(tmp_path, monkeypatch):
+    """Keep the request history out of the home directory."""
+    path = tmp_path / "request_history.db"
+    monkeypatch.setattr(history_module, "HISTORY_FILE", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def profiles_file(tmp_path, monkeypatch):
+    """Keep learned byte profiles out of the home directory."""
+    path = tmp_path / "byte_profiles.json"
+    monkeypatch.setattr(profiles_module, "PROFILES_FILE", path)
+    return path
@@ -1,6 +1,23 @@
 """Tests for core components."""
+import json
+import multiprocessing
+import threading
+import time
+from email.utils import formatdate
+
 import pytest
-from navarro.core import CheckResult
+from navarro.core import (
+    ByteProfiles,
+    CheckResult,
+    RateLimiter,
+    RequestHistory,
+    SessionManager,
+    SharedRateLimiter,
+)
+from navarro.core.markers import Hit, MarkerSet
+from navarro.core.profiles import MIN_BUDGET, MIN_SAMPLES
+from navarro.core.rate_limiter import parse_rate_limit_headers
+from navarro.platforms.instagram import InstagramChecker
 
 
 class TestCheckResult:
@@ -26,3 +43,329 @@ class TestCheckResult:
         assert CheckResult.TIMEOUT.is_error() is True
         assert CheckResult.NETWORK_ERROR.is_error() is True
         assert CheckResult.UNKNOWN_ERROR.is_error() is True
+        assert CheckResult.DEADLINE_EXCEEDED.is_error() is True
+
+
+class TestRateLimiter:
+    """Test the token-bucket RateLimiter."""
+    
+    def test_burst_then_rate(self):
+        """Test a full bucket allows a burst, then spaces requests out."""
+        limiter = RateLimiter(min_delay=1.0)
+        limiter.configure("github", burst=3)
+        assert [limiter.acquire("github") for _ in range(3)] == [0, 0, 0]
+        assert limiter.acquire("github") == pytest.approx(1.0, abs=0.05)
+        # The next caller queues behind the reserved token
+        assert limiter.acquire("github") == pytest.approx(2.0, abs=0.05)
+    
+    def test_max_wait_reserves_nothing(self):
+        """Test a wait past max_wait leaves the bucket untouched."""
+        limiter = RateLimiter(min_delay=1.0)
+        assert limiter.acquire("github") == 0
+        assert limiter.acquire("github", max_wait=0.5) is None
+        assert limiter.should_wait("github") == pytest.approx(1.0, abs=0.05)
+    
+    def test_acquire_all_is_all_or_nothing(self):
+        """Test a request over several buckets waits for the slowest."""
+        limiter = RateLimiter(min_delay=1.0)
+        limiter.acquire("facebook")
+        keys = ["facebook:graph.facebook.com", "facebook"]
+        assert limiter.acquire_all(keys, max_wait=0.5) is None
+        assert limiter.should_wait("facebook:graph.facebook.com") == 0
+        assert limiter.acquire_all(keys) == pytest.approx(1.0, abs=0.05)
+    
+    def test_rate_limited_backs_off(self):
+        """Test a 429 doubles the delay, empties the bucket and locks out."""
+        limiter = RateLimiter(min_delay=1.0)
+        limiter.configure("github", burst=3)
+        limiter.acquire("github")
+        limiter.record_request("github", was_rate_limited=True)
+        assert limiter.delays["github"] == 2.0
+        assert limiter.is_backing_off("github")
+        assert 30 <= limiter.should_wait("github") <= 90
+    
+    def test_configured_rate(self):
+        """Test a per-platform rate sets the spacing, above min_delay."""
+        limiter = RateLimiter(min_delay=0.1)
+        limiter.configure("reddit", rate=0.5)
+        limiter.acquire("reddit")
+        assert limiter.should_wait("reddit") == pytest.approx(2.0, abs=0.05)
+        limiter.record_request("reddit")
+        assert limiter.delays["reddit"] == 2.0
+        assert not limiter.is_backing_off("reddit")
+    
+    def test_writes_are_buffered(self, rate_limit_file):
+        """Test successes are saved on flush, 429s right away."""
+        limiter = RateLimiter()
+        for _ in range(50):
+            limiter.record_request("github")
+        assert not rate_limit_file.exists()
+        
+        limiter.flush()
+        assert "github" in json.loads(rate_limit_file.read_text())["delays"]
+        
+        limiter.record_request("reddit", was_rate_limited=True)
+        assert "reddit" in json.loads(rate_limit_file.read_text())["limits"]
+    
+    def test_lockout_survives_reload(self, rate_limit_file):
+        """Test a saved lockout is restored on the monotonic clock."""
+        RateLimiter().record_request("github", was_rate_limited=True, reset_in=60)
+        assert 55 < RateLimiter().should_wait("github") <= 62
+    
+    
+    def test_retry_after_sets_lockout(self):
+        """Test a server-given reset is honored with at most a little jitter."""
+        limiter = RateLimiter()
+        limiter.record_request("github", was_rate_limited=True, reset_in=7)
+        assert 6.9 < limiter.should_wait("github") <= 7.7
+    
+    def test_backoff_grows_without_retry_after(self):
+        """Test unexplained 429s back off with decorrelated jitter."""
+        limiter = RateLimiter()
+        lockouts = []
+        for _ in range(5):
+            limiter.record_request("github", was_rate_limited=True)
+            lockouts.append(limiter.backoffs["github"])
+        assert all(30 <= lockout <= 300 for lockout in lockouts)
+        limiter.record_request("github")
+        assert "github" not in limiter.backoffs
+    
+    def test_exhausted_window_locks_out(self):
+        """Test remaining == 0 waits for the reset even without a 429."""
+        limiter = RateLimiter()
+        limiter.record_request("github", reset_in=20, remaining=0)
+        assert 19.9 < limiter.should_wait("github") <= 22
+    
+    def test_window_is_paced(self):
+        """Test the remaining requests are spread over the window."""
+        limiter = RateLimiter(min_delay=0.1)
+        limiter.record_request("github", reset_in=30, remaining=10)
+        assert limiter.delays["github"] == pytest.approx(3.0)
+
+
+def acquire_shared(path):
+    return SharedRateLimiter(path, min_delay=1.0).acquire("github")
+
+
+class TestSharedRateLimiter:
+    """Test SharedRateLimiter."""
+    
+    def test_instances_share_budget(self, shared_limits_file):
+        """Test two limiters on one file draw from one bucket."""
+        first = SharedRateLimiter(shared_limits_file, min_delay=1.0)
+        second = SharedRateLimiter(shared_limits_file, min_delay=1.0)
+        assert first.acquire("github") == 0
+        assert second.acquire("github") == pytest.approx(1.0, abs=0.05)
+        assert first.should_wait("reddit") == 0
+    
+    def test_lockout_is_shared(self, shared_limits_file):
+        """Test a 429 seen by one limiter locks out the others."""
+        first = SharedRateLimiter(shared_limits_file)
+        second = SharedRateLimiter(shared_limits_file)
+        first.record_request("github", was_rate_limited=True, reset_in=20)
+        assert second.is_backing_off("github")
+        assert 19.9 < second.should_wait("github") <= 22
+    
+    def test_processes_share_budget(self, shared_limits_file):
+        """Test concurrent processes queue behind each other."""
+        with multiprocessing.Pool(4) as pool:
+            waits = pool.map(acquire_shared, [shared_limits_file] * 4)
+        assert sorted(round(wait) for wait in waits) == [0, 1, 2, 3]
+
+
+class TestRequestHistory:
+    """Test RequestHistory and quota estimation."""
+    
+    def test_records_are_buffered(self, history_file):
+        history = RequestHistory()
+        history.record("github")
+        assert RequestHistory().estimate_quotas() == {}
+        history.record("github", was_rate_limited=True)
+        history.flush()
+        assert "github" in RequestHistory().estimate_quotas()
+    
+    def test_estimate_from_rate_before_429(self):
+        # 30 requests in the minute up to a 429: 0.5/s, 80% of it kept
+        rows = [(float(ts * 2), 0) for ts in range(29)] + [(58.0, 1)]
+        assert RequestHistory._estimate(rows) == pytest.approx(0.4)
+    
+    def test_no_estimate_without_429(self):
+        assert RequestHistory._estimate([(float(ts), 0) for ts in range(100)]) is None
+    
+    def test_limiter_is_seeded(self, history_file):
+        """Test a new limiter starts at the estimated quota and logs requests."""
+        history = RequestHistory()
+        for _ in range(3):
+            history.record("reddit")
+        history.record("reddit", was_rate_limited=True)
+        history.flush()
+        
+        # 4 requests in the window: 4/60 * 0.8 per second, a 18.75s delay
+        limiter = RateLimiter(history=RequestHistory())
+        limiter.acquire("reddit")
+        assert limiter.should_wait("reddit") == pytest.approx(18.75, abs=0.05)
+        assert limiter.should_wait("github") == 0
+        
+        limiter.record_request("github")
+        limiter.flush()
+        assert limiter.history._buffer == []
+    
+    
+    def test_quota_wins_over_static_rate(self, history_file):
+        """Test building checkers keeps a learned group quota slower than RATE_GROUPS."""
+        history = RequestHistory()
+        for _ in range(3):
+            history.record("group:meta")
+        history.record("group:meta", was_rate_limited=True)
+        history.flush()
+        
+        limiter = RateLimiter(history=RequestHistory())
+        InstagramChecker(limiter, SessionManager())
+        assert limiter.base_delays["group:meta"] == pytest.approx(18.75)
+        # A static rate slower than the quota still applies
+        limiter.configure("group:meta", rate=0.01)
+        assert limiter.base_delays["group:meta"] == pytest.approx(100.0)
+
+
+class TestRateLimitHeaders:
+    """Test parse_rate_limit_headers."""
+    
+    def test_retry_after_seconds(self):
+        assert parse_rate_limit_headers({"Retry-After": "120"}) == (120.0, None)
+    
+    def test_retry_after_http_date(self):
+        retry_at = formatdate(time.time() + 90, usegmt=True)
+        reset_in, _ = parse_rate_limit_headers({"Retry-After": retry_at})
+        assert 88 <= reset_in <= 90
+    
+    def test_reset_epoch_and_remaining(self):
+        headers = {"X-RateLimit-Reset": str(int(time.time()) + 60), "X-RateLimit-Remaining": "0"}
+        reset_in, remaining = parse_rate_limit_headers(headers)
+        assert 58 <= reset_in <= 60
+        assert remaining == 0
+    
+    def test_reset_delta(self):
+        assert parse_rate_limit_headers({"ratelimit-reset": "15"}) == (15.0, None)
+    
+    def test_garbage_is_ignored(self):
+        headers = {"Retry-After": "soon", "X-RateLimit-Remaining": "many"}
+        assert parse_rate_limit_headers(headers) == (None, None)
+
+
+class TestMarkerSet:
+    """Test one-pass labelled marker matching."""
+    
+    def test_all_labels_in_one_pass(self):
+        markers = MarkerSet({"found": ['"login":'], "not_found": ["Not Found"]})
+        body = b'{"login": 1} Not Found {"login": 2}'
+        assert markers.scan(body) == [
+            Hit("found", '"login":', 1),
+            Hit("not_found", "Not Found", 13),
+            Hit("found", '"login":', 24),
+        ]
+    
+    def test_overlapping_markers(self):
+        markers = MarkerSet(
+            {"rate_limit": ["429 too many requests", "too many requests"]},
+            ignore_case=("rate_limit",),
+        )
+        hits = markers.scan(b"Error: 429 Too Many Requests")
+        assert [(hit.marker, hit.offset) for hit in hits] == [
+            ("429 too many requests", 7),
+            ("too many requests", 11),
+        ]
+    
+    def test_case_is_kept_outside_ignore_case(self):
+        markers = MarkerSet({"found": ["Athlete"]})
+        assert markers.scan(b"athlete") == []
+    
+    def test_marker_in_several_groups(self):
+        markers = MarkerSet({"not_found": ["gone"], "early_exit": ["gone"]})
+        assert {hit.label for hit in markers.scan(b"page gone")} == {"not_found", "early_exit"}
+    
+    def test_chunks_report_each_hit_once(self):
+        markers = MarkerSet({"found": ["abcdef", "cd"]})
+        scanner = markers.scanner()
+        assert scanner.feed(b"xxabc") == []
+        assert scanner.feed(b"defxxcd") == [
+            Hit("found", "abcdef", 2),
+            Hit("found", "cd", 4),
+            Hit("found", "cd", 10),
+        ]
+        assert scanner.feed(b"x") == []
+    
+    def test_non_ascii_marker_split_across_chunks(self):
+        scanner = MarkerSet({"not_found": ["Impossible de trouver ce compte ✗"]}).scanner()
+        body = "… Impossible de trouver ce compte ✗".encode("utf-8")
+        assert scanner.feed(body[:10]) == []
+        assert [hit.offset for hit in scanner.feed(body[10:])] == [len("… ".encode("utf-8"))]
+
+
+class TestByteProfiles:
+    """Test learned byte budgets."""
+    
+    def test_no_budget_until_enough_samples(self):
+        profiles = ByteProfiles()
+        for _ in range(MIN_SAMPLES - 1):
+            profiles.record("github", 100_000)
+        assert profiles.budget("github") is None
+        profiles.record("github", 100_000)
+        assert profiles.budget("github") == 150_000
+    
+    def test_budget_covers_quantile_with_margin(self):
+        profiles = ByteProfiles()
+        for offset in range(1, 101):
+            profiles.record("github", offset * 1000)
+        # 95th percentile of 1k..100k is 95k, plus 50%
+        assert profiles.budget("github") == 142_500
+    
+    def test_small_budgets_are_floored(self):
+        profiles = ByteProfiles()
+        for _ in range(MIN_SAMPLES):
+            profiles.record("github", 10)
+        assert profiles.budget("github") == MIN_BUDGET
+    
+    def test_saved_and_reloaded(self, profiles_file):
+        profiles = ByteProfiles()
+        profiles.record("github", 1234)
+        profiles.save()
+        assert ByteProfiles().offsets["github"] == [1234]
+
+
+class TestThreadSafety:
+    """Test core objects shared between threads."""
+    
+    def test_concurrent_record_request(self, rate_limit_file):
+        """Test parallel record_request keeps the saved file valid."""
+        limiter = RateLimiter()
+        
+        def worker(i):
+            for _ in range(20):
+                limiter.record_request(f"platform{i}")
+        
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        limiter.flush()
+        
+        data = json.loads(rate_limit_file.read_text())
+        assert len(data["delays"]) == 8
+    
+    def test_concurrent_get_session(self):
+        """Test one session per platform under concurrent access."""
+        manager = SessionManager(pool_size=4)
+        sessions = []
+        threads = [
+            threading.Thread(target=lambda: sessions.append(manager.get_session("github")))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert len({id(s) for s in sessions}) == 1
+        assert manager._user_agent_index == 1
+        manager.close_all()
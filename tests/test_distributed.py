@@ -0,0 +1,130 @@
+"""Tests for the distributed coordinator/worker mode."""
+import multiprocessing
+import threading
+import time
+
+from navarro.core import CheckResult, RateLimiter, SessionManager
+from navarro.engine import Coordinator, TaskQueue, Worker
+
+from tests.test_engine import FakeChecker
+
+
+def fake_checkers():
+    limiter, sessions = RateLimiter(), SessionManager()
+    return {
+        "GitHub": FakeChecker(limiter, sessions, "github", delay=0.01),
+        "Reddit": FakeChecker(limiter, sessions, "reddit", result=CheckResult.NOT_FOUND, delay=0.01),
+    }
+
+
+def run_worker(path):
+    Worker(TaskQueue(path), checkers=fake_checkers(), threads=2, poll_interval=0.05).run()
+
+
+class TestTaskQueue:
+    """Test TaskQueue leasing."""
+    
+    def test_enqueue_is_idempotent(self, tmp_path):
+        """Test re-submitting the same pairs adds nothing."""
+        queue = TaskQueue(str(tmp_path / "q.db"))
+        assert queue.enqueue(["alice", "bob"], ["GitHub", "Reddit"]) == 4
+        assert queue.enqueue(["alice"], ["GitHub"]) == 0
+        assert queue.unfinished() == 4
+    
+    def test_expired_lease_is_retried(self, tmp_path):
+        """Test a dead worker's task is leased again, then given up."""
+        queue = TaskQueue(str(tmp_path / "q.db"), lease_seconds=0, max_attempts=2)
+        queue.enqueue(["alice"], ["GitHub"])
+        
+        first = queue.lease("dead-1")
+        time.sleep(0.01)
+        second = queue.lease("dead-2")
+        assert second.id == first.id and second.attempts == 2
+        
+        # The first worker's late result is rejected
+        assert queue.complete(first, "dead-1", CheckResult.FOUND) is False
+        
+        time.sleep(0.01)
+        assert queue.lease("dead-3") is None
+        assert queue.results() == {"alice": {"GitHub": CheckResult.UNKNOWN_ERROR}}
+    
+    def test_running_check_keeps_its_lease(self, tmp_path):
+        """Test a check longer than the lease is not leased to anyone else."""
+        queue = TaskQueue(str(tmp_path / "q.db"), lease_seconds=0.5)
+        queue.enqueue(["alice"], ["GitHub"])
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {"GitHub": FakeChecker(limiter, sessions, "github", delay=1.5)}
+        worker = Worker(queue, checkers=checkers, threads=1, poll_interval=0.05)
+        
+        completed = []
+        runner = threading.Thread(target=lambda: completed.append(worker.run()))
+        runner.start()
+        time.sleep(0.1)
+        # Well past the first lease, while the check still runs
+        stolen = []
+        for _ in range(20):
+            stolen.append(queue.lease("other"))
+            time.sleep(0.05)
+        runner.join()
+        assert completed == [1]
+        assert not any(stolen)
+        assert queue.results() == {"alice": {"GitHub": CheckResult.FOUND}}
+    
+    def test_lease_skips_excluded_platforms(self, tmp_path):
+        """Test busy platforms are not leased twice."""
+        queue = TaskQueue(str(tmp_path / "q.db"))
+        queue.enqueue(["alice", "bob"], ["GitHub"])
+        assert queue.lease("w", exclude=["GitHub"]) is None
+    
+    def test_progress_resumes_from_position(self, tmp_path):
+        """Test progress reports each username once, in order, past a pending one."""
+        queue = TaskQueue(str(tmp_path / "q.db"))
+        queue.enqueue(["alice", "bob", "carol"], ["GitHub"])
+        tasks = {task.username: task for task in iter(lambda: queue.lease("w"), None)}
+        queue.complete(tasks["alice"], "w", CheckResult.FOUND)
+        queue.complete(tasks["carol"], "w", CheckResult.FOUND)
+        
+        first = queue.progress()
+        assert [username for username, _ in first.finished] == ["alice"]
+        assert first.pending
+        assert queue.progress(first.position).finished == []
+        
+        # A platform added for alice later does not report her again
+        queue.enqueue(["alice"], ["Reddit"])
+        queue.complete(tasks["bob"], "w", CheckResult.NOT_FOUND)
+        queue.complete(queue.lease("w"), "w", CheckResult.NOT_FOUND)
+        second = queue.progress(first.position)
+        assert second.finished == [
+            ("bob", {"GitHub": CheckResult.NOT_FOUND}),
+            ("carol", {"GitHub": CheckResult.FOUND}),
+        ]
+        assert not second.pending
+        assert queue.progress(second.position).finished == []
+
+
+class TestCoordinator:
+    """Test coordinator and workers as local processes."""
+    
+    def test_workers_drain_queue(self, tmp_path):
+        """Test results from worker processes reach the coordinator."""
+        path = str(tmp_path / "q.db")
+        coordinator = Coordinator(TaskQueue(path))
+        assert coordinator.submit(["alice", "bob", "carol"], ["github", "reddit"]) == 6
+        
+        workers = [multiprocessing.Process(target=run_worker, args=(path,)) for _ in range(2)]
+        for process in workers:
+            process.start()
+        
+        seen = []
+        results = coordinator.wait(
+            poll_interval=0.05,
+            on_complete=lambda username, r: seen.append(username),
+        )
+        for process in workers:
+            process.join(timeout=10)
+        
+        assert seen == ["alice", "bob", "carol"]
+        assert all(
+            r == {"GitHub": CheckResult.FOUND, "Reddit": CheckResult.NOT_FOUND}
+            for r in results.values()
+        )
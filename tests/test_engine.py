@@ -0,0 +1,474 @@
+"""Tests for the concurrent execution engines."""
+import threading
+import time
+
+from navarro.core import (
+    AsyncRateLimiter,
+    AsyncSessionManager,
+    CheckResult,
+    PlatformChecker,
+    RateLimiter,
+    SessionManager,
+)
+from navarro import platforms as platforms_module
+from navarro.core.stats import PlatformStats
+from navarro.engine import (
+    AIMDController,
+    AsyncEngine,
+    BatchScheduler,
+    CostYieldOrdering,
+    ShardedRunner,
+    StopCondition,
+    ThreadPoolEngine,
+)
+from navarro.cli import check_usernames
+from navarro.platforms.rules import PlatformRegistry
+
+
+class FakeChecker(PlatformChecker):
+    """Checker that sleeps instead of making a request."""
+    
+    platform_name = "Fake"
+    platform_key = "fake"
+    
+    def __init__(self, rate_limiter, session_manager, key, result=CheckResult.FOUND, delay=0.3):
+        super().__init__(rate_limiter, session_manager)
+        self.platform_key = key
+        self.result = result
+        self.delay = delay
+        # (start, end) of every finished check, and checks still running
+        self.spans = []
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+    
+    def get_urls(self, username):
+        return [f"https://{self.platform_key}.example/{username}"]
+    
+    def detect_found(self, response, context=None):
+        return False
+    
+    def detect_not_found(self, response, context=None):
+        return False
+    
+    def check(self, username, context=None):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        start = time.monotonic()
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+            self.spans.append((start, time.monotonic()))
+        if self.result is None:
+            raise RuntimeError("boom")
+        self.rate_limiter.record_request(self.platform_key)
+        return self.result
+
+
+def overlapped(checkers):
+    """True if every checker's first check was running at one moment."""
+    firsts = [checker.spans[0] for checker in checkers]
+    return max(start for start, _ in firsts) < min(end for _, end in firsts)
+
+
+class ShardChecker(FakeChecker):
+    """Registry-built checker for worker processes; the first shard is slowest."""
+    
+    def __init__(self, rate_limiter, session_manager):
+        super().__init__(rate_limiter, session_manager, "shard")
+    
+    def check(self, username, context=None):
+        index = int(username[len("user"):])
+        time.sleep(0.2 if index < 2 else 0.01)
+        return CheckResult.FOUND if index % 2 == 0 else CheckResult.NOT_FOUND
+
+
+class AdaptiveChecker(FakeChecker):
+    """Registry-built checker that keeps track of its instances."""
+    
+    platform_name = "Adaptive"
+    instances = []
+    
+    def __init__(self, rate_limiter, session_manager):
+        super().__init__(rate_limiter, session_manager, "adaptive", delay=0.1)
+        self.instances.append(self)
+
+
+def make_engine(checkers, limiter, sessions, **kwargs):
+    return AsyncEngine(
+        checkers,
+        AsyncRateLimiter(limiter),
+        AsyncSessionManager(sessions, max_workers=len(checkers)),
+        **kwargs
+    )
+
+
+class TestAsyncEngine:
+    """Test AsyncEngine."""
+    
+    def test_platforms_run_concurrently(self):
+        """Test all platforms are checked at once."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {
+            f"P{i}": FakeChecker(limiter, sessions, f"p{i}") for i in range(6)
+        }
+        engine = make_engine(checkers, limiter, sessions)
+        
+        results = engine.run("johndoe")
+        
+        assert list(results) == list(checkers)
+        assert all(r == CheckResult.FOUND for r in results.values())
+        assert overlapped(checkers.values())
+    
+    def test_exception_is_unknown_error(self):
+        """Test a crashing checker yields UNKNOWN_ERROR."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {
+            "Ok": FakeChecker(limiter, sessions, "ok", delay=0),
+            "Broken": FakeChecker(limiter, sessions, "broken", result=None, delay=0),
+        }
+        results = make_engine(checkers, limiter, sessions).run("johndoe")
+        assert results == {
+            "Ok": CheckResult.FOUND,
+            "Broken": CheckResult.UNKNOWN_ERROR,
+        }
+    
+    def test_deadline_keeps_finished_results(self):
+        """Test slow platforms are cut off while finished ones are kept."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {
+            "Fast": FakeChecker(limiter, sessions, "fast", delay=0.1),
+            "Slow": FakeChecker(limiter, sessions, "slow", delay=3),
+        }
+        engine = make_engine(checkers, limiter, sessions, deadline=1.5)
+        
+        results = engine.run("johndoe")
+        # Returned at the deadline, not when the slow check ended
+        assert checkers["Slow"].spans == []
+        assert results == {
+            "Fast": CheckResult.FOUND,
+            "Slow": CheckResult.DEADLINE_EXCEEDED,
+        }
+    
+    def test_on_result_callback(self):
+        """Test every platform is reported through the callback."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {f"P{i}": FakeChecker(limiter, sessions, f"p{i}", delay=0) for i in range(3)}
+        seen = []
+        make_engine(checkers, limiter, sessions).run(
+            "johndoe", on_result=lambda name, result: seen.append(name)
+        )
+        assert sorted(seen) == ["P0", "P1", "P2"]
+    
+    def test_stop_after_skips_pending(self):
+        """Test pending platforms are skipped once enough are found."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {
+            "Fast": FakeChecker(limiter, sessions, "fast", delay=0.05),
+            "Slow": FakeChecker(limiter, sessions, "slow", delay=2),
+        }
+        engine = make_engine(checkers, limiter, sessions, stop=StopCondition(stop_after=1))
+        
+        results = engine.run("johndoe")
+        assert checkers["Slow"].spans == []
+        assert results == {
+            "Fast": CheckResult.FOUND,
+            "Slow": CheckResult.SKIPPED,
+        }
+
+
+class TestThreadPoolEngine:
+    """Test ThreadPoolEngine."""
+    
+    def test_platforms_run_concurrently(self):
+        """Test checks overlap on the worker threads."""
+        limiter, sessions = RateLimiter(), SessionManager(pool_size=6)
+        checkers = {
+            f"P{i}": FakeChecker(limiter, sessions, f"p{i}") for i in range(6)
+        }
+        engine = ThreadPoolEngine(checkers, limiter, sessions, workers=6)
+        
+        try:
+            results = engine.run("johndoe")
+        finally:
+            engine.close()
+        
+        assert list(results) == list(checkers)
+        assert all(r == CheckResult.FOUND for r in results.values())
+        assert overlapped(checkers.values())
+    
+    def test_exception_is_unknown_error(self):
+        """Test a crashing checker yields UNKNOWN_ERROR."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {"Broken": FakeChecker(limiter, sessions, "broken", result=None, delay=0)}
+        engine = ThreadPoolEngine(checkers, limiter, sessions, workers=2)
+        assert engine.run("johndoe") == {"Broken": CheckResult.UNKNOWN_ERROR}
+    
+    def test_deadline(self):
+        """Test platforms still running at the deadline are reported."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {
+            "Fast": FakeChecker(limiter, sessions, "fast", delay=0.05),
+            "Slow": FakeChecker(limiter, sessions, "slow", delay=1.5),
+        }
+        engine = ThreadPoolEngine(checkers, limiter, sessions, workers=2, deadline=0.5)
+        
+        results = engine.run("johndoe")
+        assert checkers["Slow"].spans == []
+        assert results == {
+            "Fast": CheckResult.FOUND,
+            "Slow": CheckResult.DEADLINE_EXCEEDED,
+        }
+    
+    
+    def test_until_found(self):
+        """Test a hit on a target platform skips the rest."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {
+            "Slow": FakeChecker(limiter, sessions, "slow", delay=1.5),
+            "Target": FakeChecker(limiter, sessions, "target", delay=0.05),
+        }
+        engine = ThreadPoolEngine(
+            checkers, limiter, sessions, workers=2,
+            stop=StopCondition(until_found=["target"]),
+        )
+        
+        results = engine.run("johndoe")
+        assert checkers["Slow"].spans == []
+        assert results == {
+            "Slow": CheckResult.SKIPPED,
+            "Target": CheckResult.FOUND,
+        }
+
+
+class TestStopCondition:
+    """Test StopCondition."""
+    
+    def test_empty_is_falsy(self):
+        assert not StopCondition()
+        assert StopCondition(stop_after=2)
+    
+    def test_stop_after(self):
+        stop = StopCondition(stop_after=2)
+        platforms = ["A", "B", "C"]
+        assert not stop.is_met({"A": CheckResult.FOUND}, platforms)
+        assert stop.is_met({"A": CheckResult.FOUND, "C": CheckResult.FOUND}, platforms)
+    
+    def test_until_found(self):
+        stop = StopCondition(until_found=["github", "reddit"])
+        platforms = ["GitHub", "Reddit", "Steam"]
+        assert not stop.is_met({"Steam": CheckResult.FOUND}, platforms)
+        assert stop.is_met({"Reddit": CheckResult.FOUND}, platforms)
+        assert stop.is_met(
+            {"GitHub": CheckResult.NOT_FOUND, "Reddit": CheckResult.TIMEOUT}, platforms
+        )
+    
+    def test_targets_dispatched_first(self):
+        stop = StopCondition(until_found=["reddit"])
+        assert stop.prioritize(["GitHub", "Reddit", "Steam"]) == ["Reddit", "GitHub", "Steam"]
+
+
+class TestBatchScheduler:
+    """Test BatchScheduler."""
+    
+    def test_platforms_interleave_across_usernames(self):
+        """Test each platform paces itself independently."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {
+            f"P{i}": FakeChecker(limiter, sessions, f"p{i}", delay=0.05) for i in range(3)
+        }
+        scheduler = BatchScheduler(
+            checkers, AsyncRateLimiter(limiter), AsyncSessionManager(sessions, max_workers=3)
+        )
+        
+        try:
+            results = scheduler.run_many(["alice", "bob"])
+        finally:
+            scheduler.close()
+        
+        assert list(results) == ["alice", "bob"]
+        assert all(list(r) == list(checkers) for r in results.values())
+        # Platforms do not wait on each other's 0.5s minimum delay
+        assert overlapped(checkers.values())
+    
+    def test_completion_in_input_order(self):
+        """Test usernames are reported in input order, once each."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {
+            "Fast": FakeChecker(limiter, sessions, "fast", delay=0),
+            "Slow": FakeChecker(limiter, sessions, "slow", delay=0.1),
+        }
+        scheduler = BatchScheduler(
+            checkers,
+            AsyncRateLimiter(limiter),
+            AsyncSessionManager(sessions, max_workers=2),
+        )
+        seen = []
+        scheduler.run_many(
+            ["alice", "bob", "alice"],
+            on_complete=lambda username, results: seen.append(username),
+        )
+        assert seen == ["alice", "bob"]
+    
+    def test_deadline_per_platform_dispatch(self):
+        """Test a slow platform's deadline starts when it reaches the username."""
+        limiter, sessions = RateLimiter(min_delay=0.01), SessionManager()
+        checkers = {
+            "Fast": FakeChecker(limiter, sessions, "fast", delay=0.01),
+            "Slow": FakeChecker(limiter, sessions, "slow", delay=0.3),
+        }
+        scheduler = BatchScheduler(
+            checkers,
+            AsyncRateLimiter(limiter),
+            AsyncSessionManager(sessions, max_workers=2),
+            deadline=1.0,
+        )
+        results = scheduler.run_many([f"u{i}" for i in range(6)])
+        assert all(
+            r == {"Fast": CheckResult.FOUND, "Slow": CheckResult.FOUND}
+            for r in results.values()
+        )
+        assert len(checkers["Slow"].spans) == 6
+    
+    def test_adaptive_concurrency(self):
+        """Test a clean platform opens up while a throttled one stays at 1."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {
+            "Clean": FakeChecker(limiter, sessions, "clean", delay=0.2),
+            "Strict": FakeChecker(
+                limiter, sessions, "strict", result=CheckResult.RATE_LIMITED, delay=0
+            ),
+        }
+        controller = AIMDController(maximum=4)
+        scheduler = BatchScheduler(
+            checkers,
+            AsyncRateLimiter(limiter),
+            AsyncSessionManager(sessions, max_workers=8),
+            controller=controller,
+        )
+        
+        scheduler.run_many([f"user{i}" for i in range(12)])
+        # A fixed cap of 1 would never run two clean checks at once
+        assert checkers["Clean"].peak > 1
+        assert checkers["Strict"].peak == 1
+        assert controller.windows() == {"clean": 4, "strict": 1}
+
+
+class TestCheckUsernames:
+    """Test the CLI's batch path."""
+    
+    def test_adaptive_windows_get_threads(self, monkeypatch):
+        """Test the pool is sized so grown windows run concurrently."""
+        monkeypatch.setattr(
+            platforms_module, "PLATFORM_REGISTRY", PlatformRegistry({"Adaptive": AdaptiveChecker})
+        )
+        AdaptiveChecker.instances.clear()
+        controller = AIMDController(maximum=4)
+        results = check_usernames([f"user{i}" for i in range(16)], controller=controller)
+        assert all(r == {"Adaptive": CheckResult.FOUND} for r in results.values())
+        assert controller.windows() == {"adaptive": 4}
+        # One platform: a pool sized by platform count would cap this at 1
+        assert AdaptiveChecker.instances[0].peak > 1
+
+
+class TestAIMDController:
+    """Test AIMDController."""
+    
+    def test_additive_increase(self):
+        controller = AIMDController(maximum=3)
+        controller.record("github", CheckResult.FOUND)
+        assert controller.window("github") == 2
+        for _ in range(4):
+            controller.record("github", CheckResult.NOT_FOUND)
+        assert controller.window("github") == 3
+    
+    def test_multiplicative_decrease(self):
+        controller = AIMDController(initial=8, maximum=8)
+        controller.record("github", CheckResult.RATE_LIMITED)
+        assert controller.window("github") == 4
+        controller.record("github", CheckResult.TIMEOUT)
+        controller.record("github", CheckResult.TIMEOUT)
+        controller.record("github", CheckResult.TIMEOUT)
+        assert controller.window("github") == 1
+    
+    def test_errors_leave_window_alone(self):
+        controller = AIMDController(initial=2)
+        controller.record("github", CheckResult.NETWORK_ERROR)
+        controller.record("github", CheckResult.SKIPPED)
+        assert controller.window("github") == 2
+    
+    def test_slots_follow_window(self):
+        controller = AIMDController(initial=2)
+        assert controller.try_acquire("github")
+        assert controller.try_acquire("github")
+        assert not controller.try_acquire("github")
+        controller.release("github")
+        assert controller.try_acquire("github")
+
+
+class TestShardedRunner:
+    """Test ShardedRunner."""
+    
+    def test_shard_is_contiguous(self):
+        """Test shards keep input order."""
+        runner = ShardedRunner(processes=2, shard_size=2)
+        assert runner.shard(["a", "b", "c", "d", "e"]) == [["a", "b"], ["c", "d"], ["e"]]
+    
+    def test_per_process_budget(self):
+        """Test worker rate limiters split every budget, configured ones included."""
+        limiter = RateLimiter(share=4)
+        limiter.configure("github", burst=4)
+        limiter.configure("group:meta", rate=1.0, burst=2)
+        assert limiter.base_delays["reddit"] == 0.5 * 4
+        assert limiter.base_delays["group:meta"] == 4.0
+        assert limiter.bursts["github"] == 1
+        assert limiter.bursts["group:meta"] == 1
+        limiter.acquire("group:meta")
+        assert limiter.should_wait("group:meta") > 3.5
+    
+    def test_run_merges_in_input_order(self, monkeypatch):
+        """Test two worker processes check every username, merged in input order."""
+        monkeypatch.setattr(
+            platforms_module, "PLATFORM_REGISTRY", PlatformRegistry({"Shard": ShardChecker})
+        )
+        usernames = [f"user{i}" for i in range(6)]
+        seen = []
+        runner = ShardedRunner(processes=2, shard_size=2)
+        results = runner.run(usernames, on_complete=lambda name, _: seen.append(name))
+        assert list(results) == usernames
+        assert seen == usernames
+        assert results["user0"] == {"Shard": CheckResult.FOUND}
+        assert results["user1"] == {"Shard": CheckResult.NOT_FOUND}
+
+
+class TestCostYieldOrdering:
+    """Test cost- and yield-aware ordering."""
+    
+    def test_cheap_high_yield_first(self):
+        """Test ordering by hit rate over cost."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {
+            "Expensive": FakeChecker(limiter, sessions, "expensive"),
+            "Cheap": FakeChecker(limiter, sessions, "cheap"),
+            "Barren": FakeChecker(limiter, sessions, "barren"),
+        }
+        checkers["Expensive"].REQUEST_COST = 4
+        stats = PlatformStats()
+        for _ in range(10):
+            stats.record("expensive", CheckResult.FOUND, 1.0)
+            stats.record("cheap", CheckResult.FOUND, 0.2)
+            stats.record("barren", CheckResult.NOT_FOUND, 0.2)
+        
+        assert CostYieldOrdering(stats).order(checkers) == ["Cheap", "Barren", "Expensive"]
+    
+    def test_engine_feeds_and_saves_stats(self, stats_file):
+        """Test results are recorded and persisted on close."""
+        limiter, sessions = RateLimiter(), SessionManager()
+        checkers = {"P": FakeChecker(limiter, sessions, "p", delay=0)}
+        ordering = CostYieldOrdering()
+        engine = make_engine(checkers, limiter, sessions, ordering=ordering)
+        engine.run("johndoe")
+        engine.close()
+        
+        assert PlatformStats().stats["p"]["found"] == 1
@@ -0,0 +1,635 @@
+"""Tests for platform checkers."""
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from navarro.core import ByteProfiles, CheckContext, CheckResult, PlatformChecker, RateLimiter
+from navarro.core.markers import Hit
+from navarro.core.profiles import MIN_SAMPLES
+from navarro.platforms import (
+    BlueskyChecker,
+    ChessDotComChecker,
+    DeviantArtChecker,
+    FacebookChecker,
+    GitHubChecker,
+    InstagramChecker,
+    LinktreeChecker,
+    MastodonChecker,
+    SoundCloudChecker,
+    SpotifyChecker,
+    SteamChecker,
+    StravaChecker,
+    TelegramChecker,
+    ThreadsChecker,
+    VimeoChecker,
+    VKChecker,
+    YouTubeChecker,
+)
+from navarro.platforms.mixins import SingleURLMixin, StatusCodeMixin
+from navarro.platforms.rules import PlatformRegistry, RuleChecker, validate_rule
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+    
+    def __init__(self, url, status_code=200, text="", headers=None):
+        self.url = url
+        self.status_code = status_code
+        self._content = text.encode("utf-8")
+        self.headers = headers or {}
+        self.closed = False
+        self.chunks_read = 0
+    
+    @property
+    def content(self):
+        return self._content
+    
+    @property
+    def text(self):
+        return self._content.decode("utf-8")
+    
+    def iter_content(self, chunk_size=1):
+        body = self._content
+        for start in range(0, len(body), chunk_size):
+            self.chunks_read += 1
+            yield body[start:start + chunk_size]
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """Session whose pages mention the username only for known users."""
+    
+    def __init__(self, known):
+        self.known = known
+    
+    def get(self, url, **kwargs):
+        # Interleave concurrent checks
+        time.sleep(random.uniform(0, 0.01))
+        username = url.rstrip("/").rsplit("/", 1)[-1]
+        if username in self.known:
+            body = f"profile of {username}"
+        else:
+            body = "someone else entirely"
+        meta = '<meta property="og:title"><meta property="og:description">'
+        return FakeResponse(url, text=f"<html>{meta}{body}</html>")
+
+
+class FakeSessionManager:
+    def __init__(self, session):
+        self.session = session
+    
+    def get_session(self, platform):
+        return self.session
+
+
+class FastLimiter(RateLimiter):
+    """Rate limiter that never waits."""
+    
+    def should_wait(self, platform):
+        return 0
+    
+    def acquire_all(self, platforms, max_wait=None):
+        return 0
+
+
+class TestReentrantCheckers:
+    """Test one checker instance serving concurrent checks."""
+    
+    @pytest.mark.parametrize("checker_class", [SteamChecker, TelegramChecker])
+    def test_shared_instance(self, checker_class):
+        """Test concurrent checks do not see each other's username."""
+        known = {f"user{i}" for i in range(0, 40, 2)}
+        checker = checker_class(FastLimiter(), FakeSessionManager(FakeSession(known)))
+        usernames = [f"user{i}" for i in range(40)]
+        
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(checker.check, usernames))
+        
+        for username, result in zip(usernames, results):
+            expected = CheckResult.FOUND if username in known else CheckResult.NOT_FOUND
+            assert result == expected, username
+    
+    def test_context_collects_evidence(self):
+        """Test the context records the URL and response."""
+        checker = SteamChecker(FastLimiter(), FakeSessionManager(FakeSession({"alice"})))
+        context = CheckContext("alice", attempt=2)
+        
+        assert checker.check("alice", context) == CheckResult.FOUND
+        assert context.url == "https://steamcommunity.com/id/alice"
+        assert context.evidence == ["GET https://steamcommunity.com/id/alice -> 200"]
+        assert context.attempt == 2
+
+
+class SlowFirstURLsSession:
+    """YouTube-like session where only the last URL pattern matches, fast."""
+    
+    def __init__(self, delay=0.5):
+        self.delay = delay
+    
+    def get(self, url, **kwargs):
+        if "/user/" in url:
+            return FakeResponse(url, text='"channelId":"UC123"')
+        time.sleep(self.delay)
+        return FakeResponse(url, status_code=404)
+
+
+class TestHedgedProbing:
+    """Test hedged multi-URL probing."""
+    
+    def test_first_found_wins(self):
+        """Test a hedged check returns without waiting for slow URLs."""
+        session = SlowFirstURLsSession(delay=3.0)
+        checker = YouTubeChecker(FastLimiter(), FakeSessionManager(session))
+        checker.hedge = True
+        context = CheckContext("alice")
+        
+        start = time.monotonic()
+        assert checker.check("alice", context) == CheckResult.FOUND
+        assert time.monotonic() - start < 2.0
+        assert context.url == "https://www.youtube.com/user/alice"
+    
+    def test_sequential_when_backing_off(self):
+        """Test hedging is skipped while the platform is slowed down."""
+        limiter = FastLimiter()
+        limiter.record_request("youtube", was_rate_limited=True)
+        checker = YouTubeChecker(limiter, FakeSessionManager(SlowFirstURLsSession()))
+        checker.hedge = True
+        
+        start = time.monotonic()
+        assert checker.check("alice") == CheckResult.FOUND
+        assert time.monotonic() - start >= 1.0
+
+
+class BigPageSession:
+    """Serves a large page with a marker near the start."""
+    
+    def __init__(self, marker):
+        self.page = FakeResponse("", text="<html>" + marker + "x" * 2_000_000)
+    
+    def get(self, url, **kwargs):
+        assert kwargs.get("stream")
+        self.page.url = url
+        return self.page
+
+
+class TestStreamingReads:
+    """Test streamed bodies stop at decisive markers."""
+    
+    def test_not_found_stops_early(self):
+        session = BigPageSession("Sorry, this page isn't available")
+        checker = InstagramChecker(FastLimiter(), FakeSessionManager(session))
+        context = CheckContext("alice")
+        assert checker.check("alice", context) == CheckResult.NOT_FOUND
+        assert session.page.chunks_read == 1
+        assert session.page.closed
+        assert "stopped at" in context.evidence[0]
+    
+    def test_found_stops_early(self):
+        session = BigPageSession('"username":"alice","profile_pic_url":"x"')
+        checker = InstagramChecker(FastLimiter(), FakeSessionManager(session))
+        assert checker.check("alice") == CheckResult.FOUND
+        assert session.page.chunks_read == 1
+
+
+class MarkerAtSession:
+    """Serves a large page with a marker at a given offset."""
+    
+    def __init__(self, marker, offset, size=2_000_000):
+        self.page = FakeResponse("", text="x" * offset + marker + "x" * size)
+    
+    def get(self, url, **kwargs):
+        self.page.url = url
+        return self.page
+
+
+class TestByteBudgets:
+    """Test capped reads driven by learned byte profiles."""
+    
+    def checker(self, session, offset):
+        checker = GitHubChecker(FastLimiter(), FakeSessionManager(session))
+        checker.byte_profiles = ByteProfiles()
+        for _ in range(MIN_SAMPLES):
+            checker.byte_profiles.record("github", offset)
+        return checker
+    
+    def test_offsets_are_learned(self):
+        session = MarkerAtSession("Page not found", 50_000, size=1000)
+        checker = GitHubChecker(FastLimiter(), FakeSessionManager(session))
+        checker.byte_profiles = ByteProfiles()
+        assert checker.check("alice") == CheckResult.NOT_FOUND
+        assert checker.byte_profiles.offsets["github"] == [50_000 + len("Page not found")]
+    
+    def test_found_markers_are_not_learned(self):
+        session = MarkerAtSession('"login":', 50_000, size=1000)
+        checker = GitHubChecker(FastLimiter(), FakeSessionManager(session))
+        checker.byte_profiles = ByteProfiles()
+        assert checker.check("alice") == CheckResult.FOUND
+        assert checker.byte_profiles.samples("github") == 0
+    
+    def test_read_is_capped(self):
+        session = MarkerAtSession("Page not found", 50_000)
+        checker = self.checker(session, 60_000)
+        context = CheckContext("alice")
+        assert checker.check("alice", context) == CheckResult.NOT_FOUND
+        # 90k budget, read in 16 KiB chunks
+        assert session.page.chunks_read == 6
+        assert "capped at 90000" in context.evidence[0]
+    
+    def test_capped_found_needs_decisive_marker(self):
+        """Test a found marker in the window does not hide a later not-found one."""
+        page = '<meta property="og:title">' + "x" * 200_000 + "Sorry, this page isn't available"
+        session = MarkerAtSession(page, 0, size=1000)
+        checker = InstagramChecker(FastLimiter(), FakeSessionManager(session))
+        checker.byte_profiles = ByteProfiles()
+        for _ in range(MIN_SAMPLES):
+            checker.byte_profiles.record("instagram", 100)
+        assert checker.byte_budget() == 32 * 1024
+        context = CheckContext("alice")
+        assert checker.check("alice", context) == CheckResult.NOT_FOUND
+        assert "capped" not in context.evidence[0]
+    
+    def test_falls_back_to_full_read(self):
+        """Test a marker past the budget is still found."""
+        session = MarkerAtSession("Page not found", 500_000, size=1000)
+        checker = self.checker(session, 60_000)
+        context = CheckContext("alice")
+        assert checker.check("alice", context) == CheckResult.NOT_FOUND
+        assert "capped" not in context.evidence[0]
+        assert checker.byte_profiles.offsets["github"][-1] == 500_000 + len("Page not found")
+
+
+class HeadSession:
+    """Answers HEAD with a fixed status and GET with a profile page."""
+    
+    def __init__(self, head_status, headers=None):
+        self.head_status = head_status
+        self.headers = headers
+        self.methods = []
+    
+    def head(self, url, **kwargs):
+        self.methods.append("HEAD")
+        return FakeResponse(url, status_code=self.head_status, headers=self.headers)
+    
+    def get(self, url, **kwargs):
+        self.methods.append("GET")
+        return FakeResponse(url, text="<h1>Athlete alice</h1>")
+
+
+class StatusSession:
+    """Answers GET with a fixed status, and a profile page as the body."""
+    
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers
+        self.methods = []
+        self.responses = []
+    
+    def get(self, url, **kwargs):
+        self.methods.append("GET")
+        response = FakeResponse(
+            url, status_code=self.status, headers=self.headers, text="<h1>Athlete alice</h1>"
+        )
+        self.responses.append(response)
+        return response
+
+
+class StatusOnlyChecker(SingleURLMixin, StatusCodeMixin, PlatformChecker):
+    platform_name = "Status"
+    platform_key = "status"
+    URL_PATTERN = "https://example.com/{username}"
+
+
+class TestStatusProbes:
+    """Test the status fast path for status-code platforms."""
+    
+    def test_404_skips_body(self):
+        session = StatusSession(404)
+        checker = StravaChecker(FastLimiter(), FakeSessionManager(session))
+        context = CheckContext("alice")
+        assert checker.check("alice", context) == CheckResult.NOT_FOUND
+        assert session.methods == ["GET"]
+        assert session.responses[0].chunks_read == 0
+        assert context.evidence == [
+            "GET https://www.strava.com/athletes/alice -> 404 (headers only)"
+        ]
+    
+    def test_ambiguous_reads_same_get(self):
+        session = StatusSession(200)
+        checker = StravaChecker(FastLimiter(), FakeSessionManager(session))
+        assert checker.check("alice") == CheckResult.FOUND
+        assert session.methods == ["GET"]
+    
+    def test_head_not_allowed_falls_back_to_get(self):
+        session = HeadSession(405)
+        checker = StatusOnlyChecker(FastLimiter(), FakeSessionManager(session))
+        assert checker.check("alice") == CheckResult.FOUND
+        assert session.methods == ["HEAD", "GET"]
+    
+    def test_status_only_found(self):
+        session = HeadSession(200)
+        checker = StatusOnlyChecker(FastLimiter(), FakeSessionManager(session))
+        assert checker.check("alice") == CheckResult.FOUND
+        assert session.methods == ["HEAD"]
+    
+    def test_rate_limited_head(self):
+        limiter = RateLimiter()
+        session = StatusSession(429, headers={"Retry-After": "60"})
+        checker = StravaChecker(limiter, FakeSessionManager(session))
+        assert checker.check("alice") == CheckResult.RATE_LIMITED
+        assert session.methods == ["GET"]
+        assert limiter.is_backing_off("strava")
+
+
+class RedirectSession:
+    """Redirects t.me to `location`, or serves a profile page."""
+    
+    def __init__(self, location=None):
+        self.location = location
+        self.requests = []
+    
+    def get(self, url, **kwargs):
+        self.requests.append(kwargs["allow_redirects"])
+        if self.location and not kwargs["allow_redirects"]:
+            return FakeResponse(url, status_code=302, headers={"Location": self.location})
+        body = '<meta property="og:title"><meta property="og:description">alice'
+        return FakeResponse(url, text=body)
+
+
+class TestRedirectRules:
+    """Test classifying from redirects without following them."""
+    
+    def test_matching_redirect_settles_it(self):
+        session = RedirectSession("https://telegram.org/")
+        checker = TelegramChecker(FastLimiter(), FakeSessionManager(session))
+        context = CheckContext("alice")
+        assert checker.check("alice", context) == CheckResult.NOT_FOUND
+        assert session.requests == [False]
+        assert context.evidence == [
+            "GET https://t.me/alice -> 302 (redirect to https://telegram.org/)"
+        ]
+    
+    def test_body_of_same_response_is_read(self):
+        session = RedirectSession()
+        checker = TelegramChecker(FastLimiter(), FakeSessionManager(session))
+        assert checker.check("alice") == CheckResult.FOUND
+        assert session.requests == [False]
+    
+    def test_other_redirects_are_followed(self):
+        session = RedirectSession("/s/alice")
+        checker = TelegramChecker(FastLimiter(), FakeSessionManager(session))
+        context = CheckContext("alice")
+        assert checker.check("alice", context) == CheckResult.FOUND
+        assert session.requests == [False, True]
+        assert "redirect to https://t.me/s/alice" in context.evidence[0]
+
+
+class TestMarkerDetection:
+    """Test detect methods backed by the compiled marker set."""
+    
+    def test_compiled_once_per_class(self):
+        first = GitHubChecker(FastLimiter(), None)
+        second = GitHubChecker(FastLimiter(), None)
+        assert first.marker_set() is second.marker_set()
+        assert first.marker_set() is not InstagramChecker.marker_set()
+    
+    def test_streamed_hits_are_reused(self):
+        session = BigPageSession("Sorry, this page isn't available")
+        checker = InstagramChecker(FastLimiter(), FakeSessionManager(session))
+        assert checker.check("alice") == CheckResult.NOT_FOUND
+        size, hits = session.page._marker_hits
+        assert size == len(session.page.content)
+        assert Hit("not_found", "Sorry, this page isn't available", 6) in hits
+    
+    def test_rate_limit_text(self):
+        checker = GitHubChecker(FastLimiter(), None)
+        response = FakeResponse("https://github.com/alice", text="<h1>Too Many Requests</h1>")
+        assert checker.check_rate_limit(response)
+
+
+class TestDetectWithoutContext:
+    """Test detect methods that look for the username work without a context."""
+    
+    @pytest.mark.parametrize("checker_class", [
+        BlueskyChecker,
+        ChessDotComChecker,
+        DeviantArtChecker,
+        LinktreeChecker,
+        MastodonChecker,
+        SoundCloudChecker,
+        SpotifyChecker,
+        SteamChecker,
+        StravaChecker,
+        TelegramChecker,
+        VimeoChecker,
+        VKChecker,
+    ])
+    def test_no_context(self, checker_class):
+        checker = checker_class(FastLimiter(), None)
+        body = '<meta property="og:title"><meta property="og:description">alice'
+        response = FakeResponse("https://example.com/alice", text=body)
+        checker.detect_found(response)
+        checker.detect_not_found(response)
+
+
+class TestRuleCheckers:
+    """Test checkers built from JSON rules."""
+    
+    def test_builtin_rules_keep_class_names(self):
+        assert issubclass(GitHubChecker, RuleChecker)
+        assert GitHubChecker.__name__ == "GitHubChecker"
+        assert GitHubChecker.platform_key == "github"
+        assert GitHubChecker.BURST == 4
+        assert ThreadsChecker.RATE_GROUP == "meta"
+    
+    def test_rules_are_built_when_looked_up(self, tmp_path):
+        path = tmp_path / "sites.json"
+        path.write_text(json.dumps({"Example": {"url": "https://example.com/{username}"}}))
+        registry = PlatformRegistry({}, [path])
+        path.write_text(json.dumps({"Example": {"url": "https://example.org/{username}"}}))
+        assert list(registry) == ["Example"]
+        assert "Example" not in registry._classes
+        checker = registry["Example"](FastLimiter(), None)
+        assert checker.get_urls("alice") == ["https://example.org/alice"]
+        assert registry["Example"] is registry["Example"]
+    
+    def test_status_rules(self, tmp_path):
+        path = tmp_path / "sites.json"
+        path.write_text(json.dumps({
+            "Example": {
+                "url": "https://example.com/{username}",
+                "status": {"200": "found", "other": "not_found"},
+            }
+        }))
+        registry = PlatformRegistry({}, [path])
+        checker_class = registry["Example"]
+        assert checker_class.FOUND_STATUSES == (200,)
+        assert checker_class.NOT_FOUND_STATUSES == (404,)
+        checker = checker_class(FastLimiter(), None)
+        assert checker.detect_found(FakeResponse("https://example.com/alice"))
+        response = FakeResponse("https://example.com/alice", status_code=410)
+        assert checker.detect_not_found(response)
+    
+    def test_markers_need_a_200(self):
+        checker = GitHubChecker(FastLimiter(), None)
+        response = FakeResponse("https://github.com/alice", status_code=500, text='"login":')
+        assert not checker.detect_found(response)
+        response = FakeResponse("https://github.com/alice", text='"login":')
+        assert checker.detect_found(response)
+    
+    def test_malformed_rules_are_rejected(self):
+        with pytest.raises(ValueError):
+            validate_rule("Example", {"url": "https://example.com/{username}", "foud": ["x"]})
+        with pytest.raises(ValueError):
+            validate_rule("Example", {"found": ["x"]})
+        with pytest.raises(ValueError):
+            validate_rule("Example", {"url": "u", "status": {"200": "maybe"}})
+    
+    @pytest.mark.parametrize("rule", [
+        {"status": {"4xx": "not_found"}},
+        {"rate_group": "google"},
+        {"rate_scope": "global"},
+        {"found": "Profile of"},
+        {"not_found": ["Gone", 404]},
+        {"early_exit": "Gone"},
+        {"burst": "4"},
+        {"url": "https://example.com/{user}"},
+        {"url": "https://example.com/{username}/{0}"},
+        {"urls": ["https://example.com/{username}", "https://example.com/"]},
+    ])
+    def test_malformed_fields_are_rejected(self, rule, tmp_path):
+        path = tmp_path / "sites.json"
+        path.write_text(json.dumps({"Example": {"url": "https://example.com/{username}", **rule}}))
+        with pytest.raises(ValueError):
+            PlatformRegistry({}).add_rules(path)
+
+
+class TestRateScopes:
+    """Test which rate-limit budgets a request draws from."""
+    
+    def test_platform_scope(self):
+        checker = GitHubChecker(RateLimiter(), None)
+        assert checker.rate_keys("https://github.com/alice") == ["github"]
+    
+    def test_host_scope(self):
+        checker = MastodonChecker(RateLimiter(), None)
+        assert [checker.rate_keys(url)[0] for url in checker.get_urls("alice")] == [
+            "mastodon:mastodon.social",
+            "mastodon:hachyderm.io",
+            "mastodon:infosec.exchange",
+        ]
+    
+    def test_hosts_do_not_throttle_each_other(self):
+        """Test a 429 on one Mastodon server leaves the others alone."""
+        limiter = RateLimiter(min_delay=1.0)
+        checker = MastodonChecker(limiter, None)
+        limiter.record_request("mastodon:hachyderm.io", was_rate_limited=True)
+        assert limiter.acquire_all(checker.rate_keys("https://mastodon.social/@a")) == 0
+        assert limiter.acquire_all(checker.rate_keys("https://infosec.exchange/@a")) == 0
+    
+    def test_both_scope_aggregates(self):
+        """Test Facebook hosts have their own budgets under a shared one."""
+        limiter = RateLimiter(min_delay=1.0)
+        checker = FacebookChecker(limiter, None)
+        graph = checker.rate_keys("https://graph.facebook.com/alice/picture")
+        assert graph == ["facebook:graph.facebook.com", "facebook", "group:meta"]
+        assert limiter.acquire_all(graph) == 0
+        # www has a fresh host bucket but shares the platform budget
+        www = checker.rate_keys("https://www.facebook.com/alice")
+        assert limiter.acquire_all(www) == pytest.approx(1.0, abs=0.05)
+    
+    def test_group_shares_budget(self):
+        """Test Meta platforms draw from one group budget."""
+        limiter = RateLimiter(min_delay=0.1)
+        instagram = InstagramChecker(limiter, None)
+        threads = ThreadsChecker(limiter, None)
+        assert instagram.rate_keys("https://www.instagram.com/a/") == ["instagram", "group:meta"]
+        # The group allows a burst of 2 at 1 request per second
+        assert limiter.acquire_all(instagram.rate_keys("https://www.instagram.com/a/")) == 0
+        assert limiter.acquire_all(threads.rate_keys("https://www.threads.net/@a")) == 0
+        wait = limiter.acquire_all(threads.rate_keys("https://www.threads.net/@b"))
+        assert wait == pytest.approx(1.0, abs=0.05)
+    
+    def test_block_spills_over_to_group(self):
+        """Test a 429 on Instagram holds back Threads."""
+        limiter = RateLimiter()
+        instagram = InstagramChecker(limiter, None)
+        threads = ThreadsChecker(limiter, None)
+        instagram.record_response(
+            "https://www.instagram.com/a/", FakeResponse("", status_code=429), was_rate_limited=True
+        )
+        assert limiter.acquire_all(
+            threads.rate_keys("https://www.threads.net/@a"), max_wait=10
+        ) is None
+
+
+class FacebookSession:
+    """Graph API knows nobody; the direct page exists only for `johndoe`."""
+    
+    def __init__(self):
+        self.headers = {"User-Agent": "shared"}
+        self.requests = []
+        self.status = None  # Status forced on every response, if any
+    
+    def get(self, url, **kwargs):
+        self.requests.append(url)
+        if self.status is not None:
+            return FakeResponse(url, status_code=self.status)
+        if "graph.facebook.com" in url:
+            return FakeResponse(url, status_code=404)
+        if url.endswith("/johndoe"):
+            return FakeResponse(url, text='<title>x</title> "userID":"1" facebook.com/johndoe')
+        return FakeResponse(url, text="This page isn't available")
+
+
+class TestFacebookChecker:
+    """Test the Facebook probe pipeline."""
+    
+    def test_cleaned_name_is_memoized(self):
+        """Test john.doe and johndoe share the cleaned-name probes."""
+        session = FacebookSession()
+        checker = FacebookChecker(FastLimiter(), FakeSessionManager(session))
+        
+        assert checker.check("john.doe") == CheckResult.FOUND
+        first = len(session.requests)
+        assert checker.check("johndoe") == CheckResult.FOUND
+        assert len(session.requests) == first
+    
+    def test_not_found(self):
+        """Test all four probes miss."""
+        session = FacebookSession()
+        checker = FacebookChecker(FastLimiter(), FakeSessionManager(session))
+        assert checker.check("jane.roe") == CheckResult.NOT_FOUND
+        assert len(session.requests) == 4
+    
+    def test_rate_limits_are_not_memoized(self):
+        """Test 429s surface as RATE_LIMITED and are retried once lifted."""
+        session = FacebookSession()
+        limiter = FastLimiter()
+        checker = FacebookChecker(limiter, FakeSessionManager(session))
+        session.status = 429
+        assert checker.check("johndoe") == CheckResult.RATE_LIMITED
+        assert limiter.is_backing_off("facebook")
+        
+        session.status = None
+        sent = len(session.requests)
+        assert checker.check("johndoe") == CheckResult.FOUND
+        assert len(session.requests) > sent
+    
+    def test_server_errors_are_not_memoized(self):
+        session = FacebookSession()
+        checker = FacebookChecker(FastLimiter(), FakeSessionManager(session))
+        session.status = 503
+        assert checker.check("johndoe") == CheckResult.NOT_FOUND
+        session.status = None
+        assert checker.check("johndoe") == CheckResult.FOUND
+    
+    def test_shared_headers_untouched(self):
+        """Test the Facebook UA is sent per request, not set on the session."""
+        session = FacebookSession()
+        FacebookChecker(FastLimiter(), FakeSessionManager(session)).check("johndoe")
+        assert session.headers == {"User-Agent": "shared"}